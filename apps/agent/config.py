@@ -29,6 +29,83 @@ class Settings(BaseSettings):
 
     # Multi-agent consensus evaluation
     use_consensus_evaluation: bool = Field(default=False, alias="USE_CONSENSUS_EVALUATION")
+    # "debate" (sequential strict/generous rounds) or "self_consistency" (parallel samples)
+    consensus_mode: str = Field(default="debate", alias="CONSENSUS_MODE")
+    consensus_samples: int = Field(default=4, alias="CONSENSUS_SAMPLES")
+    consensus_aggregation: str = Field(default="median", alias="CONSENSUS_AGGREGATION")
+    consensus_sample_temperature: float = Field(default=0.7, alias="CONSENSUS_SAMPLE_TEMPERATURE")
+
+    # Cascading evaluation: a fast deployment scores first, AZURE_OPENAI_DEPLOYMENT is only
+    # called when the fast result is low-confidence, near a decision boundary or mixed.
+    use_cascade_evaluation: bool = Field(default=False, alias="USE_CASCADE_EVALUATION")
+    azure_openai_fast_deployment: str | None = Field(default=None, alias="AZURE_OPENAI_FAST_DEPLOYMENT")
+    cascade_min_confidence: float = Field(default=0.7, alias="CASCADE_MIN_CONFIDENCE")
+    cascade_decision_boundaries: list[float] = Field(default=[2.5, 3.5], alias="CASCADE_DECISION_BOUNDARIES")
+    cascade_boundary_margin: float = Field(default=0.2, alias="CASCADE_BOUNDARY_MARGIN")
+    cascade_max_criteria_stdev: float = Field(default=1.25, alias="CASCADE_MAX_CRITERIA_STDEV")
+
+    # Top-k ranking: score uncertainty (+/-) assumed for each cheap stage before pruning.
+    # Heuristics, not guarantees: a cheap score further off than its margin can prune a top-k
+    # candidate, so pruning is opt-in and reported as approximate.
+    topk_heuristic_pruning: bool = Field(default=False, alias="TOPK_HEURISTIC_PRUNING")
+    topk_keyword_margin: float = Field(default=1.5, alias="TOPK_KEYWORD_MARGIN")
+    topk_fast_margin: float = Field(default=0.5, alias="TOPK_FAST_MARGIN")
+
+    # Rule-based pre-screen sanity check: flag LLM scores this far from a confident pre-screen
+    prescreen_divergence_threshold: float = Field(default=1.5, alias="PRESCREEN_DIVERGENCE_THRESHOLD")
+    prescreen_min_confidence: float = Field(default=0.3, alias="PRESCREEN_MIN_CONFIDENCE")
+
+    # Durable result outbox: results are committed locally and delivered to criteria_api in the background
+    use_result_outbox: bool = Field(default=False, alias="USE_RESULT_OUTBOX")
+    result_outbox_path: str = Field(default="result_outbox.db", alias="RESULT_OUTBOX_PATH")
+    result_outbox_batch_size: int = Field(default=20, alias="RESULT_OUTBOX_BATCH_SIZE")
+    result_outbox_poll_interval: float = Field(default=2.0, alias="RESULT_OUTBOX_POLL_INTERVAL")
+    result_outbox_max_backoff: float = Field(default=300.0, alias="RESULT_OUTBOX_MAX_BACKOFF")
+
+    # How long results stay replayable for a client-supplied idempotency key
+    idempotency_ttl_seconds: float = Field(default=600.0, alias="IDEMPOTENCY_TTL_SECONDS")
+
+    # LLM scheduler: total concurrent calls, weighted fair share and per-class caps by priority class
+    llm_max_concurrency: int = Field(default=8, alias="LLM_MAX_CONCURRENCY")
+    llm_priority_weights: dict[str, float] = Field(
+        default={"interactive": 8.0, "batch": 2.0, "background": 1.0}, alias="LLM_PRIORITY_WEIGHTS"
+    )
+    llm_priority_caps: dict[str, int] = Field(
+        default={"interactive": 8, "batch": 6, "background": 2}, alias="LLM_PRIORITY_CAPS"
+    )
+    # Adaptive (AIMD) total window between LLM_MIN_CONCURRENCY and LLM_MAX_CONCURRENCY: +1 per healthy
+    # window of calls, x decrease factor on 429s, timeouts or latency above spike factor x stage baseline
+    llm_adaptive_concurrency: bool = Field(default=True, alias="LLM_ADAPTIVE_CONCURRENCY")
+    llm_min_concurrency: int = Field(default=1, alias="LLM_MIN_CONCURRENCY")
+    llm_aimd_decrease_factor: float = Field(default=0.5, alias="LLM_AIMD_DECREASE_FACTOR")
+    llm_latency_spike_factor: float = Field(default=2.5, alias="LLM_LATENCY_SPIKE_FACTOR")
+    # Hedged requests: duplicate an idempotent call still running past its stage's latency percentile
+    # (optionally on AZURE_OPENAI_HEDGE_DEPLOYMENT), capped at a fraction of calls
+    llm_hedging_enabled: bool = Field(default=False, alias="LLM_HEDGING_ENABLED")
+    llm_hedge_percentile: float = Field(default=0.9, alias="LLM_HEDGE_PERCENTILE")
+    llm_hedge_max_ratio: float = Field(default=0.1, alias="LLM_HEDGE_MAX_RATIO")
+    llm_hedge_min_samples: int = Field(default=20, alias="LLM_HEDGE_MIN_SAMPLES")
+    azure_openai_hedge_deployment: str | None = Field(default=None, alias="AZURE_OPENAI_HEDGE_DEPLOYMENT")
+
+    # Admission control: in-flight work budget (candidates x criteria x LLM calls per candidate)
+    admission_budget: float = Field(default=600.0, alias="ADMISSION_BUDGET")
+    admission_max_queue_wait: float = Field(default=2.0, alias="ADMISSION_MAX_QUEUE_WAIT")
+    admission_default_criteria: int = Field(default=6, alias="ADMISSION_DEFAULT_CRITERIA")
+
+    # Circuit breakers for Azure Search and criteria_api: open past a failure rate within a sliding window,
+    # then allow one probe call after the cool-down
+    circuit_failure_rate: float = Field(default=0.5, alias="CIRCUIT_FAILURE_RATE")
+    circuit_window_seconds: float = Field(default=30.0, alias="CIRCUIT_WINDOW_SECONDS")
+    circuit_min_calls: int = Field(default=5, alias="CIRCUIT_MIN_CALLS")
+    circuit_open_seconds: float = Field(default=15.0, alias="CIRCUIT_OPEN_SECONDS")
+
+    # Default end-to-end budget per evaluation request (X-Request-Timeout header / deadline_seconds override it)
+    request_deadline_seconds: float = Field(default=180.0, alias="REQUEST_DEADLINE_SECONDS")
+
+    # Record/replay of upstream HTTP traffic (off, record, replay); replay latency is original or zero
+    cassette_mode: str = Field(default="off", alias="CASSETTE_MODE")
+    cassette_path: str = Field(default="cassettes", alias="CASSETTE_PATH")
+    cassette_replay_latency: str = Field(default="original", alias="CASSETTE_REPLAY_LATENCY")
 
     # Criteria API integration
     # Default to local criteria_api dev port; override in container with http://criteria_api:8000
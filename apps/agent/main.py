@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import get_settings
 from routes import invoke as invoke_route
 from routes import evaluation as evaluation_route
+from services.circuit_breaker import get_circuit_states
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,22 @@ app.include_router(invoke_route.router)
 app.include_router(evaluation_route.router)
 
 
+@app.on_event("startup")
+async def start_result_outbox() -> None:
+    if settings.use_result_outbox:
+        from services.result_outbox import get_result_outbox
+        get_result_outbox().start()
+
+
+@app.on_event("shutdown")
+async def stop_result_outbox() -> None:
+    if settings.use_result_outbox:
+        from services.result_outbox import get_result_outbox
+        await get_result_outbox().stop()
+
+
 @app.get("/healthz")
-async def health() -> dict[str, str]:
-    return {"status": "ok"}
+async def health() -> dict[str, Any]:
+    circuits = get_circuit_states()
+    degraded = any(circuit["state"] != "closed" for circuit in circuits.values())
+    return {"status": "degraded" if degraded else "ok", "circuits": circuits}
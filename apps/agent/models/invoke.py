@@ -30,6 +30,13 @@ class RankingStrategy(str, Enum):
     BALANCED = "balanced"                    # Best across all criteria
 
 
+class PriorityClass(str, Enum):
+    """Scheduling classes for LLM capacity."""
+    INTERACTIVE = "interactive"  # A user is waiting on a single evaluation
+    BATCH = "batch"              # Multi-candidate comparison
+    BACKGROUND = "background"    # Bulk re-evaluation, no one waiting
+
+
 class CandidateInput(BaseModel):
     """Input model for a single candidate in batch evaluation."""
     candidate_id: str = Field(..., description="Unique identifier for the candidate")
@@ -94,6 +101,10 @@ class EvaluationRequest(BaseModel):
     comparison_mode: ComparisonMode = Field(default=ComparisonMode.DETERMINISTIC, description="Comparison analysis method for multiple candidates")
     ranking_strategy: RankingStrategy = Field(default=RankingStrategy.OVERALL_SCORE, description="Strategy for ranking multiple candidates")
     max_chunks: int = Field(default=10, description="Maximum chunks to retrieve per candidate")
+    top_k: Optional[int] = Field(default=None, ge=1, description="Only the best k candidates are needed; candidates that cannot reach the top k are pruned before full evaluation")
+    priority: Optional[PriorityClass] = Field(default=None, description="Scheduling class for LLM calls (defaults to interactive for one candidate, batch otherwise)")
+    deadline_seconds: Optional[float] = Field(default=None, gt=0, description="End-to-end time budget in seconds (the X-Request-Timeout header takes precedence)")
+    idempotency_key: Optional[str] = Field(default=None, description="Client key for safe retries; a repeated key returns the original result (the Idempotency-Key header takes precedence)")
 
 
 # Removed BatchEvaluationRequest - now using unified EvaluationRequest for both single and batch scenarios
@@ -111,11 +122,21 @@ class EvaluationResult(BaseModel):
     agent_metadata: Dict[str, Optional[str]] = Field(default_factory=dict)
 
 
+class PrunedCandidate(BaseModel):
+    """Candidate skipped by top-k ranking before full evaluation."""
+    candidate_id: str = Field(description="Candidate identifier")
+    pruned: bool = Field(default=True, description="Always true; marks the candidate as not fully evaluated")
+    pruned_at_stage: str = Field(description="Cheap stage that pruned it: prescreen or fast")
+    score_lower: float = Field(description="Heuristic lower bound on the overall score at that stage")
+    score_upper: float = Field(description="Heuristic upper bound on the overall score at that stage")
+
+
 class BatchEvaluationResult(BaseModel):
     """Model for complete batch evaluation result."""
     rubric_name: str = Field(description="Rubric used for evaluation")
-    total_candidates: int = Field(description="Number of candidates evaluated")
+    total_candidates: int = Field(description="Number of candidates returned (fully evaluated plus pruned)")
     individual_results: List[EvaluationResult] = Field(description="Individual evaluation results")
+    pruned_candidates: List[PrunedCandidate] = Field(default_factory=list, description="Candidates pruned by top-k ranking, with the score bounds they were pruned on")
     comparison_summary: ComparisonSummary = Field(description="Cross-candidate comparison analysis")
     batch_metadata: Dict[str, Optional[str]] = Field(default_factory=dict, description="Batch processing metadata")
 
@@ -4,6 +4,7 @@ Prompt templates for document evaluation using LangChain.
 
 from .evaluation_prompts import (
     BATCH_EVALUATION_PROMPT,
+    DEBATE_REFINEMENT_PROMPT,
     SUMMARY_PROMPT,
     get_batch_evaluation_template,
     get_summary_template,
@@ -11,6 +12,7 @@ from .evaluation_prompts import (
 
 __all__ = [
     "BATCH_EVALUATION_PROMPT",
+    "DEBATE_REFINEMENT_PROMPT",
     "SUMMARY_PROMPT",
     "get_batch_evaluation_template",
     "get_summary_template",
@@ -56,6 +56,7 @@ INSTRUCTIONS:
 - Score: numeric according to the criterion's scoring_scale (float). Use the scoring_definition provided for each criterion
 - Reasoning: provide a concise, detailed explanation for the score. If evidence is missing, explicitly state that in the reasoning.
 - Evidence: Extract specific evidence from the document to support the reasoning. Evidence must be short, direct quotes or paraphrased excerpts, not general summaries. If no evidence, return an empty array.
+- Confidence: a float between 0.0 and 1.0 expressing how certain you are of the score given the available evidence.
 - Holistic view: consider interactions between criteria and how they affect one another. Summarize these interactions in the "overall_reasoning" field.
 - **Output must be valid JSON only. No extra text, no comments, and no trailing commas.**
 
@@ -66,7 +67,8 @@ OUTPUT JSON STRUCTURE:
       "criterion_name": "string",
       "score": float,
       "reasoning": "string",
-      "evidence": ["string1", "string2"]
+      "evidence": ["string1", "string2"],
+      "confidence": float
     }}
   ]
 }}
@@ -74,6 +76,41 @@ OUTPUT JSON STRUCTURE:
 """
 
 
+DEBATE_REFINEMENT_PROMPT = """
+{role_instructions}
+You are in a follow-up debate round. Both evaluators have already scored this document and agree on every
+criterion except the disputed ones listed below. Re-evaluate ONLY these disputed criteria, taking the other
+evaluator's position into account. Settled criteria are not shown and must not be re-scored.
+
+Rubric: {rubric_name}
+
+Disputed Criteria:
+{disputed_criteria}
+
+Document Content:
+{document_content}
+
+INSTRUCTIONS:
+- Produce exactly one evaluation object for each disputed criterion. Each evaluation.criterion_name must match the criterion name exactly.
+- Score: numeric according to the criterion's definition (float).
+- Reasoning: explain whether and why you changed your previous score.
+- Evidence: short, direct quotes or paraphrased excerpts from the document. If no evidence, return an empty array.
+- **Output must be valid JSON only. No extra text, no comments, and no trailing commas.**
+
+OUTPUT JSON STRUCTURE:
+{{
+  "evaluation": [
+    {{
+      "criterion_name": "string",
+      "score": float,
+      "reasoning": "string",
+      "evidence": ["string1", "string2"]
+    }}
+  ]
+}}
+"""
+
+
 SUMMARY_PROMPT = """
 You are an expert evaluator creating a comprehensive summary of a document evaluation.
 
@@ -2,8 +2,11 @@
 Routes for candidate evaluation endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
+import asyncio
+import logging
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from models.invoke import (
     EvaluationRequest,
@@ -13,23 +16,47 @@ from models.invoke import (
     RankingStrategy
 )
 from services.evaluation_service import EvaluationService, get_evaluation_service
+from services.request_coalescer import IdempotencyKeyReused, RequestCoalescer, get_request_coalescer
+from services.admission_controller import AdmissionController, AdmissionRejected, get_admission_controller
+from services.deadline import DeadlineExceeded, deadline_from_now
+from services.circuit_breaker import get_circuit_states
+from config import get_settings
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/evaluation", tags=["evaluation"])
 
+# Non-standard status (nginx convention) for "client closed request"
+CLIENT_CLOSED_REQUEST = 499
+DISCONNECT_POLL_SECONDS = 1.0
+
 
 @router.post("/evaluate", response_model=EvaluationResponse)
 async def evaluate_candidates(
     request: EvaluationRequest,
-    evaluation_service: EvaluationService = Depends(get_evaluation_service)
+    http_request: Request,
+    evaluation_service: EvaluationService = Depends(get_evaluation_service),
+    coalescer: RequestCoalescer = Depends(get_request_coalescer),
+    admission: AdmissionController = Depends(get_admission_controller),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+    request_timeout: Optional[float] = Header(default=None, gt=0, alias="X-Request-Timeout")
 ) -> EvaluationResponse:
     """Evaluate candidates against a specific rubric using IDs.
 
     Automatically handles single candidate or batch evaluation based on
-    the number of candidate_ids provided.
+    the number of candidate_ids provided. Identical concurrent requests share
+    one evaluation, and retries carrying the same idempotency key replay the
+    original result. The evaluation runs within the request deadline and is
+    cancelled if the client disconnects.
 
     Args:
         request: Evaluation request with rubric_id and candidate_id(s)
+        http_request: Raw request, watched for client disconnects
         evaluation_service: Injected evaluation service
+        coalescer: Injected request coalescer
+        admission: Injected admission controller (429 + Retry-After when over budget)
+        idempotency_key: Optional Idempotency-Key header
+        request_timeout: Optional X-Request-Timeout header (seconds) bounding the whole evaluation
 
     Returns:
         Evaluation results with scores, reasoning, and recommendations.
@@ -47,13 +74,33 @@ async def evaluate_candidates(
 
         # Call unified evaluation method
         # Use default settings for simple evaluation
-        result = await evaluation_service.evaluate(
-            rubric_id=request.rubric_id,
-            candidate_ids=request.candidate_ids,
-            comparison_mode=ComparisonMode.DETERMINISTIC,
-            ranking_strategy=RankingStrategy.OVERALL_SCORE,
-            max_chunks=5
+        comparison_mode = ComparisonMode.DETERMINISTIC
+        ranking_strategy = RankingStrategy.OVERALL_SCORE
+        max_chunks = 5
+        deadline = deadline_from_now(
+            request_timeout or request.deadline_seconds or get_settings().request_deadline_seconds
         )
+        result = await _until_disconnected(http_request, coalescer.run(
+            RequestCoalescer.make_key(
+                request.rubric_id, request.candidate_ids,
+                comparison_mode.value, ranking_strategy.value, max_chunks, request.top_k, request.priority
+            ),
+            lambda: _admitted(
+                admission, evaluation_service, request.rubric_id, request.candidate_ids,
+                lambda: evaluation_service.evaluate(
+                    rubric_id=request.rubric_id,
+                    candidate_ids=request.candidate_ids,
+                    comparison_mode=comparison_mode,
+                    ranking_strategy=ranking_strategy,
+                    max_chunks=max_chunks,
+                    top_k=request.top_k,
+                    priority=request.priority,
+                    deadline=deadline
+                )
+            ),
+            idempotency_key=idempotency_key or request.idempotency_key,
+            deadline=deadline
+        ))
 
         if "error" in result:
             return EvaluationResponse(
@@ -96,6 +143,14 @@ async def evaluate_candidates(
                 evaluation=evaluation_result
             )
 
+    except HTTPException:
+        raise
+    except IdempotencyKeyReused as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -103,6 +158,42 @@ async def evaluate_candidates(
         )
 
 
+async def _admitted(
+    admission: AdmissionController,
+    evaluation_service: EvaluationService,
+    rubric_id: str,
+    candidate_ids: list[str],
+    factory: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """Run an evaluation once the admission controller has budget for it."""
+    cost = admission.estimate_cost(
+        rubric_id, len(candidate_ids), evaluation_service.estimated_llm_calls_per_candidate()
+    )
+    async with admission.admit(cost):
+        return await factory()
+
+
+async def _until_disconnected(http_request: Request, awaitable: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Await an evaluation, cancelling it if the client goes away first.
+
+    Raises:
+        HTTPException: 499 when the client disconnected before the result was ready
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                logger.info("Client disconnected; cancelling evaluation")
+                task.cancel()
+                raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request")
+    finally:
+        if not task.done():
+            task.cancel()
+
+
 @router.get("/rubrics", response_model=RubricsListResponse)
 async def list_rubrics(
     evaluation_service: EvaluationService = Depends(get_evaluation_service)
@@ -180,26 +271,52 @@ class SimpleEvaluationRequest(BaseModel):
 @router.post("/simple")
 async def simple_evaluate(
     request: SimpleEvaluationRequest,
-    evaluation_service: EvaluationService = Depends(get_evaluation_service)
+    http_request: Request,
+    evaluation_service: EvaluationService = Depends(get_evaluation_service),
+    coalescer: RequestCoalescer = Depends(get_request_coalescer),
+    admission: AdmissionController = Depends(get_admission_controller),
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+    request_timeout: Optional[float] = Header(default=None, gt=0, alias="X-Request-Timeout")
 ) -> Dict[str, str]:
     """Simple evaluation endpoint - just returns evaluation ID.
 
     Args:
         request: Simple evaluation request with rubric_id and candidate_ids
+        http_request: Raw request, watched for client disconnects
         evaluation_service: Injected evaluation service
+        coalescer: Injected request coalescer
+        admission: Injected admission controller (429 + Retry-After when over budget)
+        idempotency_key: Optional Idempotency-Key header
+        request_timeout: Optional X-Request-Timeout header (seconds) bounding the whole evaluation
 
     Returns:
         Dictionary with evaluation_id on success or error on failure
     """
     try:
         # Use default settings for simple evaluation
-        result = await evaluation_service.evaluate(
-            rubric_id=request.rubric_id,
-            candidate_ids=request.candidate_ids,
-            comparison_mode=ComparisonMode.DETERMINISTIC,
-            ranking_strategy=RankingStrategy.OVERALL_SCORE,
-            max_chunks=5
-        )
+        comparison_mode = ComparisonMode.DETERMINISTIC
+        ranking_strategy = RankingStrategy.OVERALL_SCORE
+        max_chunks = 5
+        deadline = deadline_from_now(request_timeout or get_settings().request_deadline_seconds)
+        result = await _until_disconnected(http_request, coalescer.run(
+            RequestCoalescer.make_key(
+                request.rubric_id, request.candidate_ids,
+                comparison_mode.value, ranking_strategy.value, max_chunks, None, None
+            ),
+            lambda: _admitted(
+                admission, evaluation_service, request.rubric_id, request.candidate_ids,
+                lambda: evaluation_service.evaluate(
+                    rubric_id=request.rubric_id,
+                    candidate_ids=request.candidate_ids,
+                    comparison_mode=comparison_mode,
+                    ranking_strategy=ranking_strategy,
+                    max_chunks=max_chunks,
+                    deadline=deadline
+                )
+            ),
+            idempotency_key=idempotency_key,
+            deadline=deadline
+        ))
 
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -211,19 +328,78 @@ async def simple_evaluate(
 
     except HTTPException:
         raise
+    except IdempotencyKeyReused as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Evaluation failed: {str(e)}")
 
 
 @router.get("/health")
-async def evaluation_health() -> Dict[str, str]:
-    """Health check for evaluation service."""
+async def evaluation_health(
+    admission: AdmissionController = Depends(get_admission_controller)
+) -> Dict[str, Any]:
+    """Health check for evaluation service, including admission load and upstream circuit breakers."""
+    load = admission.get_load()
+    circuits = get_circuit_states()
+    if load["in_flight_cost"] >= load["budget"]:
+        status = "saturated"
+    elif any(circuit["state"] != "closed" for circuit in circuits.values()):
+        status = "degraded"
+    else:
+        status = "healthy"
     return {
-        "status": "healthy",
-        "service": "evaluation"
+        "status": status,
+        "service": "evaluation",
+        "load": load,
+        "circuits": circuits
     }
 
 
+@router.get("/scheduler")
+async def get_scheduler_stats() -> Dict[str, Any]:
+    """LLM scheduler queue depth, running calls and wait times per priority class."""
+    from services.llm_scheduler import get_llm_scheduler
+    return get_llm_scheduler().get_stats()
+
+
+@router.get("/metrics")
+async def get_metrics() -> Dict[str, Any]:
+    """Flat gauges and counters for dashboards and alerting."""
+    from services.llm_scheduler import get_llm_scheduler
+    scheduler = get_llm_scheduler()
+    metrics: Dict[str, Any] = {
+        "llm_concurrency_limit": scheduler.concurrency_limit,
+        "llm_running": scheduler.total_running,
+    }
+    if scheduler.limiter:
+        adaptive = scheduler.limiter.get_stats()
+        metrics["llm_window_increases_total"] = adaptive["increases"]
+        metrics["llm_window_decreases_total"] = adaptive["decreases"]
+        for reason, count in adaptive["overload_events"].items():
+            metrics[f"llm_overload_{reason}_total"] = count
+
+    from services.llm_hedging import get_llm_hedger
+    hedger = get_llm_hedger()
+    if hedger is not None:
+        hedging = hedger.get_stats()
+        metrics["llm_hedgeable_calls_total"] = hedging["calls"]
+        metrics["llm_hedges_total"] = hedging["hedges"]
+        metrics["llm_hedge_wins_total"] = hedging["hedge_wins"]
+        metrics["llm_hedge_rate"] = hedging["hedge_rate"]
+        metrics["llm_hedge_win_rate"] = hedging["win_rate"]
+
+    if get_settings().use_result_outbox:
+        from services.result_outbox import get_result_outbox
+        outbox = get_result_outbox()
+        metrics["result_outbox_pending"] = await asyncio.to_thread(outbox.pending_count)
+        metrics["result_outbox_dead_letters"] = await asyncio.to_thread(outbox.dead_letter_count)
+    return metrics
+
+
 @router.get("/evaluation-mode")
 async def get_evaluation_mode() -> Dict[str, Any]:
     """Get current evaluation configuration."""
@@ -237,8 +413,21 @@ async def get_evaluation_mode() -> Dict[str, Any]:
             "enabled": settings.use_consensus_evaluation,
             "agent_a": "Strict Evaluator (Conservative, Evidence-Based)",
             "agent_b": "Generous Evaluator (Optimistic, Potential-Focused)",
-            "process": "Debate-Style with Iterative Refinement"
-        } if settings.use_consensus_evaluation else None
+            "process": (
+                f"Self-Consistency Sampling ({settings.consensus_samples} samples, {settings.consensus_aggregation})"
+                if settings.consensus_mode == "self_consistency"
+                else "Debate-Style with Iterative Refinement"
+            )
+        } if settings.use_consensus_evaluation else None,
+        "cascade_details": {
+            "enabled": settings.use_cascade_evaluation,
+            "fast_deployment": settings.azure_openai_fast_deployment,
+            "strong_deployment": settings.azure_openai_deployment,
+            "min_confidence": settings.cascade_min_confidence,
+            "decision_boundaries": settings.cascade_decision_boundaries,
+            "boundary_margin": settings.cascade_boundary_margin,
+            "max_criteria_stdev": settings.cascade_max_criteria_stdev
+        } if settings.use_cascade_evaluation else None
     }
 
 
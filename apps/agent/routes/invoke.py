@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends
 
 from models.invoke import InvokeRequest, InvokeResponse
 from services.search_service import get_search_service, AzureSearchService
+from services.circuit_breaker import CircuitOpenError
 from services.chain_service import get_chain_service, ChainService
 from config import get_settings
 
@@ -20,7 +21,11 @@ async def invoke(
     settings = get_settings()
     # ChainService sets llm None if stubbed
     stub = chain.llm is None
-    results = await search.search(req.prompt, top=1)
+    try:
+        results = await search.search(req.prompt, top=1)
+    except CircuitOpenError:
+        # Search is down: answer without the snippet rather than failing the call
+        results = []
     if results:
         first = results[0]
         snippet = first.get("content")
@@ -0,0 +1,131 @@
+"""
+Adaptive (AIMD) concurrency window for LLM calls.
+
+Works like TCP congestion control: while calls complete with healthy latency
+the window grows by one slot per window's worth of completions (additive
+increase); a 429, a timeout or a latency spike shrinks it by a constant factor
+(multiplicative decrease). The LLM scheduler uses the window as its total
+concurrency limit, so throughput follows what the shared deployment can take
+at the moment instead of a static number.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Calls averaged into a stage's latency baseline before spikes are judged against it
+BASELINE_WARMUP_CALLS = 5
+# EWMA weight of a healthy call, and the much smaller weight of a spike: spikes still move the
+# baseline so a lasting latency shift is eventually accepted instead of pinning the window at min
+BASELINE_ALPHA = 0.1
+SPIKE_BASELINE_ALPHA = 0.02
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether an LLM call failure signals deployment overload (429 or timeout)."""
+    if isinstance(error, asyncio.CancelledError):
+        return False
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    name = type(error).__name__
+    return name in ("RateLimitError", "APITimeoutError", "ReadTimeout", "ConnectTimeout")
+
+
+class AIMDLimiter:
+    """Additive-increase / multiplicative-decrease concurrency window."""
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 2.0
+    ):
+        """Initialize limiter.
+
+        Args:
+            min_limit: Window never shrinks below this
+            max_limit: Window never grows above this
+            initial_limit: Starting window (defaults to ``max_limit``)
+            decrease_factor: Multiplier applied to the window on overload
+            latency_spike_factor: A call slower than this multiple of its stage baseline counts as overload
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_spike_factor = latency_spike_factor
+        self._window = float(min(self.max_limit, max(self.min_limit, initial_limit or self.max_limit)))
+
+        # Per-stage latency baseline (mean of the warm-up calls, then an EWMA) and calls seen per stage
+        self._baselines: Dict[str, float] = {}
+        self._samples: Dict[str, int] = {}
+        # Ignore further overload signals until calls started after the last cut complete
+        self._last_decrease_at = 0.0
+
+        self.increases = 0
+        self.decreases = 0
+        self.overload_events = {"rate_limited": 0, "timeout": 0, "latency_spike": 0}
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency window."""
+        return int(self._window)
+
+    def _decrease(self, reason: str, started_at: float) -> None:
+        self.overload_events[reason] += 1
+        if started_at < self._last_decrease_at or self._window <= self.min_limit:
+            # Call was already in flight when the window was cut (one cut per round trip), or nothing to cut
+            return
+        previous = self.limit
+        self._window = max(float(self.min_limit), self._window * self.decrease_factor)
+        self._last_decrease_at = time.monotonic()
+        self.decreases += 1
+        logger.warning(f"LLM concurrency window {previous} -> {self.limit} ({reason})")
+
+    def on_success(self, stage: str, started_at: float, latency: float) -> None:
+        """Record a completed call; grows the window or cuts it on a latency spike."""
+        baseline = self._baselines.get(stage)
+        samples = self._samples.get(stage, 0) + 1
+        self._samples[stage] = samples
+        if baseline is None or samples <= BASELINE_WARMUP_CALLS:
+            # Seed from the running mean of the first calls rather than a single one
+            self._baselines[stage] = latency if baseline is None else baseline + (latency - baseline) / samples
+        elif latency > baseline * self.latency_spike_factor:
+            self._baselines[stage] = baseline + SPIKE_BASELINE_ALPHA * (latency - baseline)
+            self._decrease("latency_spike", started_at)
+            return
+        else:
+            self._baselines[stage] = baseline + BASELINE_ALPHA * (latency - baseline)
+
+        if self._window < self.max_limit:
+            previous = self.limit
+            self._window = min(float(self.max_limit), self._window + 1.0 / self._window)
+            if self.limit > previous:
+                self.increases += 1
+
+    def on_failure(self, stage: str, started_at: float, error: BaseException) -> None:
+        """Record a failed call; overload errors cut the window."""
+        if not is_overload_error(error):
+            return
+        timed_out = isinstance(error, (asyncio.TimeoutError, TimeoutError)) or "Timeout" in type(error).__name__
+        reason = "timeout" if timed_out else "rate_limited"
+        self._decrease(reason, started_at)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Window, bounds and overload counters."""
+        return {
+            "window": self.limit,
+            "min": self.min_limit,
+            "max": self.max_limit,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "overload_events": dict(self.overload_events),
+            "latency_baseline_ms": {stage: round(v * 1000, 1) for stage, v in self._baselines.items()},
+        }
@@ -0,0 +1,139 @@
+"""
+Admission control for evaluation requests.
+
+Each request is priced by its estimated work (candidates x criteria x LLM calls
+per candidate for the evaluation mode). Requests are admitted while the
+in-flight total stays within a budget. Past it they wait briefly for capacity
+and are then rejected, so the route can answer 429 with a Retry-After hint
+instead of letting every request slow down together.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted within the queue wait."""
+
+    def __init__(self, retry_after: int, cost: float):
+        super().__init__(f"Evaluation capacity exhausted; retry after {retry_after}s")
+        self.retry_after = retry_after
+        self.cost = cost
+
+
+class AdmissionController:
+    """Global in-flight work budget for evaluation requests."""
+
+    def __init__(self, budget: float, max_queue_wait: float, default_criteria: int = 6):
+        """Initialize admission controller.
+
+        Args:
+            budget: Maximum total estimated work in flight
+            max_queue_wait: Seconds a request may wait for capacity before rejection
+            default_criteria: Criteria count assumed for rubrics not seen yet
+        """
+        self.budget = budget
+        self.max_queue_wait = max_queue_wait
+        self.default_criteria = default_criteria
+        self.in_flight_cost = 0.0
+        self.in_flight_requests = 0
+        self.queued = 0
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self._criteria_counts: Dict[str, int] = {}
+        self._seconds_per_unit = 0.0  # EWMA of request duration per unit of work
+        self._capacity = asyncio.Condition()
+
+    def record_rubric_size(self, rubric_id: str, criteria_count: int) -> None:
+        """Remember a rubric's criteria count for future cost estimates."""
+        self._criteria_counts[rubric_id] = criteria_count
+
+    def estimate_cost(self, rubric_id: str, candidate_count: int, llm_calls_per_candidate: float) -> float:
+        """Estimated work units: candidates x criteria x LLM calls per candidate."""
+        criteria = self._criteria_counts.get(rubric_id, self.default_criteria)
+        return float(candidate_count * max(1, criteria) * llm_calls_per_candidate)
+
+    def _fits(self, cost: float) -> bool:
+        # An oversize request still runs when nothing else is in flight
+        return self.in_flight_cost + cost <= self.budget or self.in_flight_requests == 0
+
+    def _retry_after(self, cost: float) -> int:
+        excess = self.in_flight_cost + cost - self.budget
+        seconds_per_unit = self._seconds_per_unit or 0.05
+        return max(1, math.ceil(excess * seconds_per_unit))
+
+    @asynccontextmanager
+    async def admit(self, cost: float) -> AsyncIterator[None]:
+        """Hold ``cost`` units of the budget for the duration of the block.
+
+        Raises:
+            AdmissionRejected: If capacity does not free up within the queue wait
+        """
+        async with self._capacity:
+            if not self._fits(cost):
+                self.queued += 1
+                try:
+                    await asyncio.wait_for(
+                        self._capacity.wait_for(lambda: self._fits(cost)),
+                        timeout=self.max_queue_wait
+                    )
+                except asyncio.TimeoutError:
+                    self.rejected_total += 1
+                    retry_after = self._retry_after(cost)
+                    logger.warning(
+                        f"Rejecting evaluation (cost {cost:.0f}, in flight {self.in_flight_cost:.0f}/"
+                        f"{self.budget:.0f}); retry after {retry_after}s"
+                    )
+                    raise AdmissionRejected(retry_after, cost)
+                finally:
+                    self.queued -= 1
+            self.in_flight_cost += cost
+            self.in_flight_requests += 1
+            self.admitted_total += 1
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            if cost > 0:
+                sample = elapsed / cost
+                self._seconds_per_unit = sample if not self._seconds_per_unit else (
+                    0.8 * self._seconds_per_unit + 0.2 * sample
+                )
+            async with self._capacity:
+                self.in_flight_cost -= cost
+                self.in_flight_requests -= 1
+                self._capacity.notify_all()
+
+    def get_load(self) -> Dict[str, Any]:
+        """Current load for health reporting."""
+        return {
+            "in_flight_requests": self.in_flight_requests,
+            "in_flight_cost": round(self.in_flight_cost, 1),
+            "budget": self.budget,
+            "utilization": round(self.in_flight_cost / self.budget, 3) if self.budget else 0.0,
+            "queued": self.queued,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_admission_controller() -> AdmissionController:
+    """Get singleton admission controller instance."""
+    settings = get_settings()
+    return AdmissionController(
+        budget=settings.admission_budget,
+        max_queue_wait=settings.admission_max_queue_wait,
+        default_criteria=settings.admission_default_criteria
+    )
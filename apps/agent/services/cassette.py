@@ -0,0 +1,273 @@
+"""
+Record/replay of upstream traffic for reproducing evaluations.
+
+With ``CASSETTE_MODE=record`` every HTTP exchange an evaluation makes — LLM
+prompts and completions, Azure Search queries, criteria_api reads and writes —
+is captured into one gzipped JSON cassette per evaluation in ``CASSETTE_PATH``.
+With ``CASSETTE_MODE=replay`` those exchanges are served back from the
+cassettes instead of the network, after the originally recorded latency or
+none at all (``CASSETTE_REPLAY_LATENCY``), so a slow or odd evaluation can be
+re-run exactly and CPU-side profiling becomes deterministic.
+
+Capture happens at the httpx transport level: clients for upstream calls come
+from ``upstream_client()`` and the LLM gets ``cassette_http_client()``.
+"""
+
+import asyncio
+import contextvars
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+# Response headers worth keeping; bodies are stored decoded, so encoding and length are dropped
+KEPT_RESPONSE_HEADERS = ("content-type", "retry-after")
+
+_recording: contextvars.ContextVar[Optional[List[Dict[str, Any]]]] = contextvars.ContextVar(
+    "cassette_recording", default=None
+)
+
+
+class CassetteMiss(httpx.TransportError):
+    """Raised in replay mode for a request no cassette has a response for."""
+
+
+def _route(url: httpx.URL) -> str:
+    """Host-independent request target, so cassettes replay against any endpoint."""
+    parts = urlsplit(str(url))
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+def _decode(content: bytes) -> Any:
+    """JSON bodies are stored parsed (compact and readable), anything else as text."""
+    if not content:
+        return None
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content.decode("utf-8", errors="replace")
+
+
+def _encode(body: Any) -> bytes:
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    return json.dumps(body).encode("utf-8")
+
+
+def _body_hash(body: Any) -> str:
+    canonical = body if isinstance(body, str) else json.dumps(body, sort_keys=True)
+    return hashlib.sha256(str(canonical).encode("utf-8")).hexdigest()[:16]
+
+
+def _exact_key(method: str, route: str, body: Any) -> Tuple[str, str, str]:
+    return method, route, _body_hash(body)
+
+
+def start_recording() -> None:
+    """Start capturing exchanges for the current evaluation (record mode only)."""
+    if get_settings().cassette_mode == "record":
+        _recording.set([])
+
+
+def finish_recording(rubric_id: str, candidate_ids: List[str], outcome: Dict[str, Any]) -> Optional[Path]:
+    """Write the current evaluation's exchanges to a cassette file.
+
+    Args:
+        rubric_id: Rubric the evaluation used
+        candidate_ids: Candidates evaluated
+        outcome: What ``evaluate`` returned (its evaluation ID names the file)
+
+    Returns:
+        Path of the written cassette, or None when not recording
+    """
+    exchanges = _recording.get()
+    if exchanges is None:
+        return None
+    _recording.set(None)
+
+    settings = get_settings()
+    directory = Path(settings.cassette_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = outcome.get("evaluation_id") or uuid.uuid4().hex[:12]
+    path = directory / f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{name}.json.gz"
+    cassette = {
+        "version": CASSETTE_VERSION,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "evaluation": {
+            "rubric_id": rubric_id,
+            "candidate_ids": candidate_ids,
+            "consensus": settings.use_consensus_evaluation,
+            "status": outcome.get("status") or ("error" if outcome.get("error") else "unsaved"),
+        },
+        # Settings that appear in request paths; replay must use the same ones to match
+        "settings": {
+            "AZURE_OPENAI_DEPLOYMENT": settings.azure_openai_deployment,
+            "AZURE_OPENAI_FAST_DEPLOYMENT": settings.azure_openai_fast_deployment,
+            "AZURE_OPENAI_HEDGE_DEPLOYMENT": settings.azure_openai_hedge_deployment,
+            "AZURE_OPENAI_API_VERSION": settings.azure_openai_api_version,
+            "AZURE_SEARCH_INDEX": settings.azure_search_index,
+        },
+        "exchanges": exchanges,
+    }
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(cassette, f, separators=(",", ":"))
+    logger.info(f"Recorded {len(exchanges)} upstream exchanges to {path}")
+    return path
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forwards requests to the network and captures each exchange into the current recording."""
+
+    def __init__(self):
+        self._inner = httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        content = await request.aread()
+        started = time.perf_counter()
+        response = await self._inner.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() in KEPT_RESPONSE_HEADERS}
+        exchanges = _recording.get()
+        if exchanges is not None:
+            exchanges.append({
+                "method": request.method,
+                "route": _route(request.url),
+                "request": _decode(content),
+                "status": response.status_code,
+                "headers": headers,
+                "response": _decode(body),
+                "elapsed_ms": elapsed_ms,
+            })
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        # Shared by every upstream client for the life of the process; closing one client must not close it
+        pass
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers requests from recorded exchanges without touching the network.
+
+    A request is matched on method, route and body; requests whose bodies vary
+    between runs (client-generated IDs, timings in saved metadata) fall back to
+    method and route. Matches are consumed in recorded order; once they run out
+    the last one is reused, which covers retries, hedges and cache misses that
+    did not happen while recording.
+    """
+
+    def __init__(self, cassettes: List[Dict[str, Any]], original_latency: bool = True):
+        self.original_latency = original_latency
+        self._exchanges: List[Dict[str, Any]] = []
+        self._exact: Dict[Tuple[str, str, str], Deque[int]] = defaultdict(deque)
+        self._by_route: Dict[Tuple[str, str], Deque[int]] = defaultdict(deque)
+        self._last_exact: Dict[Tuple[str, str, str], int] = {}
+        self._last_route: Dict[Tuple[str, str], int] = {}
+        self._used: set = set()
+        self.misses = 0
+        for cassette in cassettes:
+            for exchange in cassette.get("exchanges", []):
+                index = len(self._exchanges)
+                self._exchanges.append(exchange)
+                self._exact[_exact_key(exchange["method"], exchange["route"], exchange.get("request"))].append(index)
+                self._by_route[(exchange["method"], exchange["route"])].append(index)
+
+    @staticmethod
+    def _take(queue: Deque[int], used: set) -> Optional[int]:
+        while queue:
+            index = queue.popleft()
+            if index not in used:
+                return index
+        return None
+
+    def _match(self, method: str, route: str, body: Any) -> Optional[Dict[str, Any]]:
+        exact = _exact_key(method, route, body)
+        index = self._take(self._exact.get(exact, deque()), self._used)
+        if index is None:
+            index = self._last_exact.get(exact)
+        if index is None:
+            index = self._take(self._by_route.get((method, route), deque()), self._used)
+        if index is None:
+            index = self._last_route.get((method, route))
+        if index is None:
+            return None
+        self._used.add(index)
+        exchange = self._exchanges[index]
+        self._last_exact[exact] = index
+        self._last_route[(method, route)] = index
+        return exchange
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        route = _route(request.url)
+        exchange = self._match(request.method, route, _decode(await request.aread()))
+        if exchange is None:
+            self.misses += 1
+            raise CassetteMiss(f"No recorded response for {request.method} {route}", request=request)
+        if self.original_latency and exchange.get("elapsed_ms"):
+            await asyncio.sleep(exchange["elapsed_ms"] / 1000)
+        return httpx.Response(
+            exchange["status"], headers=exchange.get("headers") or {},
+            content=_encode(exchange.get("response")), request=request,
+        )
+
+
+def load_cassettes(path: str) -> List[Dict[str, Any]]:
+    """Load one cassette file, or every ``*.json.gz`` cassette in a directory."""
+    target = Path(path)
+    files = sorted(target.glob("*.json.gz")) if target.is_dir() else [target]
+    cassettes = []
+    for file in files:
+        with gzip.open(file, "rt", encoding="utf-8") as f:
+            cassettes.append(json.load(f))
+    return cassettes
+
+
+@lru_cache(maxsize=1)
+def get_cassette_transport() -> Optional[httpx.AsyncBaseTransport]:
+    """Shared transport for the configured cassette mode (None when off)."""
+    settings = get_settings()
+    mode = settings.cassette_mode
+    if mode == "record":
+        logger.info(f"Recording upstream traffic to {settings.cassette_path}")
+        return RecordingTransport()
+    if mode == "replay":
+        if not os.path.exists(settings.cassette_path):
+            raise FileNotFoundError(f"Cassette path '{settings.cassette_path}' does not exist")
+        cassettes = load_cassettes(settings.cassette_path)
+        logger.info(f"Replaying {len(cassettes)} cassette(s) from {settings.cassette_path} "
+                    f"with {settings.cassette_replay_latency} latency")
+        return ReplayTransport(cassettes, original_latency=settings.cassette_replay_latency == "original")
+    return None
+
+
+def upstream_client(timeout: float) -> httpx.AsyncClient:
+    """HTTP client for an upstream call, routed through the cassette transport when enabled."""
+    return httpx.AsyncClient(timeout=timeout, transport=get_cassette_transport())
+
+
+def cassette_http_client() -> Optional[httpx.AsyncClient]:
+    """Long-lived client for the LLM SDK (None, meaning the SDK default, when cassettes are off)."""
+    transport = get_cassette_transport()
+    return httpx.AsyncClient(timeout=120, transport=transport) if transport is not None else None
@@ -0,0 +1,193 @@
+"""
+Circuit breakers for upstream dependencies (Azure Search, criteria_api).
+
+A breaker watches the failure rate of recent calls to one upstream. Past the
+threshold it opens: calls fail immediately with ``CircuitOpenError`` so callers
+can fall back (full-document context, cached rubric) instead of each waiting
+out a timeout. After a cool-down it lets a probe call through (half-open); a
+successful probe closes it again, a failed one re-opens it.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, Tuple
+
+import httpx
+
+from config import get_settings
+from services.deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+UPSTREAMS = ("azure_search", "criteria_api")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """Whether an error reflects upstream health (5xx, 429, network) rather than the request itself."""
+    if isinstance(error, (DeadlineExceeded, asyncio.CancelledError)):
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return True
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker with closed, open and half-open states."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_seconds: float = 30.0,
+        min_calls: int = 5,
+        open_seconds: float = 15.0
+    ):
+        """Initialize breaker.
+
+        Args:
+            name: Upstream name (for logs and health output)
+            failure_rate_threshold: Failure fraction within the window that opens the breaker
+            window_seconds: Sliding window over which the failure rate is measured
+            min_calls: Calls needed in the window before the rate is acted on
+            open_seconds: Cool-down before a half-open probe is allowed
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self._calls: Deque[Tuple[float, bool]] = deque()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def _prune(self, now: float) -> None:
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+        self.times_opened += 1
+
+    def before_call(self) -> None:
+        """Check the breaker before calling the upstream.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a probe already in flight
+        """
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.name, max(0.0, self.open_seconds - (time.monotonic() - self._opened_at)))
+
+    def record_success(self) -> None:
+        """Record a successful upstream call."""
+        if self.state == HALF_OPEN:
+            logger.info(f"Circuit '{self.name}' closed after successful probe")
+            self._state = CLOSED
+            self._probe_in_flight = False
+        now = time.monotonic()
+        self._calls.append((now, True))
+        self._prune(now)
+
+    def record_failure(self) -> None:
+        """Record a failed upstream call; may open the breaker."""
+        if self.state == HALF_OPEN:
+            logger.warning(f"Circuit '{self.name}' re-opened after failed probe")
+            self._open()
+            return
+        now = time.monotonic()
+        self._calls.append((now, False))
+        self._prune(now)
+        failures = sum(1 for _, ok in self._calls if not ok)
+        if len(self._calls) >= self.min_calls and failures / len(self._calls) >= self.failure_rate_threshold:
+            logger.warning(
+                f"Circuit '{self.name}' opened: {failures}/{len(self._calls)} calls failed "
+                f"in the last {self.window_seconds:.0f}s"
+            )
+            self._open()
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Wrap one upstream call: reject fast when open and record the outcome.
+
+        Raises:
+            CircuitOpenError: If the breaker does not allow the call
+        """
+        self.before_call()
+        try:
+            yield
+        except BaseException as e:
+            if is_upstream_failure(e):
+                self.record_failure()
+            else:
+                self._probe_in_flight = False
+            raise
+        else:
+            self.record_success()
+
+    def get_state(self) -> Dict[str, Any]:
+        """State and counters for health reporting."""
+        state = self.state
+        now = time.monotonic()
+        self._prune(now)
+        failures = sum(1 for _, ok in self._calls if not ok)
+        return {
+            "state": state,
+            "window_calls": len(self._calls),
+            "window_failure_rate": round(failures / len(self._calls), 3) if self._calls else 0.0,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_in_seconds": round(max(0.0, self.open_seconds - (now - self._opened_at)), 1) if state == OPEN else 0.0,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the shared breaker for an upstream."""
+    settings = get_settings()
+    return CircuitBreaker(
+        name,
+        failure_rate_threshold=settings.circuit_failure_rate,
+        window_seconds=settings.circuit_window_seconds,
+        min_calls=settings.circuit_min_calls,
+        open_seconds=settings.circuit_open_seconds
+    )
+
+
+def get_circuit_states() -> Dict[str, Dict[str, Any]]:
+    """State of every upstream breaker, keyed by upstream name."""
+    return {name: get_circuit_breaker(name).get_state() for name in UPSTREAMS}
@@ -7,19 +7,47 @@ This module implements a debate-style evaluation process where:
 3. Agent A responds and refines evaluation
 4. Final consensus is reached
 
+An alternative self-consistency mode draws independent samples from both
+personas in parallel and aggregates them per criterion in one round-trip.
+
 This approach reduces bias and improves evaluation quality through
 multiple perspectives and iterative refinement.
 """
 
+import asyncio
 import logging
+import statistics
 import time
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
-from prompts import BATCH_EVALUATION_PROMPT
+from prompts import BATCH_EVALUATION_PROMPT, DEBATE_REFINEMENT_PROMPT
+from services.prescreen_scorer import get_prescreen_scorer
+from services.llm_scheduler import run_llm_call
+from services.deadline import DeadlineExceeded
 
 logger = logging.getLogger(__name__)
 
+STRICT_INSTRUCTIONS = """
+You are a STRICT EVALUATOR with high standards. Your role is to:
+- Apply rigorous scoring standards
+- Focus on gaps, weaknesses, and areas for improvement
+- Require strong evidence for higher scores
+- Be conservative with scoring - only award high scores for exceptional performance
+- Look for missing elements and incomplete demonstrations
+
+"""
+
+GENEROUS_INSTRUCTIONS = """
+You are a GENEROUS EVALUATOR who recognizes potential and growth. Your role is to:
+- Look for strengths and positive indicators
+- Give credit for partial demonstrations and good intentions
+- Consider context and circumstances
+- Be optimistic about candidate potential
+- Recognize effort and improvement opportunities
+
+"""
+
 
 class AgentRole(Enum):
     """Roles for different evaluation agents."""
@@ -52,6 +80,7 @@ class DebateRound:
     response: Optional[str]
     strict_rebuttal: Optional[str]  # Agent A's response to critique
     generous_counter_rebuttal: Optional[str]  # Agent B's final thoughts
+    disputed_criteria: Optional[List[str]] = None  # Criteria re-evaluated in this round
 
 
 class ConsensusEvaluationService:
@@ -129,11 +158,229 @@ class ConsensusEvaluationService:
 
             return final_result
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error in consensus evaluation: {e}")
             # Fallback to simple deterministic evaluation
             return await self._fallback_evaluation(candidate_content, rubric_data, candidate_id)
 
+    async def evaluate_with_self_consistency(
+        self,
+        candidate_content: str,
+        rubric_data: Dict[str, Any],
+        candidate_id: str,
+        samples: int = 4,
+        aggregation: str = "median",
+        temperature: float = 0.7
+    ) -> Dict[str, Any]:
+        """
+        Evaluate using parallel self-consistency sampling instead of a debate.
+
+        Independent samples are drawn from the strict and generous personas in a
+        single round-trip, per-criterion scores are aggregated, and the spread of
+        the samples is reported as confidence.
+
+        Args:
+            candidate_content: Text content to evaluate
+            rubric_data: Rubric with criteria and scoring guidelines
+            candidate_id: Identifier for the candidate
+            samples: Total number of samples, split between the two personas
+            aggregation: "median" or "trimmed_mean"
+            temperature: Sampling temperature for each sample
+
+        Returns:
+            Consensus evaluation in the same shape as the debate result
+        """
+        logger.info(f"Starting self-consistency evaluation for candidate {candidate_id} ({samples} samples, {aggregation})")
+
+        self.debate_rounds = []
+        samples = max(2, samples)
+        strict_n = (samples + 1) // 2
+        generous_n = samples - strict_n
+
+        try:
+            strict_evals, generous_evals = await asyncio.gather(
+                self._sample_persona(AgentRole.STRICT_EVALUATOR, strict_n, temperature, candidate_content, rubric_data),
+                self._sample_persona(AgentRole.GENEROUS_EVALUATOR, generous_n, temperature, candidate_content, rubric_data)
+            )
+
+            if not strict_evals or not generous_evals:
+                logger.warning("⚠️  No usable samples, using deterministic scoring")
+                strict_evals = strict_evals or [self._create_deterministic_evaluation(
+                    AgentRole.STRICT_EVALUATOR, candidate_content, rubric_data, 1, bias=-0.5
+                )]
+                generous_evals = generous_evals or [self._create_deterministic_evaluation(
+                    AgentRole.GENEROUS_EVALUATOR, candidate_content, rubric_data, 1, bias=0.5
+                )]
+
+            return self._create_self_consistency_result(strict_evals, generous_evals, rubric_data, aggregation)
+
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error in self-consistency evaluation: {e}")
+            return await self._fallback_evaluation(candidate_content, rubric_data, candidate_id)
+
+    async def _sample_persona(
+        self,
+        agent_role: AgentRole,
+        n: int,
+        temperature: float,
+        candidate_content: str,
+        rubric_data: Dict[str, Any]
+    ) -> List[AgentEvaluation]:
+        """Draw n independent evaluations from one persona.
+
+        Chat models are asked for all n completions in one request (the ``n``
+        parameter); other LLM interfaces fall back to n concurrent calls.
+        """
+        if n <= 0 or not (self.llm and not getattr(self.llm, '_is_stub', False)):
+            return []
+
+        instructions = STRICT_INSTRUCTIONS if agent_role == AgentRole.STRICT_EVALUATOR else GENEROUS_INSTRUCTIONS
+        prompt = self._build_agent_prompt(instructions, candidate_content, rubric_data)
+        logger.info(f"🎲 Sampling {n} {agent_role.value} evaluations (temperature {temperature})")
+
+        start_time = time.time()
+        try:
+            from langchain_core.language_models import BaseChatModel
+            if isinstance(self.llm, BaseChatModel):
+                from langchain_core.messages import HumanMessage
+                llm_result = await run_llm_call(
+                    f"consensus_{agent_role.value}_samples",
+                    lambda: self.llm.agenerate([[HumanMessage(content=prompt)]], n=n, temperature=temperature)
+                )
+                responses = [generation.text for generation in llm_result.generations[0]]
+            else:
+                responses = await asyncio.gather(
+                    *(self._call_llm_with_prompt(prompt, f"{agent_role.value}_sample", 1) for _ in range(n)),
+                    return_exceptions=True
+                )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Sampling failed for {agent_role.value} agent: {e}")
+            return []
+        logger.info(f"✅ {len(responses)} {agent_role.value} samples in {time.time() - start_time:.2f}s")
+
+        from langchain_core.output_parsers import JsonOutputParser
+        parser = JsonOutputParser()
+        evaluations = []
+        for response in responses:
+            if isinstance(response, DeadlineExceeded):
+                raise response
+            if isinstance(response, Exception):
+                logger.warning(f"⚠️ Sample failed: {response}")
+                continue
+            try:
+                response_data = response if isinstance(response, dict) else parser.parse(str(response))
+            except Exception:
+                logger.warning("⚠️ Sample returned unparseable output, skipping")
+                continue
+            if isinstance(response_data, dict) and 'evaluation' in response_data:
+                evaluations.append(self._create_evaluation_from_structured_response(
+                    response_data, agent_role, rubric_data, round_number=1
+                ))
+        return evaluations
+
+    def _aggregate_scores(self, scores: List[float], aggregation: str) -> float:
+        """Aggregate sample scores by median or 20% trimmed mean."""
+        ordered = sorted(scores)
+        if aggregation == "trimmed_mean":
+            trim = int(len(ordered) * 0.2)
+            kept = ordered[trim:len(ordered) - trim] or ordered
+            return sum(kept) / len(kept)
+        return statistics.median(ordered)
+
+    def _create_self_consistency_result(
+        self,
+        strict_evals: List[AgentEvaluation],
+        generous_evals: List[AgentEvaluation],
+        rubric_data: Dict[str, Any],
+        aggregation: str
+    ) -> Dict[str, Any]:
+        """Create consensus result from independent persona samples."""
+        all_evals = strict_evals + generous_evals
+        criteria_map = {c.get('name', 'Unknown'): c for c in rubric_data.get('criteria', [])}
+        criteria_names = list(criteria_map) or list(all_evals[0].criteria_scores)
+
+        consensus_scores = {}
+        dispersion = {}
+        criteria_evaluations = []
+
+        for criterion in criteria_names:
+            scores = [e.criteria_scores[criterion] for e in all_evals if criterion in e.criteria_scores]
+            if not scores:
+                continue
+            consensus_score = max(1.0, min(5.0, self._aggregate_scores(scores, aggregation)))
+            consensus_scores[criterion] = round(consensus_score, 2)
+            dispersion[criterion] = round(statistics.pstdev(scores), 3)
+
+            strict_scores = [e.criteria_scores[criterion] for e in strict_evals if criterion in e.criteria_scores]
+            generous_scores = [e.criteria_scores[criterion] for e in generous_evals if criterion in e.criteria_scores]
+            criterion_data = criteria_map.get(criterion, {})
+
+            criteria_evaluations.append({
+                "criterion_name": criterion,
+                "criterion_description": criterion_data.get('description', f'{criterion} evaluation'),
+                "weight": float(criterion_data.get('weight', 1.0)),
+                "score": consensus_score,
+                "reasoning": f"{aggregation.replace('_', ' ').capitalize()} of {len(scores)} samples - strict {[round(x, 1) for x in strict_scores]}, generous {[round(x, 1) for x in generous_scores]} (stdev {dispersion[criterion]:.2f})",
+                "evidence": ["Evaluated through self-consistency sampling"],
+                "agent_a_reasoning": strict_evals[0].detailed_criteria_reasoning.get(criterion, "No detailed reasoning available"),
+                "agent_b_reasoning": generous_evals[0].detailed_criteria_reasoning.get(criterion, "No detailed reasoning available")
+            })
+
+        final_score = sum(consensus_scores.values()) / len(consensus_scores)
+
+        # Scores live on a 1-5 scale so a standard deviation of 2 is maximal disagreement
+        criteria_confidence = {c: round(max(0.0, 1.0 - d / 2.0), 3) for c, d in dispersion.items()}
+        confidence = sum(criteria_confidence.values()) / len(criteria_confidence)
+
+        strengths = [
+            f"Strong performance in {criterion} (score: {score:.1f})"
+            for criterion, score in consensus_scores.items() if score >= 3.5
+        ] or ["Consensus evaluation identified areas of competency"]
+        improvements = [
+            f"Improvement needed in {criterion} (score: {score:.1f})"
+            for criterion, score in consensus_scores.items() if score < 2.5
+        ] or ["Continue building on current capabilities"]
+
+        return {
+            "overall_score": round(final_score, 2),
+            "criteria_evaluations": criteria_evaluations,
+            "summary": f"Self-consistency evaluation completed with {len(all_evals)} independent samples. Final score is the per-criterion {aggregation.replace('_', ' ')} across strict and generous evaluators.",
+            "strengths": strengths,
+            "improvements": improvements,
+            "consensus_metadata": {
+                "rounds_conducted": 1,
+                "samples": len(all_evals),
+                "strict_samples": len(strict_evals),
+                "generous_samples": len(generous_evals),
+                "strict_final_score": sum(e.overall_score for e in strict_evals) / len(strict_evals),
+                "generous_final_score": sum(e.overall_score for e in generous_evals) / len(generous_evals),
+                "consensus_method": f"self_consistency_{aggregation}",
+                "criteria_dispersion": dispersion,
+                "criteria_confidence": criteria_confidence,
+                "confidence": round(confidence, 3)
+            },
+            "agent_detailed_reasoning": {
+                "agent_a_strict": {
+                    "evaluation": strict_evals[0].structured_evaluation if strict_evals[0].structured_evaluation else {"text_fallback": strict_evals[0].reasoning},
+                    "overall_reasoning": strict_evals[0].reasoning,
+                    "criteria_reasoning": strict_evals[0].detailed_criteria_reasoning,
+                    "confidence": strict_evals[0].confidence
+                },
+                "agent_b_generous": {
+                    "evaluation": generous_evals[0].structured_evaluation if generous_evals[0].structured_evaluation else {"text_fallback": generous_evals[0].reasoning},
+                    "overall_reasoning": generous_evals[0].reasoning,
+                    "criteria_reasoning": generous_evals[0].detailed_criteria_reasoning,
+                    "confidence": generous_evals[0].confidence
+                }
+            }
+        }
+
     async def _conduct_initial_round(
         self,
         candidate_content: str,
@@ -174,7 +421,15 @@ class ConsensusEvaluationService:
         candidate_id: str,
         round_number: int
     ) -> DebateRound:
-        """Conduct one round of debate between agents."""
+        """Conduct one round of debate between agents.
+
+        Only the criteria the agents still disagree on are re-evaluated; settled
+        criteria carry over unchanged from the previous round.
+        """
+        disputed = self._disagreeing_criteria(
+            previous_round.strict_evaluation, previous_round.generous_evaluation
+        )
+        logger.info(f"Round {round_number}: debating {len(disputed)} disputed criteria: {disputed}")
 
         # Agent B critiques Agent A's evaluation
         critique = await self._generate_critique(
@@ -190,7 +445,9 @@ class ConsensusEvaluationService:
             critique,
             candidate_content,
             rubric_data,
-            round_number
+            round_number,
+            disputed_criteria=disputed,
+            other_eval=previous_round.generous_evaluation
         )
 
         # Agent B may also refine based on the response
@@ -199,7 +456,8 @@ class ConsensusEvaluationService:
             refined_strict_eval,
             candidate_content,
             rubric_data,
-            round_number
+            round_number,
+            disputed_criteria=disputed
         )
 
         # Generate rebuttals for this round
@@ -211,32 +469,19 @@ class ConsensusEvaluationService:
             strict_evaluation=refined_strict_eval,
             generous_evaluation=refined_generous_eval,
             critique=critique,
-            response=f"Refined evaluation based on critique",
+            response=f"Refined evaluation of {len(disputed)} disputed criteria based on critique",
             strict_rebuttal=strict_rebuttal,
-            generous_counter_rebuttal=generous_counter_rebuttal
+            generous_counter_rebuttal=generous_counter_rebuttal,
+            disputed_criteria=disputed
         )
 
-    async def _evaluate_as_strict_agent(
+    def _build_agent_prompt(
         self,
+        role_instructions: str,
         candidate_content: str,
-        rubric_data: Dict[str, Any],
-        candidate_id: str,
-        round_number: int
-    ) -> AgentEvaluation:
-        """Evaluate as the strict, demanding agent."""
-
-        # Role-specific instructions for strict agent
-        strict_instructions = """
-You are a STRICT EVALUATOR with high standards. Your role is to:
-- Apply rigorous scoring standards
-- Focus on gaps, weaknesses, and areas for improvement
-- Require strong evidence for higher scores
-- Be conservative with scoring - only award high scores for exceptional performance
-- Look for missing elements and incomplete demonstrations
-
-"""
-
-        # Format criteria details for the prompt
+        rubric_data: Dict[str, Any]
+    ) -> str:
+        """Build the batch evaluation prompt prefixed with role-specific instructions."""
         criteria_details = ""
         for criterion in rubric_data.get('criteria', []):
             criteria_details += f"""**{criterion.get('name', 'Unknown')}** (Weight: {criterion.get('weight', 1.0)})
@@ -245,14 +490,25 @@ Definition: {criterion.get('definition', 'Score 1-5 based on evidence quality')}
 
 """
 
-        # Use the standardized batch evaluation prompt with strict instructions
-        strict_prompt = strict_instructions + BATCH_EVALUATION_PROMPT.format(
+        return role_instructions + BATCH_EVALUATION_PROMPT.format(
             rubric_name=rubric_data.get('rubric_name', 'Unknown'),
             rubric_description=rubric_data.get('description', 'Evaluation rubric'),
             criteria_details=criteria_details,
             document_content=candidate_content[:2000] + ("..." if len(candidate_content) > 2000 else "")
         )
 
+    async def _evaluate_as_strict_agent(
+        self,
+        candidate_content: str,
+        rubric_data: Dict[str, Any],
+        candidate_id: str,
+        round_number: int
+    ) -> AgentEvaluation:
+        """Evaluate as the strict, demanding agent."""
+
+        # Use the standardized batch evaluation prompt with strict instructions
+        strict_prompt = self._build_agent_prompt(STRICT_INSTRUCTIONS, candidate_content, rubric_data)
+
         # Log the LLM prompt being sent
         logger.info(f"🤖 STRICT AGENT LLM CALL - Round {round_number}")
         logger.info(f"📤 Prompt length: {len(strict_prompt)} characters")
@@ -274,6 +530,8 @@ Definition: {criterion.get('definition', 'Score 1-5 based on evidence quality')}
                     )
                 else:
                     logger.warning("⚠️ LLM returned unexpected format, falling back to deterministic")
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.error(f"❌ LLM call failed: {e}, falling back to deterministic")
         else:
@@ -293,33 +551,8 @@ Definition: {criterion.get('definition', 'Score 1-5 based on evidence quality')}
     ) -> AgentEvaluation:
         """Evaluate as the generous, optimistic agent."""
 
-        # Role-specific instructions for generous agent
-        generous_instructions = """
-You are a GENEROUS EVALUATOR who recognizes potential and growth. Your role is to:
-- Look for strengths and positive indicators
-- Give credit for partial demonstrations and good intentions
-- Consider context and circumstances
-- Be optimistic about candidate potential
-- Recognize effort and improvement opportunities
-
-"""
-
-        # Format criteria details for the prompt
-        criteria_details = ""
-        for criterion in rubric_data.get('criteria', []):
-            criteria_details += f"""**{criterion.get('name', 'Unknown')}** (Weight: {criterion.get('weight', 1.0)})
-Description: {criterion.get('description', 'No description available')}
-Definition: {criterion.get('definition', 'Score 1-5 based on evidence quality')}
-
-"""
-
         # Use the standardized batch evaluation prompt with generous instructions
-        generous_prompt = generous_instructions + BATCH_EVALUATION_PROMPT.format(
-            rubric_name=rubric_data.get('rubric_name', 'Unknown'),
-            rubric_description=rubric_data.get('description', 'Evaluation rubric'),
-            criteria_details=criteria_details,
-            document_content=candidate_content[:2000] + ("..." if len(candidate_content) > 2000 else "")
-        )
+        generous_prompt = self._build_agent_prompt(GENEROUS_INSTRUCTIONS, candidate_content, rubric_data)
 
         # Log the LLM prompt being sent
         logger.info(f"🤖 GENEROUS AGENT LLM CALL - Round {round_number}")
@@ -342,6 +575,8 @@ Definition: {criterion.get('definition', 'Score 1-5 based on evidence quality')}
                     )
                 else:
                     logger.warning("⚠️ LLM returned unexpected format, falling back to deterministic")
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.error(f"❌ LLM call failed: {e}, falling back to deterministic")
         else:
@@ -394,29 +629,32 @@ Be diplomatic but advocate for a more balanced view.
         critique: str,
         candidate_content: str,
         rubric_data: Dict[str, Any],
-        round_number: int
+        round_number: int,
+        disputed_criteria: Optional[List[str]] = None,
+        other_eval: Optional[AgentEvaluation] = None
     ) -> AgentEvaluation:
-        """Refine strict evaluation based on generous agent's critique."""
-
-        # Adjust scores slightly upward in response to critique, but maintain strict standards
-        adjusted_scores = {}
-        for criterion, score in original_eval.criteria_scores.items():
-            # Small upward adjustment (max 0.3 points)
-            adjustment = min(0.3, max(0, (4.0 - score) * 0.15))
-            adjusted_scores[criterion] = min(5.0, score + adjustment)
-
-        adjusted_overall = sum(adjusted_scores.values()) / len(adjusted_scores)
+        """Refine strict evaluation of the disputed criteria based on generous agent's critique."""
+        disputed = list(original_eval.criteria_scores) if disputed_criteria is None else disputed_criteria
+
+        refined = None
+        if disputed and other_eval is not None:
+            refined = await self._refine_disputed_with_llm(
+                AgentRole.STRICT_EVALUATOR, original_eval, other_eval,
+                disputed, candidate_content, rubric_data, round_number
+            )
 
-        return AgentEvaluation(
-            agent_role=AgentRole.STRICT_EVALUATOR,
-            overall_score=adjusted_overall,
-            criteria_scores=adjusted_scores,
-            reasoning=f"Refined evaluation considering critique: {original_eval.reasoning[:200]}... After review, made minor adjustments while maintaining rigorous standards.",
-            detailed_criteria_reasoning=original_eval.detailed_criteria_reasoning,
-            evidence=original_eval.evidence,
-            confidence=0.85,
-            round_number=round_number,
-            structured_evaluation=original_eval.structured_evaluation
+        if refined is None:
+            # Adjust scores slightly upward in response to critique, but maintain strict standards
+            refined = {}
+            for criterion in disputed:
+                score = original_eval.criteria_scores.get(criterion, 2.5)
+                # Small upward adjustment (max 0.3 points)
+                adjustment = min(0.3, max(0, (4.0 - score) * 0.15))
+                refined[criterion] = (min(5.0, score + adjustment), None)
+
+        return self._merge_refined_evaluation(
+            original_eval, refined, rubric_data, round_number,
+            reasoning=f"Refined evaluation considering critique: {original_eval.reasoning[:200]}... After review of {len(disputed)} disputed criteria, made minor adjustments while maintaining rigorous standards."
         )
 
     async def _refine_generous_evaluation(
@@ -425,32 +663,133 @@ Be diplomatic but advocate for a more balanced view.
         refined_strict_eval: AgentEvaluation,
         candidate_content: str,
         rubric_data: Dict[str, Any],
-        round_number: int
+        round_number: int,
+        disputed_criteria: Optional[List[str]] = None
     ) -> AgentEvaluation:
-        """Refine generous evaluation considering strict agent's refined position."""
+        """Refine generous evaluation of the disputed criteria considering strict agent's refined position."""
+        disputed = list(original_eval.criteria_scores) if disputed_criteria is None else disputed_criteria
+
+        refined = None
+        if disputed:
+            refined = await self._refine_disputed_with_llm(
+                AgentRole.GENEROUS_EVALUATOR, original_eval, refined_strict_eval,
+                disputed, candidate_content, rubric_data, round_number
+            )
+
+        if refined is None:
+            # Adjust scores slightly toward the refined strict evaluation
+            refined = {}
+            for criterion in disputed:
+                generous_score = original_eval.criteria_scores.get(criterion, 2.5)
+                strict_score = refined_strict_eval.criteria_scores.get(criterion, generous_score)
+                # Move 20% toward strict evaluation while maintaining generous perspective
+                adjusted_score = generous_score * 0.8 + strict_score * 0.2
+                refined[criterion] = (max(1.0, min(5.0, adjusted_score)), None)
+
+        return self._merge_refined_evaluation(
+            original_eval, refined, rubric_data, round_number,
+            reasoning=f"Refined evaluation after debate: {original_eval.reasoning[:200]}... Considered strict evaluator's perspective on {len(disputed)} disputed criteria while maintaining focus on candidate strengths."
+        )
 
-        # Adjust scores slightly toward the refined strict evaluation
-        adjusted_scores = {}
-        for criterion, generous_score in original_eval.criteria_scores.items():
-            strict_score = refined_strict_eval.criteria_scores.get(criterion, generous_score)
-            # Move 20% toward strict evaluation while maintaining generous perspective
-            adjusted_score = generous_score * 0.8 + strict_score * 0.2
-            adjusted_scores[criterion] = max(1.0, min(5.0, adjusted_score))
+    async def _refine_disputed_with_llm(
+        self,
+        agent_role: AgentRole,
+        own_eval: AgentEvaluation,
+        other_eval: AgentEvaluation,
+        disputed: List[str],
+        candidate_content: str,
+        rubric_data: Dict[str, Any],
+        round_number: int
+    ) -> Optional[Dict[str, tuple]]:
+        """Ask the agent to re-score only the disputed criteria.
+
+        Returns:
+            Mapping of criterion name to (score, reasoning), or None if the LLM is
+            unavailable or returned an unusable response.
+        """
+        if not (self.llm and not getattr(self.llm, '_is_stub', False)):
+            return None
+
+        criteria_map = {c.get('name', 'Unknown'): c for c in rubric_data.get('criteria', [])}
+        disputed_details = ""
+        for name in disputed:
+            criterion = criteria_map.get(name, {})
+            disputed_details += f"""**{name}** (Weight: {criterion.get('weight', 1.0)})
+Definition: {criterion.get('definition', 'Score 1-5 based on evidence quality')}
+Your previous score: {own_eval.criteria_scores.get(name, 0):.1f} - {own_eval.detailed_criteria_reasoning.get(name, 'No reasoning recorded')}
+Other evaluator's score: {other_eval.criteria_scores.get(name, 0):.1f} - {other_eval.detailed_criteria_reasoning.get(name, 'No reasoning recorded')}
+
+"""
+
+        prompt = DEBATE_REFINEMENT_PROMPT.format(
+            role_instructions=STRICT_INSTRUCTIONS if agent_role == AgentRole.STRICT_EVALUATOR else GENEROUS_INSTRUCTIONS,
+            rubric_name=rubric_data.get('rubric_name', 'Unknown'),
+            disputed_criteria=disputed_details,
+            document_content=candidate_content[:2000] + ("..." if len(candidate_content) > 2000 else "")
+        )
+
+        try:
+            llm_response = await self._call_llm_with_prompt(prompt, f"{agent_role.value}_refinement", round_number)
+            if not isinstance(llm_response, dict):
+                from langchain_core.output_parsers import JsonOutputParser
+                llm_response = JsonOutputParser().parse(llm_response)
+            if not (isinstance(llm_response, dict) and 'evaluation' in llm_response):
+                logger.warning("⚠️ Refinement returned unexpected format, using deterministic adjustment")
+                return None
+
+            disputed_lookup = {name.lower(): name for name in disputed}
+            refined = {}
+            for item in llm_response['evaluation']:
+                name = disputed_lookup.get(str(item.get('criterion_name', '')).lower())
+                if name is None:
+                    continue  # Ignore attempts to re-score settled criteria
+                refined[name] = (
+                    max(1.0, min(5.0, float(item.get('score', own_eval.criteria_scores.get(name, 2.5))))),
+                    item.get('reasoning')
+                )
+            return refined or None
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Refinement LLM call failed: {e}, using deterministic adjustment")
+            return None
 
-        adjusted_overall = sum(adjusted_scores.values()) / len(adjusted_scores)
+    def _merge_refined_evaluation(
+        self,
+        original_eval: AgentEvaluation,
+        refined: Dict[str, tuple],
+        rubric_data: Dict[str, Any],
+        round_number: int,
+        reasoning: str
+    ) -> AgentEvaluation:
+        """Merge re-scored disputed criteria into the already-settled ones."""
+        criteria_scores = dict(original_eval.criteria_scores)
+        detailed_reasoning = dict(original_eval.detailed_criteria_reasoning)
+        for criterion, (score, criterion_reasoning) in refined.items():
+            criteria_scores[criterion] = score
+            if criterion_reasoning:
+                detailed_reasoning[criterion] = criterion_reasoning
 
         return AgentEvaluation(
-            agent_role=AgentRole.GENEROUS_EVALUATOR,
-            overall_score=adjusted_overall,
-            criteria_scores=adjusted_scores,
-            reasoning=f"Refined evaluation after debate: {original_eval.reasoning[:200]}... Considered strict evaluator's perspective while maintaining focus on candidate strengths.",
-            detailed_criteria_reasoning=original_eval.detailed_criteria_reasoning,
+            agent_role=original_eval.agent_role,
+            overall_score=self._weighted_overall_score(criteria_scores, rubric_data),
+            criteria_scores=criteria_scores,
+            reasoning=reasoning,
+            detailed_criteria_reasoning=detailed_reasoning,
             evidence=original_eval.evidence,
             confidence=0.85,
             round_number=round_number,
             structured_evaluation=original_eval.structured_evaluation
         )
 
+    def _weighted_overall_score(self, criteria_scores: Dict[str, float], rubric_data: Dict[str, Any]) -> float:
+        """Weighted average of criterion scores using rubric weights (unknown criteria weigh 1.0)."""
+        weights = {c.get('name', 'Unknown'): float(c.get('weight', 1.0)) for c in rubric_data.get('criteria', [])}
+        total_weight = sum(weights.get(name, 1.0) for name in criteria_scores)
+        if total_weight <= 0:
+            return sum(criteria_scores.values()) / len(criteria_scores) if criteria_scores else 0.0
+        return sum(score * weights.get(name, 1.0) for name, score in criteria_scores.items()) / total_weight
+
     def _create_deterministic_evaluation(
         self,
         agent_role: AgentRole,
@@ -464,28 +803,15 @@ Be diplomatic but advocate for a more balanced view.
         criteria_scores = {}
         evidence = []
 
-        # Simple scoring based on content length and keywords with bias
-        content_length = len(candidate_content)
-        has_keywords = any(word in candidate_content.lower() for word in
-                          ['experience', 'skills', 'project', 'develop', 'manage', 'lead'])
-
-        base_score = 2.5  # Neutral starting point
-        if content_length > 1000:
-            base_score += 0.5
-        if has_keywords:
-            base_score += 0.5
-
-        # Apply agent bias
-        base_score += bias
-        base_score = max(1.0, min(5.0, base_score))
+        # Rule-based pre-screen of the rubric level descriptors, shifted by agent bias
+        prescreen = get_prescreen_scorer().score(candidate_content, rubric_data)
+        prescreen_scores = {c.criterion_name: c.score for c in prescreen.criteria}
 
         # Score each criterion and build detailed reasoning
         detailed_criteria_reasoning = {}
         for criterion in rubric_data.get('criteria', []):
             criterion_name = criterion.get('name', 'Unknown')
-            # Vary scores slightly per criterion
-            variation = hash(criterion_name) % 10 / 20.0 - 0.25  # -0.25 to +0.25
-            score = max(1.0, min(5.0, base_score + variation))
+            score = max(1.0, min(5.0, prescreen_scores.get(criterion_name, 3.0) + bias))
             criteria_scores[criterion_name] = score
 
             # Create detailed reasoning for each criterion
@@ -533,12 +859,43 @@ Be diplomatic but advocate for a more balanced view.
         generous_eval: Optional[AgentEvaluation],
         tolerance: float = 0.5
     ) -> bool:
-        """Check if agents agree within tolerance."""
+        """Check if agents agree within tolerance on every criterion."""
         if not strict_eval or not generous_eval:
             return False
 
-        score_diff = abs(strict_eval.overall_score - generous_eval.overall_score)
-        return score_diff <= tolerance
+        return not self._disagreeing_criteria(strict_eval, generous_eval, tolerance)
+
+    def _criteria_agreement(
+        self,
+        strict_eval: AgentEvaluation,
+        generous_eval: AgentEvaluation,
+        tolerance: float = 0.5
+    ) -> Dict[str, bool]:
+        """Per-criterion agreement: True where both agents' scores are within tolerance."""
+        agreement = {}
+        for criterion in set(strict_eval.criteria_scores) | set(generous_eval.criteria_scores):
+            strict_score = strict_eval.criteria_scores.get(criterion)
+            generous_score = generous_eval.criteria_scores.get(criterion)
+            if strict_score is None or generous_score is None:
+                agreement[criterion] = False
+            else:
+                agreement[criterion] = abs(strict_score - generous_score) <= tolerance
+        return agreement
+
+    def _disagreeing_criteria(
+        self,
+        strict_eval: Optional[AgentEvaluation],
+        generous_eval: Optional[AgentEvaluation],
+        tolerance: float = 0.5
+    ) -> List[str]:
+        """Names of criteria the agents still disagree on, in strict-evaluation order."""
+        if not strict_eval or not generous_eval:
+            return []
+        agreement = self._criteria_agreement(strict_eval, generous_eval, tolerance)
+        ordered = list(strict_eval.criteria_scores) + [
+            c for c in generous_eval.criteria_scores if c not in strict_eval.criteria_scores
+        ]
+        return [criterion for criterion in ordered if not agreement[criterion]]
 
     def _create_consensus_result(self, final_round: DebateRound, rubric_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create final consensus result from debate."""
@@ -608,7 +965,13 @@ Be diplomatic but advocate for a more balanced view.
                 "strict_final_score": strict_eval.overall_score,
                 "generous_final_score": generous_eval.overall_score,
                 "consensus_method": "weighted_average",
-                "agreement_tolerance": "0.5"
+                "agreement_tolerance": "0.5",
+                "agreement_scope": "per_criterion",
+                "criteria_debated": {
+                    str(r.round_number): r.disputed_criteria
+                    for r in self.debate_rounds if r.disputed_criteria is not None
+                },
+                "unresolved_criteria": self._disagreeing_criteria(strict_eval, generous_eval)
             },
             "agent_detailed_reasoning": {
                 "agent_a_strict": {
@@ -638,7 +1001,8 @@ Be diplomatic but advocate for a more balanced view.
                 "critique": round_data.critique,
                 "response": round_data.response,
                 "strict_rebuttal": round_data.strict_rebuttal if hasattr(round_data, 'strict_rebuttal') else None,
-                "generous_counter_rebuttal": round_data.generous_counter_rebuttal if hasattr(round_data, 'generous_counter_rebuttal') else None
+                "generous_counter_rebuttal": round_data.generous_counter_rebuttal if hasattr(round_data, 'generous_counter_rebuttal') else None,
+                "disputed_criteria": round_data.disputed_criteria
             }
             summary.append(round_summary)
 
@@ -724,14 +1088,20 @@ Be diplomatic but advocate for a more balanced view.
 
             if hasattr(self.llm, 'ainvoke'):
                 # LangChain async interface
-                response = await self.llm.ainvoke(prompt)
+                response = await run_llm_call(
+                    f"consensus_{agent_type}",
+                    lambda: self.llm.ainvoke(prompt),
+                    hedge_factory=lambda: self.llm.ainvoke(prompt)
+                )
             elif hasattr(self.llm, 'invoke'):
                 # LangChain sync interface (wrap in async)
-                import asyncio
-                response = await asyncio.get_event_loop().run_in_executor(None, self.llm.invoke, prompt)
+                response = await run_llm_call(
+                    f"consensus_{agent_type}",
+                    lambda: asyncio.get_event_loop().run_in_executor(None, self.llm.invoke, prompt)
+                )
             else:
                 # Direct call
-                response = await self.llm(prompt)
+                response = await run_llm_call(f"consensus_{agent_type}", lambda: self.llm(prompt))
 
             duration = time.time() - start_time
 
@@ -745,8 +1115,8 @@ Be diplomatic but advocate for a more balanced view.
                 logger.debug(f"   Response preview: {str(response)[:200]}...")
                 return response
             else:
-                # Response is text, convert to string
-                response_text = str(response)
+                # Response is text (chat models return a message; keep only its content)
+                response_text = str(getattr(response, 'content', response))
                 logger.info(f"✅ LLM Response Details (Text):")
                 logger.info(f"   Response time: {duration:.2f}s")
                 logger.info(f"   Response length: {len(response_text)} chars")
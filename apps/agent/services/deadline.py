@@ -0,0 +1,74 @@
+"""
+Per-request deadline propagation.
+
+The route sets an absolute deadline for the request; every stage below it
+(retrieval, LLM calls, saves) asks for the remaining budget instead of using
+its own fixed timeout. The deadline lives in a context variable, so it follows
+the request into tasks spawned with ``asyncio.gather``.
+"""
+
+import asyncio
+import contextvars
+import time
+from typing import Awaitable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Raised when a stage starts or runs past the request deadline."""
+
+
+def deadline_from_now(seconds: Optional[float]) -> Optional[float]:
+    """Absolute (monotonic) deadline ``seconds`` from now, or None for no deadline."""
+    return time.monotonic() + seconds if seconds and seconds > 0 else None
+
+
+def set_deadline(deadline: Optional[float]) -> None:
+    """Set the absolute deadline for the current request context."""
+    _deadline.set(deadline)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the request deadline, or None if there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def timeout_for(stage: str, default: float) -> float:
+    """Timeout for a stage: its own default capped by the remaining request budget.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise DeadlineExceeded(f"Request deadline exceeded before {stage}")
+    return min(default, left)
+
+
+async def run_with_deadline(stage: str, awaitable: Awaitable[T]) -> T:
+    """Await ``awaitable`` within the remaining request budget.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes first (the awaitable is cancelled)
+    """
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(f"Request deadline exceeded before {stage}")
+    try:
+        return await asyncio.wait_for(awaitable, timeout=left)
+    except asyncio.TimeoutError as e:
+        if isinstance(e, DeadlineExceeded):
+            raise
+        raise DeadlineExceeded(f"Request deadline exceeded during {stage}") from e
@@ -65,6 +65,28 @@ class DeterministicComparison:
             analysis_method=ComparisonMode.DETERMINISTIC
         )
 
+    def top_k_survivors(self, bounds: Dict[str, Tuple[float, float]], k: int) -> List[str]:
+        """
+        Return candidates that can still place in the top k.
+
+        A candidate is dropped only when its upper bound is below the k-th best
+        lower bound, i.e. at least k other candidates outscore it as long as the
+        bounds hold.
+
+        Args:
+            bounds: Candidate ID to (lower, upper) overall score bounds
+            k: Number of top candidates required
+
+        Returns:
+            Surviving candidate IDs, best lower bound first
+        """
+        ordered = sorted(bounds, key=lambda cid: bounds[cid][0], reverse=True)
+        if len(ordered) <= k:
+            return ordered
+
+        kth_lower = bounds[ordered[k - 1]][0]
+        return [cid for cid in ordered if bounds[cid][1] >= kth_lower]
+
     def _calculate_statistical_summary(self, results: List[EvaluationResult]) -> StatisticalSummary:
         """Calculate statistical measures across all document scores."""
         scores = [result.overall_score for result in results]
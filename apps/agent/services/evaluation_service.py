@@ -5,8 +5,8 @@ Uses criteria_api service for rubric and criteria data.
 
 import asyncio
 import logging
-import httpx
-from typing import Any, Dict, List, Optional
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
 from functools import lru_cache
 
 from models.invoke import (
@@ -15,17 +15,61 @@ from models.invoke import (
     CandidateInput,
     BatchEvaluationResult,
     ComparisonMode,
+    PriorityClass,
+    PrunedCandidate,
     RankingStrategy
 )
 # Direct criteria API calls - no bridge needed
 from services.search_service import AzureSearchService
 from services.deterministic_analyzer import DeterministicComparison, get_deterministic_analyzer
+from services.prescreen_scorer import get_prescreen_scorer
+from services.llm_scheduler import current_priority, run_llm_call
+from services.admission_controller import get_admission_controller
+from services.deadline import DeadlineExceeded, set_deadline, timeout_for
+from services.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from services.stage_timings import start_stage_timings, stage_timings_metadata, timed_stage
+from services.cassette import cassette_http_client, finish_recording, start_recording, upstream_client
 from prompts.evaluation_prompts import get_batch_evaluation_template, get_summary_template
 from config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+def build_batch_evaluation_inputs(
+    rubric_data: Dict[str, Any],
+    document_chunks: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """Template inputs for the batch evaluation prompt.
+
+    Args:
+        rubric_data: Rubric with criteria
+        document_chunks: Chunks to evaluate
+
+    Returns:
+        Values for ``rubric_name``, ``rubric_description``, ``criteria_details`` and ``document_content``
+    """
+    document_content = "\n\n".join([
+        f"[Chunk {i+1} - Related to {chunk.get('related_criterion', 'all')}]: {chunk['content']}"
+        for i, chunk in enumerate(document_chunks)
+    ])
+
+    # Criteria are labelled by name, the key _parse_batch_evaluation matches responses on
+    criteria_details = "\n\n".join([
+        f"Criterion: {criterion.get('name', criterion['criterion_id'])}\n"
+        f"Weight: {criterion['weight']}\n"
+        f"Description: {criterion['description']}\n"
+        f"Definition: {criterion.get('scoring_criteria', criterion.get('definition', 'Standard 1-5 scale'))}"
+        for criterion in rubric_data["criteria"]
+    ])
+
+    return {
+        "rubric_name": rubric_data["rubric_name"],
+        "rubric_description": rubric_data.get("description", ""),
+        "criteria_details": criteria_details,
+        "document_content": document_content
+    }
+
+
 class EvaluationService:
     """Service for evaluating documents using LangChain/LangGraph."""
 
@@ -49,6 +93,10 @@ class EvaluationService:
         self.criteria_api_url = self.settings.criteria_api_url.rstrip("/")
         self.search_service = search_service
         self.deterministic_analyzer = deterministic_analyzer or get_deterministic_analyzer()
+        self.prescreen_scorer = get_prescreen_scorer()
+        self.criteria_api_breaker = get_circuit_breaker("criteria_api")
+        # Last successfully fetched copy of each rubric, served while criteria_api is unavailable
+        self._last_known_rubrics: Dict[str, Dict[str, Any]] = {}
 
         # Initialize LLM if not provided
         if llm is None:
@@ -56,6 +104,20 @@ class EvaluationService:
         else:
             self.llm = llm
 
+        # Fast tier for cascading evaluation (None disables the cascade)
+        self.fast_llm = None
+        if self.settings.use_cascade_evaluation:
+            if self.settings.azure_openai_fast_deployment:
+                self.fast_llm = self._create_llm(self.settings.azure_openai_fast_deployment)
+            else:
+                logger.warning("USE_CASCADE_EVALUATION set without AZURE_OPENAI_FAST_DEPLOYMENT; cascade disabled")
+        self.cascade_stats = {"evaluated": 0, "escalated": 0}
+
+        # Second deployment for hedged duplicates of primary-tier calls (None hedges on the same deployment)
+        self.hedge_llm = None
+        if self.settings.llm_hedging_enabled and self.settings.azure_openai_hedge_deployment:
+            self.hedge_llm = self._create_llm(self.settings.azure_openai_hedge_deployment)
+
         # Get prompt templates
         self.batch_evaluation_template = get_batch_evaluation_template()
         self.summary_template = get_summary_template()
@@ -67,41 +129,65 @@ class EvaluationService:
             rubric_id: ID of the rubric
 
         Returns:
-            Rubric data or None if not found
+            Rubric data or None if not found. While criteria_api is failing, the
+            last successfully fetched copy is returned if there is one.
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.criteria_api_url}/rubrics/{rubric_id}")
-
-                if response.status_code == 404:
-                    return None
+            with self.criteria_api_breaker.guard():
+                async with upstream_client(timeout_for("rubric_fetch", 30.0)) as client:
+                    response = await client.get(f"{self.criteria_api_url}/rubrics/{rubric_id}")
+                    if response.status_code != 404:
+                        response.raise_for_status()
+
+            if response.status_code == 404:
+                self._last_known_rubrics.pop(rubric_id, None)
+                return None
 
-                response.raise_for_status()
-                rubric_data = response.json()
+            rubric_data = response.json()
 
-                # Transform to evaluation format (simplified)
-                return {
-                    "rubric_id": rubric_data["id"],
-                    "rubric_name": rubric_data["name"],
-                    "description": rubric_data["description"],
-                    "criteria": [
-                        {
-                            "criterion_id": criterion["criteriaId"],
-                            "name": criterion["name"],
-                            "description": criterion["description"],
-                            "definition": criterion["definition"],
-                            "weight": criterion["weight"]
-                        }
-                        for criterion in rubric_data["criteria"]
-                    ]
-                }
+            # Transform to evaluation format (simplified)
+            rubric = {
+                "rubric_id": rubric_data["id"],
+                "rubric_name": rubric_data["name"],
+                "description": rubric_data["description"],
+                "version": rubric_data.get("version"),
+                "updated_at": rubric_data.get("updatedAt"),
+                "criteria": [
+                    {
+                        "criterion_id": criterion["criteriaId"],
+                        "name": criterion["name"],
+                        "description": criterion["description"],
+                        "definition": criterion["definition"],
+                        "weight": criterion["weight"]
+                    }
+                    for criterion in rubric_data["criteria"]
+                ]
+            }
+            self._last_known_rubrics[rubric_id] = rubric
+            return rubric
 
+        except CircuitOpenError as e:
+            return self._cached_rubric(rubric_id, e)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error fetching rubric '{rubric_id}' directly: {e}")
-            return None
+            return self._cached_rubric(rubric_id, e)
 
-    def _create_llm(self) -> Any:
-        """Create LangChain LLM instance."""
+    def _cached_rubric(self, rubric_id: str, error: Exception) -> Optional[Dict[str, Any]]:
+        """Fall back to the last known copy of a rubric when criteria_api is unavailable."""
+        cached = self._last_known_rubrics.get(rubric_id)
+        if cached is not None:
+            logger.warning(f"Using cached rubric '{rubric_id}' ({error})")
+        return cached
+
+    def _create_llm(self, deployment: Optional[str] = None) -> Any:
+        """Create LangChain LLM instance.
+
+        Args:
+            deployment: Deployment name (defaults to AZURE_OPENAI_DEPLOYMENT)
+        """
+        deployment = deployment or self.settings.azure_openai_deployment
         try:
             # Import here to avoid dependency issues if LangChain not installed
             from langchain_openai import AzureChatOpenAI
@@ -109,28 +195,29 @@ class EvaluationService:
             # Debug logging
             logger.info(f"Azure OpenAI API Key configured: {bool(self.settings.azure_openai_api_key)}")
             logger.info(f"Azure OpenAI Endpoint: {self.settings.azure_openai_endpoint}")
-            logger.info(f"Azure OpenAI Deployment: {self.settings.azure_openai_deployment}")
+            logger.info(f"Azure OpenAI Deployment: {deployment}")
             logger.info(f"Azure OpenAI API Version: {self.settings.azure_openai_api_version}")
 
             if not all([
                 self.settings.azure_openai_api_key,
                 self.settings.azure_openai_endpoint,
-                self.settings.azure_openai_deployment
+                deployment
             ]):
                 logger.warning("Azure OpenAI not fully configured; using stub LLM")
                 logger.warning(f"Missing configs - API Key: {not self.settings.azure_openai_api_key}, "
                              f"Endpoint: {not self.settings.azure_openai_endpoint}, "
-                             f"Deployment: {not self.settings.azure_openai_deployment}")
+                             f"Deployment: {not deployment}")
                 return None
 
             logger.info("Creating AzureChatOpenAI instance...")
             llm = AzureChatOpenAI(
-                azure_deployment=self.settings.azure_openai_deployment,
+                azure_deployment=deployment,
                 api_key=self.settings.azure_openai_api_key,
                 azure_endpoint=self.settings.azure_openai_endpoint,
                 api_version=self.settings.azure_openai_api_version,
                 temperature=0.1,
-                timeout=120
+                timeout=120,
+                http_async_client=cassette_http_client()
             )
             logger.info("AzureChatOpenAI instance created successfully!")
             return llm
@@ -141,6 +228,14 @@ class EvaluationService:
             logger.error(f"Error creating LLM: {e}; using stub LLM")
             return None
 
+    def estimated_llm_calls_per_candidate(self) -> float:
+        """Rough LLM calls per candidate for the configured evaluation mode (admission cost)."""
+        if self.settings.use_consensus_evaluation:
+            # Debate: two initial evaluations plus up to two refinements; sampling: one call per persona
+            return 2.0 if self.settings.consensus_mode == "self_consistency" else 4.0
+        # Criteria evaluation plus summary, with occasional escalation when cascading
+        return 2.5 if self.fast_llm is not None else 2.0
+
     async def save_evaluation_to_criteria_api(
         self,
         evaluation_result: Dict[str, Any],
@@ -201,24 +296,39 @@ class EvaluationService:
                     "candidate_ids": candidate_ids
                 }
 
+            # An expired request must not leave a result behind, even in the outbox
+            save_timeout = timeout_for("save", 30.0)
+
+            # Commit to the local outbox and return the pre-assigned ID; delivery happens in the background
+            if self.settings.use_result_outbox:
+                from services.result_outbox import get_result_outbox
+                return await get_result_outbox().enqueue(evaluation_data)
+
             # Send to criteria_api
             criteria_api_url = self.settings.criteria_api_url or "http://localhost:8000"
             url = f"{criteria_api_url}/candidates/evaluations"
 
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(url, json=evaluation_data)
-                response.raise_for_status()
+            with self.criteria_api_breaker.guard():
+                async with upstream_client(save_timeout) as client:
+                    response = await client.post(url, json=evaluation_data)
+                    response.raise_for_status()
 
-                created_evaluation = response.json()
-                evaluation_id = created_evaluation.get("id")
+            created_evaluation = response.json()
+            evaluation_id = created_evaluation.get("id")
 
-                if evaluation_id:
-                    logger.info(f"Successfully saved evaluation result with ID: {evaluation_id}")
-                    return evaluation_id
-                else:
-                    logger.error("No evaluation ID returned from criteria_api")
-                    return None
+            if evaluation_id:
+                logger.info(f"Successfully saved evaluation result with ID: {evaluation_id}")
+                return evaluation_id
+            else:
+                logger.error("No evaluation ID returned from criteria_api")
+                return None
+
+        except CircuitOpenError as e:
+            logger.warning(f"Not saving evaluation to criteria_api: {e}")
+            return None
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Failed to save evaluation to criteria_api: {e}", exc_info=True)
             return None
@@ -229,7 +339,10 @@ class EvaluationService:
         candidate_ids: List[str],
         comparison_mode: ComparisonMode = ComparisonMode.DETERMINISTIC,
         ranking_strategy: RankingStrategy = RankingStrategy.OVERALL_SCORE,
-        max_chunks: int = 10
+        max_chunks: int = 10,
+        top_k: Optional[int] = None,
+        priority: Optional[PriorityClass] = None,
+        deadline: Optional[float] = None
     ) -> Dict[str, Any]:
         """Evaluate candidates by ID using specified rubric.
 
@@ -244,10 +357,40 @@ class EvaluationService:
             comparison_mode: Analysis method for multiple candidates
             ranking_strategy: Strategy for ranking multiple candidates
             max_chunks: Maximum chunks to retrieve per candidate
+            top_k: If set, only the best k candidates need full evaluation
+            priority: LLM scheduling class (interactive for one candidate, batch otherwise)
+            deadline: Absolute ``time.monotonic()`` deadline; every stage gets the remaining budget
 
         Returns:
             Dictionary with evaluation results (single or batch format)
         """
+        # All LLM calls made for this request are scheduled under its priority class
+        current_priority.set(priority or (
+            PriorityClass.INTERACTIVE if len(candidate_ids) == 1 else PriorityClass.BATCH
+        ))
+        set_deadline(deadline)
+        start_stage_timings()
+        start_recording()
+
+        result: Dict[str, Any] = {}
+        try:
+            result = await self._evaluate_by_ids(
+                rubric_id, candidate_ids, comparison_mode, ranking_strategy, max_chunks, top_k
+            )
+            return result
+        finally:
+            finish_recording(rubric_id, candidate_ids, result)
+
+    async def _evaluate_by_ids(
+        self,
+        rubric_id: str,
+        candidate_ids: List[str],
+        comparison_mode: ComparisonMode,
+        ranking_strategy: RankingStrategy,
+        max_chunks: int,
+        top_k: Optional[int]
+    ) -> Dict[str, Any]:
+        """Validate the request, fetch rubric and candidates, evaluate and save (see ``evaluate``)."""
         try:
             # Validate inputs
             if not candidate_ids:
@@ -262,13 +405,16 @@ class EvaluationService:
 
             # Fetch rubric data directly from criteria API
             logger.info(f"Fetching rubric data for rubric_id: {rubric_id}")
-            rubric_data = await self._get_rubric_direct(rubric_id)
+            with timed_stage("rubric_fetch"):
+                rubric_data = await self._get_rubric_direct(rubric_id)
             if not rubric_data:
                 return {"error": f"Rubric '{rubric_id}' not found"}
+            get_admission_controller().record_rubric_size(rubric_id, len(rubric_data["criteria"]))
 
             # Fetch candidate data
             logger.info(f"Fetching candidate data for {len(candidate_ids)} candidate(s): {candidate_ids}")
-            candidates_data = await self.search_service.get_candidates_by_ids(candidate_ids)
+            with timed_stage("candidate_fetch"):
+                candidates_data = await self.search_service.get_candidates_by_ids(candidate_ids)
 
             # Check for missing candidates
             missing_candidates = set(candidate_ids) - set(candidates_data.keys())
@@ -295,6 +441,7 @@ class EvaluationService:
                 result["agent_metadata"]["workflow"] = "id_based"
                 result["agent_metadata"]["rubric_id"] = rubric_id
                 result["agent_metadata"]["candidate_source"] = "azure_search"
+                result["agent_metadata"]["stage_timings_ms"] = stage_timings_metadata()
 
                 # Save to criteria_api and return evaluation ID
                 evaluation_id = await self.save_evaluation_to_criteria_api(
@@ -329,7 +476,8 @@ class EvaluationService:
                     rubric_name=rubric_id,  # Using rubric_id as rubric_name
                     comparison_mode=comparison_mode,
                     ranking_strategy=ranking_strategy,
-                    max_chunks=max_chunks
+                    max_chunks=max_chunks,
+                    top_k=top_k
                 )
 
                 # Add metadata about the ID-based workflow
@@ -338,6 +486,7 @@ class EvaluationService:
                 result["batch_metadata"]["workflow"] = "id_based"
                 result["batch_metadata"]["rubric_id"] = rubric_id
                 result["batch_metadata"]["candidate_source"] = "azure_search"
+                result["batch_metadata"]["stage_timings_ms"] = stage_timings_metadata()
 
                 # Save to criteria_api and return evaluation ID
                 evaluation_id = await self.save_evaluation_to_criteria_api(
@@ -353,6 +502,8 @@ class EvaluationService:
                     logger.warning("Failed to save evaluation to criteria_api, returning full result")
                     return result
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Evaluation failed: {e}", exc_info=True)
             return {"error": f"Evaluation failed: {str(e)}"}
@@ -398,6 +549,8 @@ class EvaluationService:
                     document_text, rubric_data, candidate_id, max_chunks
                 )
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error during document evaluation: {e}")
             return {
@@ -429,12 +582,24 @@ class EvaluationService:
 
         consensus_service = ConsensusEvaluationService(llm=self.llm)
 
-        result = await consensus_service.evaluate_with_consensus(
-            candidate_content=document_text,
-            rubric_data=rubric_data,
-            candidate_id=candidate_id,
-            max_rounds=2
-        )
+        if self.settings.consensus_mode == "self_consistency":
+            result = await consensus_service.evaluate_with_self_consistency(
+                candidate_content=document_text,
+                rubric_data=rubric_data,
+                candidate_id=candidate_id,
+                samples=self.settings.consensus_samples,
+                aggregation=self.settings.consensus_aggregation,
+                temperature=self.settings.consensus_sample_temperature
+            )
+            evaluation_type = "self_consistency"
+        else:
+            result = await consensus_service.evaluate_with_consensus(
+                candidate_content=document_text,
+                rubric_data=rubric_data,
+                candidate_id=candidate_id,
+                max_rounds=2
+            )
+            evaluation_type = "debate_style"
 
         # Add standard metadata
         result["candidate_id"] = candidate_id
@@ -442,7 +607,7 @@ class EvaluationService:
         if "agent_metadata" not in result:
             result["agent_metadata"] = {}
         result["agent_metadata"]["evaluation_model"] = "multi-agent-consensus"
-        result["agent_metadata"]["evaluation_type"] = "debate_style"
+        result["agent_metadata"]["evaluation_type"] = evaluation_type
 
         return result
 
@@ -458,23 +623,53 @@ class EvaluationService:
             rubric_name = rubric_data.get("rubric_name", "Unknown")
 
             # Step 2: Retrieve document chunks
-            document_chunks = await self._retrieve_chunks(
-                document_text, rubric_data, candidate_id, max_chunks
-            )
+            with timed_stage("retrieval"):
+                document_chunks = await self._retrieve_chunks(
+                    document_text, rubric_data, candidate_id, max_chunks
+                )
 
-            # Step 3: Evaluate all criteria at once
-            criteria_evaluations = await self._evaluate_criteria_batch(
-                rubric_data, document_chunks
-            )
+            # Step 3: Evaluate all criteria at once (fast tier first when cascading)
+            cascade_metadata: Dict[str, str] = {}
+            summary_llm = None
+            if self.fast_llm is not None:
+                criteria_evaluations, cascade_metadata = await self._evaluate_criteria_cascade(
+                    rubric_data, document_chunks
+                )
+                if cascade_metadata["cascade_tier"] == "fast":
+                    summary_llm = self.fast_llm
+            else:
+                criteria_evaluations = await self._evaluate_criteria_batch(
+                    rubric_data, document_chunks
+                )
 
             # Step 4: Create summary
             summary_data = await self._create_summary(
-                rubric_name, criteria_evaluations
+                rubric_name, criteria_evaluations, llm=summary_llm
             )
 
             # Step 5: Calculate overall score
             overall_score = self._calculate_overall_score(criteria_evaluations)
 
+            # Sanity check LLM scores against the rule-based pre-screen
+            prescreen_metadata: Dict[str, str] = {}
+            if self.llm is not None:
+                prescreen = self.prescreen_scorer.score(document_text, rubric_data)
+                divergence = abs(overall_score - prescreen.overall_score)
+                prescreen_metadata = {
+                    "prescreen_score": f"{prescreen.overall_score:.2f}",
+                    "prescreen_confidence": f"{prescreen.confidence:.2f}",
+                    "prescreen_divergence": f"{divergence:.2f}",
+                    "prescreen_flag": "true" if (
+                        prescreen.confidence >= self.settings.prescreen_min_confidence
+                        and divergence > self.settings.prescreen_divergence_threshold
+                    ) else "false",
+                }
+                if prescreen_metadata["prescreen_flag"] == "true":
+                    logger.warning(
+                        f"LLM score {overall_score:.2f} diverges from pre-screen "
+                        f"{prescreen.overall_score:.2f} for candidate {candidate_id}"
+                    )
+
             # Build result
             result = EvaluationResult(
                 overall_score=overall_score,
@@ -487,12 +682,16 @@ class EvaluationService:
                 agent_metadata={
                     "evaluation_model": "langchain-azure-openai",
                     "chunks_analyzed": str(len(document_chunks)),  # Convert to string
-                    "workflow": "standard_evaluation"
+                    "workflow": "standard_evaluation",
+                    **cascade_metadata,
+                    **prescreen_metadata
                 }
             )
 
             return result.dict()
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error during standard evaluation: {e}")
             return {
@@ -508,7 +707,8 @@ class EvaluationService:
         rubric_name: str,
         comparison_mode: ComparisonMode = ComparisonMode.DETERMINISTIC,
         ranking_strategy: RankingStrategy = RankingStrategy.OVERALL_SCORE,
-        max_chunks: int = 10
+        max_chunks: int = 10,
+        top_k: Optional[int] = None
     ) -> Dict[str, Any]:
         """Evaluate multiple documents against a rubric and compare results.
 
@@ -518,6 +718,8 @@ class EvaluationService:
             comparison_mode: Method for comparing documents (deterministic, LLM, etc.)
             ranking_strategy: Strategy for ranking documents
             max_chunks: Maximum chunks to retrieve per document
+            top_k: If set and TOPK_HEURISTIC_PRUNING is on, skip candidates the cheap stages
+                rank out of the top k before full evaluation (approximate)
 
         Returns:
             Batch evaluation results dictionary
@@ -538,11 +740,32 @@ class EvaluationService:
                     "batch_result": None
                 }
 
-            # Step 2: Evaluate each document in parallel
-            logger.info("Evaluating individual documents in parallel...")
-            individual_results = await self._evaluate_documents_parallel(
-                documents, rubric_name, max_chunks
-            )
+            # Step 2: Evaluate each document in parallel (progressively when only the top k matter)
+            top_k_metadata: Dict[str, str] = {}
+            pruned_candidates: List[PrunedCandidate] = []
+            prune = top_k is not None and top_k < len(documents)
+            if prune and ranking_strategy == RankingStrategy.OVERALL_SCORE and self.settings.topk_heuristic_pruning:
+                logger.info(f"Evaluating documents progressively for top {top_k}...")
+                individual_results, pruned_candidates, top_k_metadata = await self._evaluate_documents_top_k(
+                    documents, rubric_name, max_chunks, top_k
+                )
+            else:
+                if prune and ranking_strategy != RankingStrategy.OVERALL_SCORE:
+                    # Score bounds only apply to the overall score, other strategies need every evaluation
+                    top_k_metadata = {
+                        "top_k": str(top_k),
+                        "top_k_skipped_reason": f"ranking_strategy {ranking_strategy.value} requires full evaluations"
+                    }
+                elif prune:
+                    # The cheap stages' error is not bounded, so no candidate provably misses the top k
+                    top_k_metadata = {
+                        "top_k": str(top_k),
+                        "top_k_skipped_reason": "heuristic pruning disabled (TOPK_HEURISTIC_PRUNING)"
+                    }
+                logger.info("Evaluating individual documents in parallel...")
+                individual_results = await self._evaluate_documents_parallel(
+                    documents, rubric_name, max_chunks
+                )
 
             # Check if any evaluations failed
             failed_evaluations = [r for r in individual_results if "error" in r]
@@ -572,24 +795,36 @@ class EvaluationService:
                 evaluation_results, comparison_mode, ranking_strategy
             )
 
+            batch_metadata = {
+                "comparison_mode": comparison_mode.value,
+                "ranking_strategy": ranking_strategy.value,
+                "candidates_processed": str(len(evaluation_results)),
+                "candidates_failed": str(len(failed_evaluations)) if failed_evaluations else "0",
+                "evaluation_model": "langchain-azure-openai" if self.llm else "stub"
+            }
+            if self.fast_llm is not None and evaluation_results:
+                escalated = sum(
+                    1 for r in evaluation_results if r.agent_metadata.get("cascade_escalated") == "true"
+                )
+                batch_metadata["cascade_escalated"] = str(escalated)
+                batch_metadata["cascade_escalation_rate"] = f"{escalated / len(evaluation_results):.3f}"
+            batch_metadata.update(top_k_metadata)
+
             # Step 4: Build batch result
             batch_result = BatchEvaluationResult(
                 rubric_name=rubric_name,
-                total_candidates=len(documents),
+                total_candidates=len(evaluation_results) + len(pruned_candidates),
                 individual_results=evaluation_results,
+                pruned_candidates=pruned_candidates,
                 comparison_summary=comparison_summary,
-                batch_metadata={
-                    "comparison_mode": comparison_mode.value,
-                    "ranking_strategy": ranking_strategy.value,
-                    "candidates_processed": str(len(evaluation_results)),
-                    "candidates_failed": str(len(failed_evaluations)) if failed_evaluations else "0",
-                    "evaluation_model": "langchain-azure-openai" if self.llm else "stub"
-                }
+                batch_metadata=batch_metadata
             )
 
             logger.info(f"Batch evaluation completed successfully for {len(evaluation_results)} candidates")
             return batch_result.dict()
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error during batch evaluation: {e}")
             return {
@@ -623,6 +858,8 @@ class EvaluationService:
         # Handle any exceptions
         processed_results = []
         for i, result in enumerate(results):
+            if isinstance(result, DeadlineExceeded):
+                raise result
             if isinstance(result, Exception):
                 logger.error(f"Document {documents[i].candidate_id} evaluation failed: {result}")
                 processed_results.append({
@@ -634,6 +871,113 @@ class EvaluationService:
 
         return processed_results
 
+    async def _evaluate_documents_top_k(
+        self,
+        documents: List[CandidateInput],
+        rubric_name: str,
+        max_chunks: int,
+        top_k: int
+    ) -> Tuple[List[Dict[str, Any]], List[PrunedCandidate], Dict[str, str]]:
+        """Evaluate progressively, cheapest stage first, skipping candidates unlikely to reach the top k.
+
+        Stages are the rule-based pre-screen, the fast deployment (when
+        configured) and finally the full evaluation. Each cheap stage gives overall
+        score bounds of its score +/- a configured margin; a candidate is pruned once
+        its upper bound falls below the k-th best lower bound. The margins are
+        heuristics, not guarantees, so pruned candidates are returned with the
+        bounds they were pruned on.
+
+        Returns:
+            Tuple of full evaluation results for the survivors, the pruned
+            candidates and top-k batch metadata
+        """
+        rubric_data = await self._get_rubric_direct(rubric_name)
+        if not rubric_data:
+            # Let the regular path surface the missing rubric error per document
+            return await self._evaluate_documents_parallel(documents, rubric_name, max_chunks), [], {}
+
+        documents_by_id = {doc.candidate_id: doc for doc in documents}
+        pruned_by_stage: Dict[str, List[str]] = {}
+
+        def score_bounds(score: float, margin: float) -> Tuple[float, float]:
+            return max(1.0, score - margin), min(5.0, score + margin)
+
+        # Stage 1: rule-based level/keyword pre-screen
+        bounds = {
+            doc.candidate_id: score_bounds(
+                self.prescreen_scorer.score(doc.candidate_text, rubric_data).overall_score,
+                self.settings.topk_keyword_margin
+            )
+            for doc in documents
+        }
+        survivors = self.deterministic_analyzer.top_k_survivors(bounds, top_k)
+        pruned_by_stage["prescreen"] = [cid for cid in documents_by_id if cid not in survivors]
+
+        # Stage 2: fast deployment on the remaining candidates
+        if self.fast_llm is not None and len(survivors) > top_k:
+            fast_scores = await asyncio.gather(
+                *(self._fast_overall_score(documents_by_id[cid], rubric_data) for cid in survivors),
+                return_exceptions=True
+            )
+            for cid, score in zip(survivors, fast_scores):
+                if isinstance(score, DeadlineExceeded):
+                    raise score
+                if isinstance(score, Exception):
+                    logger.warning(f"Fast pre-score failed for {cid}, keeping keyword bounds: {score}")
+                    continue
+                bounds[cid] = score_bounds(score, self.settings.topk_fast_margin)
+            remaining = self.deterministic_analyzer.top_k_survivors(
+                {cid: bounds[cid] for cid in survivors}, top_k
+            )
+            pruned_by_stage["fast"] = [cid for cid in survivors if cid not in remaining]
+            survivors = remaining
+
+        # Stage 3: full evaluation of candidates that can still place
+        pruned = [cid for stage in pruned_by_stage.values() for cid in stage]
+        logger.info(
+            f"Top-{top_k} ranking: fully evaluating {len(survivors)}/{len(documents)} candidates, "
+            f"pruned {pruned}"
+        )
+        results = await self._evaluate_documents_parallel(
+            [documents_by_id[cid] for cid in survivors], rubric_name, max_chunks
+        )
+
+        pruned_candidates = [
+            PrunedCandidate(
+                candidate_id=cid,
+                pruned_at_stage=stage,
+                score_lower=round(bounds[cid][0], 3),
+                score_upper=round(bounds[cid][1], 3)
+            )
+            for stage, ids in pruned_by_stage.items()
+            for cid in ids
+        ]
+        metadata = {
+            "top_k": str(top_k),
+            "top_k_pruning": "approximate",
+            "top_k_full_evaluations": str(len(survivors)),
+            "top_k_evaluations_saved": str(len(pruned)),
+            "top_k_pruned": ",".join(pruned),
+            "top_k_pruned_by_stage": ",".join(
+                f"{stage}={len(ids)}" for stage, ids in pruned_by_stage.items()
+            ),
+        }
+        return results, pruned_candidates, metadata
+
+    async def _fast_overall_score(self, document: CandidateInput, rubric_data: Dict[str, Any]) -> float:
+        """Overall score from a single fast-deployment pass over the full document."""
+        chunks = [{
+            "chunk_id": "full_document",
+            "candidate_id": document.candidate_id,
+            "content": document.candidate_text,
+            "related_criterion": "all",
+            "score": 1.0
+        }]
+        fast_result = await self._invoke_batch_evaluation(
+            self.fast_llm, rubric_data, chunks, stage="topk_fast_score"
+        )
+        return self._calculate_overall_score(self._parse_batch_evaluation(rubric_data, fast_result))
+
     async def _perform_comparison_analysis(
         self,
         results: List[EvaluationResult],
@@ -682,20 +1026,26 @@ class EvaluationService:
 
         if self.search_service.enabled:
             # Search for chunks relevant to each criterion
-            for criterion in rubric_data["criteria"]:
-                query = f"{criterion['criterion_id']} {criterion['description']}"
-                search_results = await self.search_service.search(query, top=3)
-
-                for result in search_results:
-                    chunk = {
-                        "chunk_id": result.get("id", "unknown"),
-                        "candidate_id": candidate_id,
-                        "content": result.get("content", ""),
-                        "related_criterion": criterion["criterion_id"],
-                        "score": result.get("score", 0.0)
-                    }
-                    chunks.append(chunk)
-        else:
+            try:
+                for criterion in rubric_data["criteria"]:
+                    query = f"{criterion['criterion_id']} {criterion['description']}"
+                    search_results = await self.search_service.search(query, top=3)
+
+                    for result in search_results:
+                        chunk = {
+                            "chunk_id": result.get("id", "unknown"),
+                            "candidate_id": candidate_id,
+                            "content": result.get("content", ""),
+                            "related_criterion": criterion["criterion_id"],
+                            "score": result.get("score", 0.0)
+                        }
+                        chunks.append(chunk)
+            except CircuitOpenError as e:
+                # Search is down: evaluate against the whole document instead of waiting on retrieval
+                logger.warning(f"Search unavailable ({e}); using full document context")
+                chunks = []
+
+        if not chunks:
             # Use full document text as single chunk
             chunks = [{
                 "chunk_id": "full_document",
@@ -711,90 +1061,210 @@ class EvaluationService:
     async def _evaluate_criteria_batch(
         self,
         rubric_data: Dict[str, Any],
-        document_chunks: List[Dict[str, Any]]
+        document_chunks: List[Dict[str, Any]],
+        llm: Optional[Any] = None
     ) -> List[CriterionEvaluation]:
         """Evaluate all criteria in a single LLM call."""
-        if self.llm is None:
-            # Return stub evaluations
-            return self._create_stub_evaluations(rubric_data)
+        llm = llm or self.llm
+        if llm is None:
+            # Offline: score with the rule-based pre-screen
+            return self._create_prescreen_evaluations(rubric_data, document_chunks)
 
         try:
-            # Prepare document content
-            document_content = "\n\n".join([
-                f"[Chunk {i+1} - Related to {chunk.get('related_criterion', 'all')}]: {chunk['content']}"
-                for i, chunk in enumerate(document_chunks)
-            ])
+            batch_result = await self._invoke_batch_evaluation(llm, rubric_data, document_chunks)
+            evaluations = self._parse_batch_evaluation(rubric_data, batch_result)
+            logger.info(f"Completed batch evaluation of {len(evaluations)} criteria")
+            return evaluations
 
-            # Prepare criteria details
-            criteria_details = "\n\n".join([
-                f"Criterion: {criterion['criterion_id']}\n"
-                f"Weight: {criterion['weight']}\n"
-                f"Description: {criterion['description']}\n"
-                f"Definition: {criterion.get('scoring_criteria', criterion.get('definition', 'Standard 1-5 scale'))}"
-                for criterion in rubric_data["criteria"]
-            ])
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error in batch evaluation: {e}")
+            return self._create_prescreen_evaluations(rubric_data, document_chunks)
 
-            # Create evaluation chain
-            from langchain_core.output_parsers import JsonOutputParser
-            chain = self.batch_evaluation_template | self.llm | JsonOutputParser()
-
-            # Run evaluation
-            batch_result = await chain.ainvoke({
-                "rubric_name": rubric_data["rubric_name"],
-                "rubric_description": rubric_data.get("description", ""),
-                "criteria_details": criteria_details,
-                "document_content": document_content
-            })
-
-            # Process results
-            evaluations = []
-            results_by_name = {
-                eval_result["criterion_name"]: eval_result
-                for eval_result in batch_result["evaluation"]
-            }
+    async def _invoke_batch_evaluation(
+        self,
+        llm: Any,
+        rubric_data: Dict[str, Any],
+        document_chunks: List[Dict[str, Any]],
+        stage: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the batch evaluation prompt against the given LLM and return the parsed JSON.
 
-            for criterion in rubric_data["criteria"]:
-                criterion_id = criterion["criterion_id"]
-                criterion_name = criterion.get("name", criterion_id)  # Use name if available, fallback to ID
-
-                if criterion_name in results_by_name:
-                    result = results_by_name[criterion_name]
-                    evaluation = CriterionEvaluation(
-                        criterion_name=criterion_name,
-                        criterion_description=criterion["description"],
-                        weight=criterion["weight"],
-                        score=result["score"],
-                        reasoning=result["reasoning"],
-                        evidence=result["evidence"]
-                    )
-                    evaluations.append(evaluation)
-                else:
-                    # Create default evaluation
-                    logger.warning(f"Missing evaluation for criterion: {criterion_name}")
-                    evaluation = CriterionEvaluation(
-                        criterion_name=criterion_name,
-                        criterion_description=criterion["description"],
-                        weight=criterion["weight"],
-                        score=1.0,
-                        reasoning="Evaluation not provided by model",
-                        evidence=[]
-                    )
-                    evaluations.append(evaluation)
+        Args:
+            llm: LLM to call
+            rubric_data: Rubric with criteria
+            document_chunks: Chunks to evaluate
+            stage: Scheduler/hedging stage name (defaults to the LLM's cascade tier)
+        """
+        inputs = build_batch_evaluation_inputs(rubric_data, document_chunks)
+
+        # Create evaluation chain
+        from langchain_core.output_parsers import JsonOutputParser
+        chain = self.batch_evaluation_template | llm | JsonOutputParser()
+        hedge_chain = self.batch_evaluation_template | self._hedge_llm_for(llm) | JsonOutputParser()
+
+        # Run evaluation
+        return await run_llm_call(
+            stage or self._tier_stage("batch_evaluation", llm),
+            lambda: chain.ainvoke(inputs),
+            hedge_factory=lambda: hedge_chain.ainvoke(inputs)
+        )
 
-            logger.info(f"Completed batch evaluation of {len(evaluations)} criteria")
-            return evaluations
+    def _hedge_llm_for(self, llm: Any) -> Any:
+        """LLM that hedged duplicates of calls to ``llm`` go to."""
+        return self.hedge_llm if llm is self.llm and self.hedge_llm is not None else llm
+
+    def _tier_stage(self, stage: str, llm: Any) -> str:
+        """Stage name qualified by cascade tier, so each tier keeps its own latency stats."""
+        if self.fast_llm is None:
+            return stage
+        return f"{stage}_fast" if llm is self.fast_llm else f"{stage}_strong"
+
+    def _parse_batch_evaluation(
+        self,
+        rubric_data: Dict[str, Any],
+        batch_result: Dict[str, Any]
+    ) -> List[CriterionEvaluation]:
+        """Map a batch evaluation response onto the rubric criteria."""
+        evaluations = []
+        results_by_name = {
+            eval_result["criterion_name"]: eval_result
+            for eval_result in batch_result["evaluation"]
+        }
+
+        for criterion in rubric_data["criteria"]:
+            criterion_id = criterion["criterion_id"]
+            criterion_name = criterion.get("name", criterion_id)  # Use name if available, fallback to ID
+
+            if criterion_name in results_by_name:
+                result = results_by_name[criterion_name]
+                evaluation = CriterionEvaluation(
+                    criterion_name=criterion_name,
+                    criterion_description=criterion["description"],
+                    weight=criterion["weight"],
+                    score=result["score"],
+                    reasoning=result["reasoning"],
+                    evidence=result["evidence"]
+                )
+                evaluations.append(evaluation)
+            else:
+                # Create default evaluation
+                logger.warning(f"Missing evaluation for criterion: {criterion_name}")
+                evaluation = CriterionEvaluation(
+                    criterion_name=criterion_name,
+                    criterion_description=criterion["description"],
+                    weight=criterion["weight"],
+                    score=1.0,
+                    reasoning="Evaluation not provided by model",
+                    evidence=[]
+                )
+                evaluations.append(evaluation)
+
+        return evaluations
+
+    async def _evaluate_criteria_cascade(
+        self,
+        rubric_data: Dict[str, Any],
+        document_chunks: List[Dict[str, Any]]
+    ) -> Tuple[List[CriterionEvaluation], Dict[str, str]]:
+        """Score with the fast deployment and escalate to the strong one only when needed.
+
+        If the strong deployment fails too, the fast result is kept (``fast_fallback``)
+        or, without one, the rule-based pre-screen is used (``prescreen_fallback``);
+        neither counts as an escalation.
 
+        Returns:
+            Tuple of criterion evaluations and cascade metadata for agent_metadata
+        """
+        evaluations: List[CriterionEvaluation] = []
+        try:
+            fast_result = await self._invoke_batch_evaluation(self.fast_llm, rubric_data, document_chunks)
+            evaluations = self._parse_batch_evaluation(rubric_data, fast_result)
+            reason = self._cascade_escalation_reason(rubric_data, fast_result, evaluations)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error in batch evaluation: {e}")
-            return self._create_stub_evaluations(rubric_data)
+            logger.warning(f"Fast tier evaluation failed, escalating: {e}")
+            reason = "fast_tier_error"
+
+        self.cascade_stats["evaluated"] += 1
+        tier = "fast"
+        if reason is not None:
+            logger.info(f"Cascade escalating to strong deployment: {reason}")
+            try:
+                strong_result = await self._invoke_batch_evaluation(self.llm, rubric_data, document_chunks)
+                evaluations = self._parse_batch_evaluation(rubric_data, strong_result)
+                tier = "strong"
+                self.cascade_stats["escalated"] += 1
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                logger.error(f"Strong tier evaluation failed: {e}")
+                if evaluations:
+                    tier = "fast_fallback"
+                else:
+                    tier = "prescreen_fallback"
+                    evaluations = self._create_prescreen_evaluations(rubric_data, document_chunks)
+
+        metadata = {
+            "cascade_tier": tier,
+            "cascade_escalated": "true" if tier == "strong" else "false",
+            "cascade_escalation_reason": reason or "none",
+            "cascade_escalation_rate": (
+                f"{self.cascade_stats['escalated'] / self.cascade_stats['evaluated']:.3f}"
+            ),
+        }
+        return evaluations, metadata
+
+    def _cascade_escalation_reason(
+        self,
+        rubric_data: Dict[str, Any],
+        fast_result: Dict[str, Any],
+        evaluations: List[CriterionEvaluation]
+    ) -> Optional[str]:
+        """Return why a fast-tier result needs the strong deployment, or None if it can stand."""
+        settings = self.settings
+        reported = {
+            item.get("criterion_name"): item for item in fast_result.get("evaluation", [])
+            if isinstance(item, dict)
+        }
+
+        # Low confidence: self-reported, or criteria the model skipped or gave no confidence for
+        confidences = []
+        for criterion in rubric_data["criteria"]:
+            item = reported.get(criterion.get("name", criterion["criterion_id"]))
+            if item is None or item.get("confidence") is None:
+                return "missing_confidence"
+            try:
+                confidences.append(float(item["confidence"]))
+            except (TypeError, ValueError):
+                return "missing_confidence"
+        if confidences and min(confidences) < settings.cascade_min_confidence:
+            return "low_confidence"
+
+        # Overall score close to a decision boundary
+        overall_score = self._calculate_overall_score(evaluations)
+        for boundary in settings.cascade_decision_boundaries:
+            if abs(overall_score - boundary) <= settings.cascade_boundary_margin:
+                return "near_boundary"
+
+        # Criteria pulling in different directions
+        scores = [e.score for e in evaluations]
+        if len(scores) > 1 and statistics.stdev(scores) > settings.cascade_max_criteria_stdev:
+            return "criteria_disagree"
+
+        return None
 
     async def _create_summary(
         self,
         rubric_name: str,
-        criteria_evaluations: List[CriterionEvaluation]
+        criteria_evaluations: List[CriterionEvaluation],
+        llm: Optional[Any] = None
     ) -> Dict[str, Any]:
         """Create evaluation summary."""
-        if self.llm is None:
+        llm = llm or self.llm
+        if llm is None:
             return {
                 "summary": f"Stub evaluation summary for {rubric_name}",
                 "strengths": ["Placeholder strength"],
@@ -809,16 +1279,24 @@ class EvaluationService:
             ])
 
             from langchain_core.output_parsers import JsonOutputParser
-            chain = self.summary_template | self.llm | JsonOutputParser()
-
-            summary_result = await chain.ainvoke({
+            chain = self.summary_template | llm | JsonOutputParser()
+            hedge_chain = self.summary_template | self._hedge_llm_for(llm) | JsonOutputParser()
+            inputs = {
                 "rubric_name": rubric_name,
                 "overall_score": overall_score,
                 "evaluations_summary": evaluations_summary
-            })
+            }
+
+            summary_result = await run_llm_call(
+                self._tier_stage("summary", llm),
+                lambda: chain.ainvoke(inputs),
+                hedge_factory=lambda: hedge_chain.ainvoke(inputs)
+            )
 
             return summary_result
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating summary: {e}")
             return {
@@ -837,43 +1315,46 @@ class EvaluationService:
 
         return total_weighted_score / total_weight if total_weight > 0 else 0.0
 
-    def _create_stub_evaluations(self, rubric_data: Dict[str, Any]) -> List[CriterionEvaluation]:
-        """Create stub evaluations when LLM is not available."""
-        evaluations = []
-        for criterion in rubric_data["criteria"]:
-            criterion_name = criterion.get("name", criterion["criterion_id"])
-            evaluation = CriterionEvaluation(
-                criterion_name=criterion_name,
-                criterion_description=criterion["description"],
-                weight=criterion["weight"],
-                score=3.0,  # Default middle score
-                reasoning=f"Stub evaluation for {criterion_name}",
-                evidence=["Placeholder evidence"]
-            )
-            evaluations.append(evaluation)
-        return evaluations
+    def _create_prescreen_evaluations(
+        self,
+        rubric_data: Dict[str, Any],
+        document_chunks: List[Dict[str, Any]]
+    ) -> List[CriterionEvaluation]:
+        """Create rule-based evaluations when the LLM is not available."""
+        document_text = "\n".join(chunk.get("content", "") for chunk in document_chunks)
+        prescreen = self.prescreen_scorer.score(document_text, rubric_data)
+        return self.prescreen_scorer.to_criterion_evaluations(prescreen, rubric_data)
 
     async def list_rubrics(self) -> List[Dict[str, Any]]:
         """List available rubrics from criteria_api."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.criteria_api_url}/rubrics/")
-                response.raise_for_status()
-                rubrics = response.json()
-
-                # Transform to simple list format
-                return [
-                    {
-                        "rubric_name": rubric["name"],
-                        "rubric_id": rubric["id"],
-                        "domain": "General",  # criteria_api doesn't have domain field
-                        "version": rubric["version"],
-                        "description": rubric["description"],
-                        "published": rubric["published"],
-                        "created_at": rubric["createdAt"]
-                    }
-                    for rubric in rubrics
-                ]
+            rubrics: List[Dict[str, Any]] = []
+            with self.criteria_api_breaker.guard():
+                async with upstream_client(30.0) as client:
+                    # criteria_api pages its lists; follow the cursor to the last page
+                    params: Dict[str, str] = {}
+                    while True:
+                        response = await client.get(f"{self.criteria_api_url}/rubrics/", params=params)
+                        response.raise_for_status()
+                        rubrics.extend(response.json())
+                        next_cursor = response.headers.get("X-Next-Cursor")
+                        if not next_cursor:
+                            break
+                        params = {"cursor": next_cursor}
+
+            # Transform to simple list format
+            return [
+                {
+                    "rubric_name": rubric["name"],
+                    "rubric_id": rubric["id"],
+                    "domain": "General",  # criteria_api doesn't have domain field
+                    "version": rubric["version"],
+                    "description": rubric["description"],
+                    "published": rubric["published"],
+                    "created_at": rubric["createdAt"]
+                }
+                for rubric in rubrics
+            ]
         except Exception as e:
             logger.error(f"Error listing rubrics: {e}")
             return []
@@ -0,0 +1,133 @@
+"""
+Hedged LLM requests.
+
+A few LLM calls take several times the median and dominate tail latency. For
+idempotent calls, if the primary has not returned by the observed p90 latency
+of its stage, a duplicate is sent (optionally to a second deployment); the
+first successful response wins and the other call is cancelled. Hedges are
+capped at a fraction of all calls so they cannot snowball under load.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LLMHedger:
+    """Per-stage latency tracking and hedge decisions."""
+
+    def __init__(self, percentile: float = 0.9, max_ratio: float = 0.1, min_samples: int = 20):
+        """Initialize hedger.
+
+        Args:
+            percentile: Stage latency percentile after which a duplicate is sent
+            max_ratio: Maximum hedges as a fraction of hedgeable calls
+            min_samples: Latency samples a stage needs before it is hedged
+        """
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self._latencies: Dict[str, Deque[float]] = {}
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self, stage: str) -> Optional[float]:
+        """Seconds to wait before hedging a call in ``stage``, or None if it is not hedged yet."""
+        samples = self._latencies.get(stage)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+    def _record(self, stage: str, latency: float) -> None:
+        self._latencies.setdefault(stage, deque(maxlen=200)).append(latency)
+
+    def _within_budget(self) -> bool:
+        return self.hedges < self.max_ratio * self.calls
+
+    async def run(
+        self,
+        stage: str,
+        factory: Callable[[], Awaitable[T]],
+        hedge_factory: Optional[Callable[[], Awaitable[T]]] = None
+    ) -> T:
+        """Run an idempotent call, hedging it if it runs past the stage's p90.
+
+        Args:
+            stage: Pipeline stage name (latency percentiles are tracked per stage)
+            factory: Coroutine function performing the call
+            hedge_factory: Coroutine function for the duplicate (defaults to ``factory``)
+
+        Returns:
+            The first successful response
+        """
+        self.calls += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(factory())
+        delay = self.hedge_delay(stage)
+        tasks = {primary}
+        hedge: Optional[asyncio.Future] = None
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._within_budget():
+                    self.hedges += 1
+                    logger.info(f"Hedging LLM call '{stage}' after {delay:.2f}s")
+                    hedge = asyncio.ensure_future((hedge_factory or factory)())
+                    tasks.add(hedge)
+
+            error: Optional[BaseException] = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        self._record(stage, time.monotonic() - started)
+                        return task.result()
+                    # Report the primary's error if both attempts fail
+                    if error is None or task is primary:
+                        error = task.exception()
+            raise error  # type: ignore[misc]
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hedge and win counters and rates, plus the current per-stage hedge delay."""
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": round(self.hedges / self.calls, 4) if self.calls else 0.0,
+            "win_rate": round(self.hedge_wins / self.hedges, 4) if self.hedges else 0.0,
+            "hedge_delay_ms": {
+                stage: round(delay * 1000, 1)
+                for stage in self._latencies
+                if (delay := self.hedge_delay(stage)) is not None
+            },
+        }
+
+
+@lru_cache(maxsize=1)
+def get_llm_hedger() -> Optional[LLMHedger]:
+    """Get singleton hedger, or None when hedging is disabled."""
+    settings = get_settings()
+    if not settings.llm_hedging_enabled:
+        return None
+    return LLMHedger(
+        percentile=settings.llm_hedge_percentile,
+        max_ratio=settings.llm_hedge_max_ratio,
+        min_samples=settings.llm_hedge_min_samples
+    )
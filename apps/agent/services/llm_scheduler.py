@@ -0,0 +1,232 @@
+"""
+LLM call scheduler with priority classes.
+
+Every LLM call goes through ``run_llm_call`` so deployment capacity is shared by
+weighted fair queuing across priority classes (interactive, batch, background)
+with per-class concurrency caps. A bulk re-evaluation can saturate its own
+lane without interactive requests queuing behind it. The total limit is an
+adaptive AIMD window (see ``adaptive_limiter``) bounded by the configured maximum.
+
+The priority of the current request is carried in a context variable, so code
+deep in the evaluation pipeline does not need to thread it through.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from config import get_settings
+from models.invoke import PriorityClass
+from services.adaptive_limiter import AIMDLimiter
+from services.deadline import run_with_deadline
+from services.llm_hedging import get_llm_hedger
+from services.stage_timings import timed_stage
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+current_priority: contextvars.ContextVar[PriorityClass] = contextvars.ContextVar(
+    "current_priority", default=PriorityClass.INTERACTIVE
+)
+
+
+class LLMScheduler:
+    """Weighted fair queuing of LLM calls across priority classes."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        weights: Dict[PriorityClass, float],
+        caps: Dict[PriorityClass, int],
+        limiter: Optional[AIMDLimiter] = None
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrency: Total concurrent LLM calls allowed
+            weights: Share of capacity each class receives when all are busy
+            caps: Maximum concurrent calls per class
+            limiter: Optional adaptive window replacing ``max_concurrency`` as the total limit
+        """
+        self.max_concurrency = max_concurrency
+        self.limiter = limiter
+        self.weights = {c: max(weights.get(c, 1.0), 1e-6) for c in PriorityClass}
+        self.caps = {c: caps.get(c, max_concurrency) for c in PriorityClass}
+
+        # Per-class FIFO of (finish_tag, future); finish tags implement WFQ ordering
+        self._queues: Dict[PriorityClass, Deque[Tuple[float, asyncio.Future]]] = {c: deque() for c in PriorityClass}
+        self._running: Dict[PriorityClass, int] = {c: 0 for c in PriorityClass}
+        self._last_finish: Dict[PriorityClass, float] = {c: 0.0 for c in PriorityClass}
+        self._virtual_time = 0.0
+
+        self._completed: Dict[PriorityClass, int] = {c: 0 for c in PriorityClass}
+        self._waits: Dict[PriorityClass, Deque[float]] = {c: deque(maxlen=500) for c in PriorityClass}
+
+    @property
+    def total_running(self) -> int:
+        return sum(self._running.values())
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current total limit: the adaptive window if enabled, else the static maximum."""
+        return self.limiter.limit if self.limiter else self.max_concurrency
+
+    def _can_start(self, priority: PriorityClass) -> bool:
+        return self.total_running < self.concurrency_limit and self._running[priority] < self.caps[priority]
+
+    def _dispatch(self) -> None:
+        """Grant free slots to waiting calls in finish-tag order, skipping capped classes."""
+        while self.total_running < self.concurrency_limit:
+            candidates = []
+            for priority, queue in self._queues.items():
+                # Drop waiters that gave up
+                while queue and queue[0][1].done():
+                    queue.popleft()
+                if queue and self._running[priority] < self.caps[priority]:
+                    candidates.append((queue[0][0], priority))
+            if not candidates:
+                return
+            finish_tag, priority = min(candidates, key=lambda item: item[0])
+            _, future = self._queues[priority].popleft()
+            self._virtual_time = max(self._virtual_time, finish_tag)
+            self._running[priority] += 1
+            future.set_result(None)
+
+    async def acquire(self, priority: PriorityClass) -> None:
+        """Wait for an LLM slot in the given class."""
+        if self._can_start(priority) and not any(self._queues.values()):
+            self._running[priority] += 1
+            return
+
+        start_tag = max(self._virtual_time, self._last_finish[priority])
+        finish_tag = start_tag + 1.0 / self.weights[priority]
+        self._last_finish[priority] = finish_tag
+        future = asyncio.get_running_loop().create_future()
+        self._queues[priority].append((finish_tag, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just as we were cancelled; hand it on
+                self.release(priority)
+            raise
+
+    def release(self, priority: PriorityClass) -> None:
+        """Return an LLM slot and wake the next eligible waiter."""
+        self._running[priority] -= 1
+        self._completed[priority] += 1
+        self._dispatch()
+
+    async def run(
+        self,
+        stage: str,
+        factory: Callable[[], Awaitable[T]],
+        priority: Optional[PriorityClass] = None
+    ) -> T:
+        """Run one LLM call under the scheduler.
+
+        Args:
+            stage: Pipeline stage name (for logging and metrics)
+            factory: Coroutine function performing the LLM call
+            priority: Class to schedule under (defaults to the request's context)
+
+        Returns:
+            Whatever the LLM call returns
+        """
+        priority = priority or current_priority.get()
+        queued_at = time.monotonic()
+        await self.acquire(priority)
+        waited = time.monotonic() - queued_at
+        self._waits[priority].append(waited)
+        if waited > 1.0:
+            logger.info(f"LLM call '{stage}' ({priority.value}) waited {waited:.2f}s for capacity")
+        started_at = time.monotonic()
+        try:
+            result = await factory()
+        except BaseException as e:
+            if self.limiter:
+                self.limiter.on_failure(stage, started_at, e)
+            raise
+        finally:
+            self.release(priority)
+        if self.limiter:
+            self.limiter.on_success(stage, started_at, time.monotonic() - started_at)
+            self._dispatch()  # The window may have grown
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, running calls and wait percentiles per class."""
+        stats: Dict[str, Any] = {
+            "max_concurrency": self.max_concurrency,
+            "concurrency_limit": self.concurrency_limit,
+            "running": self.total_running,
+            "classes": {}
+        }
+        if self.limiter:
+            stats["adaptive"] = self.limiter.get_stats()
+        for priority in PriorityClass:
+            waits = sorted(self._waits[priority])
+            stats["classes"][priority.value] = {
+                "weight": self.weights[priority],
+                "cap": self.caps[priority],
+                "running": self._running[priority],
+                "queued": sum(1 for _, f in self._queues[priority] if not f.done()),
+                "completed": self._completed[priority],
+                "wait_p50_ms": round(waits[len(waits) // 2] * 1000, 1) if waits else 0.0,
+                "wait_p95_ms": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))] * 1000, 1) if waits else 0.0,
+            }
+        return stats
+
+
+@lru_cache(maxsize=1)
+def get_llm_scheduler() -> LLMScheduler:
+    """Get singleton LLM scheduler instance."""
+    settings = get_settings()
+    return LLMScheduler(
+        max_concurrency=settings.llm_max_concurrency,
+        weights={PriorityClass(k): v for k, v in settings.llm_priority_weights.items()},
+        caps={PriorityClass(k): v for k, v in settings.llm_priority_caps.items()},
+        limiter=AIMDLimiter(
+            min_limit=settings.llm_min_concurrency,
+            max_limit=settings.llm_max_concurrency,
+            decrease_factor=settings.llm_aimd_decrease_factor,
+            latency_spike_factor=settings.llm_latency_spike_factor
+        ) if settings.llm_adaptive_concurrency else None
+    )
+
+
+async def run_llm_call(
+    stage: str,
+    factory: Callable[[], Awaitable[T]],
+    hedge_factory: Optional[Callable[[], Awaitable[T]]] = None
+) -> T:
+    """Run an LLM call through the shared scheduler (the single choke point for LLM traffic).
+
+    Queueing and the call itself are bounded by the remaining request deadline.
+
+    Args:
+        stage: Pipeline stage name
+        factory: Coroutine function performing the call
+        hedge_factory: Duplicate of the call for hedging; passing one marks the call
+            idempotent (it may be sent twice when hedging is enabled). The duplicate
+            queues for its own slot, so it counts against the adaptive window and
+            the class cap like any other call.
+    """
+    scheduler = get_llm_scheduler()
+    hedger = get_llm_hedger()
+    call = factory
+    if hedger is not None and hedge_factory is not None:
+        def hedge() -> Awaitable[T]:
+            return scheduler.run(stage, hedge_factory)
+
+        def call() -> Awaitable[T]:
+            return hedger.run(stage, factory, hedge)
+
+    with timed_stage(f"llm_{stage}"):
+        return await run_with_deadline(stage, scheduler.run(stage, call))
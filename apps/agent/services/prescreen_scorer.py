@@ -0,0 +1,286 @@
+"""
+Rule-based pre-screen scorer for rubric criteria.
+
+Criterion definitions carry level descriptors such as::
+
+    Levels:
+    5 - Excellent: OLED/QLED, deep blacks, wide color gamut
+    5 - Excellent: <=5ms, 120Hz, VRR, ALLM
+
+Each descriptor is compiled once per rubric version into token and numeric
+matchers, so candidates can be scored without any LLM call. Used as a triage
+stage for top-k ranking, as the offline fallback when no LLM is configured and
+as a sanity check against LLM scores.
+"""
+
+import hashlib
+import logging
+import operator
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+
+from models.invoke import CriterionEvaluation
+
+logger = logging.getLogger(__name__)
+
+_LEVEL_LINE = re.compile(r"^\s*([1-5])\s*-\s*([^:]+):\s*(.+?)\s*$")
+_NUMERIC = re.compile(r"(<=|>=|<|>|~)?\s*(\d+(?:\.\d+)?)([a-z%]+)\b")
+_TOKEN = re.compile(r"[a-z0-9]+")
+_FRAGMENT_SPLIT = re.compile(r"[,/;+()]|\band\b|\bwith\b|\bor\b")
+
+_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "but", "not", "are", "was", "has", "have", "some",
+    "most", "more", "less", "very", "only", "into", "from", "that", "this", "over",
+    "under", "without", "full", "clear", "good", "poor", "fair", "excellent",
+})
+
+_COMPARATORS: Dict[str, Callable[[float, float], bool]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "<": operator.lt,
+    ">": operator.gt,
+    "~": lambda found, target: abs(found - target) <= max(1.0, target * 0.25),
+    "": lambda found, target: abs(found - target) <= max(0.5, target * 0.05),
+}
+
+# Numeric facts ("120Hz", "<=5ms") are stronger evidence than single words
+_NUMERIC_WEIGHT = 2.0
+_NEUTRAL_SCORE = 3.0
+
+
+@dataclass(frozen=True)
+class NumericRule:
+    """A compiled numeric descriptor such as ``<=5ms``."""
+    op: str
+    value: float
+    pattern: "re.Pattern[str]"
+
+    def matches(self, text: str) -> bool:
+        compare = _COMPARATORS[self.op]
+        return any(compare(float(found), self.value) for found in self.pattern.findall(text))
+
+
+@dataclass
+class LevelMatcher:
+    """Matchers for one level of one criterion."""
+    score: int
+    label: str
+    tokens: Dict[str, float] = field(default_factory=dict)  # token -> discriminative weight
+    numeric: List[NumericRule] = field(default_factory=list)
+
+    @property
+    def total_weight(self) -> float:
+        return sum(self.tokens.values()) + _NUMERIC_WEIGHT * len(self.numeric)
+
+
+@dataclass
+class CompiledCriterion:
+    """All level matchers for one criterion (or bare keywords when it has no levels)."""
+    name: str
+    weight: float
+    levels: List[LevelMatcher]
+    keywords: frozenset = frozenset()
+
+
+@dataclass
+class CriterionPrescreen:
+    """Pre-screen outcome for one criterion."""
+    criterion_name: str
+    score: float
+    confidence: float  # 0 when nothing in the text matched any descriptor
+    matched: List[str]
+
+
+@dataclass
+class PrescreenResult:
+    """Pre-screen outcome for a candidate against a rubric."""
+    overall_score: float
+    confidence: float
+    criteria: List[CriterionPrescreen]
+
+
+def _tokens(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall(text.lower()) if len(t) >= 3 and t not in _STOPWORDS]
+
+
+def _compile_levels(definition: str) -> List[LevelMatcher]:
+    levels: List[LevelMatcher] = []
+    for line in (definition or "").splitlines():
+        match = _LEVEL_LINE.match(line)
+        if not match:
+            continue
+        level = LevelMatcher(score=int(match.group(1)), label=match.group(2).strip())
+        descriptor = match.group(3).lower()
+        for fragment in _FRAGMENT_SPLIT.split(descriptor):
+            for op, value, unit in _NUMERIC.findall(fragment):
+                level.numeric.append(NumericRule(
+                    op=op,
+                    value=float(value),
+                    pattern=re.compile(rf"(\d+(?:\.\d+)?)\s*{re.escape(unit)}\b")
+                ))
+            for token in _tokens(_NUMERIC.sub(" ", fragment)):
+                level.tokens[token] = 1.0
+        levels.append(level)
+
+    # Tokens shared by several levels ("lag", "4k") say little about which level applies
+    counts: Dict[str, int] = {}
+    for level in levels:
+        for token in level.tokens:
+            counts[token] = counts.get(token, 0) + 1
+    for level in levels:
+        level.tokens = {token: 1.0 / counts[token] for token in level.tokens}
+    return levels
+
+
+def _compile_criterion(criterion: Dict[str, Any]) -> CompiledCriterion:
+    name = criterion.get("name", criterion.get("criterion_id", "Unknown"))
+    levels = _compile_levels(criterion.get("definition", ""))
+    keywords = frozenset()
+    if not levels:
+        keywords = frozenset(_tokens(f"{criterion.get('description', '')} {criterion.get('definition', '')}"))
+    return CompiledCriterion(
+        name=name,
+        weight=float(criterion.get("weight", 1.0)),
+        levels=levels,
+        keywords=keywords,
+    )
+
+
+class PrescreenScorer:
+    """Scores candidate text against compiled rubric level descriptors."""
+
+    def __init__(self, max_rubrics: int = 64):
+        """Initialize scorer.
+
+        Args:
+            max_rubrics: Number of compiled rubric versions kept in memory
+        """
+        self.max_rubrics = max_rubrics
+        self._compiled: "OrderedDict[Tuple[str, ...], List[CompiledCriterion]]" = OrderedDict()
+
+    def _cache_key(self, rubric_data: Dict[str, Any]) -> Tuple[str, ...]:
+        """Rubric identity and version; drafts without a version fall back to a definition hash."""
+        digest = hashlib.sha1()
+        for criterion in rubric_data.get("criteria", []):
+            digest.update(f"{criterion.get('name')}|{criterion.get('weight')}|{criterion.get('definition')}\n".encode())
+        return (
+            str(rubric_data.get("rubric_id", "")),
+            str(rubric_data.get("version", "")),
+            str(rubric_data.get("updated_at", "")),
+            digest.hexdigest(),
+        )
+
+    def compile(self, rubric_data: Dict[str, Any]) -> List[CompiledCriterion]:
+        """Compile (or fetch cached) matchers for a rubric version."""
+        key = self._cache_key(rubric_data)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            self._compiled.move_to_end(key)
+            return compiled
+
+        compiled = [_compile_criterion(c) for c in rubric_data.get("criteria", [])]
+        self._compiled[key] = compiled
+        if len(self._compiled) > self.max_rubrics:
+            self._compiled.popitem(last=False)
+        logger.debug(f"Compiled pre-screen matchers for rubric {key[0] or rubric_data.get('rubric_name')}")
+        return compiled
+
+    def score(self, document_text: str, rubric_data: Dict[str, Any]) -> PrescreenResult:
+        """Score a candidate against every criterion of the rubric.
+
+        Args:
+            document_text: Candidate text
+            rubric_data: Rubric in the agent's evaluation format
+
+        Returns:
+            Per-criterion scores with confidence and the descriptors that matched
+        """
+        text = document_text.lower()
+        document_tokens = set(_TOKEN.findall(text))
+
+        compiled = self.compile(rubric_data)
+        criteria_results = [
+            self._score_criterion(criterion, text, document_tokens) for criterion in compiled
+        ]
+
+        total_weight = sum(c.weight for c in compiled) or 1.0
+        overall = sum(r.score * c.weight for r, c in zip(criteria_results, compiled)) / total_weight
+        confidence = sum(r.confidence * c.weight for r, c in zip(criteria_results, compiled)) / total_weight
+        return PrescreenResult(overall_score=overall, confidence=confidence, criteria=criteria_results)
+
+    def _score_criterion(
+        self,
+        criterion: CompiledCriterion,
+        text: str,
+        document_tokens: set
+    ) -> CriterionPrescreen:
+        if not criterion.levels:
+            # No level descriptors: keyword coverage mapped onto the 1-5 scale
+            if not criterion.keywords:
+                return CriterionPrescreen(criterion.name, _NEUTRAL_SCORE, 0.0, [])
+            matched = sorted(criterion.keywords & document_tokens)
+            coverage = len(matched) / len(criterion.keywords)
+            return CriterionPrescreen(criterion.name, 1.0 + 4.0 * coverage, min(1.0, coverage), matched)
+
+        weighted_sum = 0.0
+        strength_sum = 0.0
+        best_strength = 0.0
+        matched: List[str] = []
+        for level in criterion.levels:
+            if level.total_weight <= 0:
+                continue
+            hit = 0.0
+            for token, weight in level.tokens.items():
+                if token in document_tokens:
+                    hit += weight
+                    matched.append(token)
+            for rule in level.numeric:
+                if rule.matches(text):
+                    hit += _NUMERIC_WEIGHT
+                    matched.append(f"{rule.op}{rule.value:g}")
+            strength = hit / level.total_weight
+            weighted_sum += level.score * strength
+            strength_sum += strength
+            best_strength = max(best_strength, strength)
+
+        if strength_sum == 0:
+            return CriterionPrescreen(criterion.name, _NEUTRAL_SCORE, 0.0, [])
+        return CriterionPrescreen(
+            criterion.name,
+            max(1.0, min(5.0, weighted_sum / strength_sum)),
+            min(1.0, best_strength),
+            matched,
+        )
+
+    def to_criterion_evaluations(
+        self,
+        result: PrescreenResult,
+        rubric_data: Dict[str, Any]
+    ) -> List[CriterionEvaluation]:
+        """Convert a pre-screen result into criterion evaluations for the offline path."""
+        by_name = {c.criterion_name: c for c in result.criteria}
+        evaluations = []
+        for criterion in rubric_data.get("criteria", []):
+            name = criterion.get("name", criterion.get("criterion_id", "Unknown"))
+            prescreen = by_name.get(name) or CriterionPrescreen(name, _NEUTRAL_SCORE, 0.0, [])
+            evaluations.append(CriterionEvaluation(
+                criterion_name=name,
+                criterion_description=criterion.get("description", ""),
+                weight=criterion.get("weight", 1.0),
+                score=round(prescreen.score, 2),
+                reasoning=(
+                    f"Rule-based pre-screen for {name} (confidence {prescreen.confidence:.2f})"
+                    if prescreen.matched else f"No level descriptors for {name} found in text; neutral score"
+                ),
+                evidence=[f"Matched: {', '.join(prescreen.matched[:10])}"] if prescreen.matched else []
+            ))
+        return evaluations
+
+
+@lru_cache(maxsize=1)
+def get_prescreen_scorer() -> PrescreenScorer:
+    """Get singleton pre-screen scorer instance (keeps the compiled rubric cache)."""
+    return PrescreenScorer()
@@ -0,0 +1,175 @@
+"""
+Singleflight coalescing of identical evaluation requests.
+
+Concurrent requests for the same (rubric, candidate set, mode, strategy) share
+one in-flight evaluation and all receive the same result and evaluation ID.
+Results for client-supplied idempotency keys are remembered for a TTL so a
+retried request returns the original outcome instead of re-running the LLMs;
+reusing a key for a different request is rejected. A shared evaluation runs
+under its first caller's deadline, so a caller with a later deadline runs its
+own instead of joining one that may give up before it would.
+An in-flight evaluation is cancelled once every caller waiting on it is gone.
+"""
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKeyReused(ValueError):
+    """An idempotency key was sent again with a different request."""
+
+
+class RequestCoalescer:
+    """Shares in-flight evaluations between identical concurrent requests."""
+
+    def __init__(self, idempotency_ttl: float = 600.0, max_idempotency_keys: int = 1000):
+        """Initialize coalescer.
+
+        Args:
+            idempotency_ttl: Seconds a result stays retrievable by its idempotency key
+            max_idempotency_keys: Upper bound on remembered idempotency keys
+        """
+        self.idempotency_ttl = idempotency_ttl
+        self.max_idempotency_keys = max_idempotency_keys
+        self._inflight: Dict[Hashable, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._waiters: Dict["asyncio.Task[Dict[str, Any]]", int] = {}
+        # Request key and deadline each in-flight evaluation runs under
+        self._flights: Dict["asyncio.Task[Dict[str, Any]]", Tuple[Hashable, Optional[float]]] = {}
+        self._idempotent: Dict[str, Tuple[float, Hashable, Dict[str, Any]]] = {}
+        self.stats = {"executed": 0, "coalesced": 0, "idempotent_hits": 0, "deadline_not_coalesced": 0}
+
+    @staticmethod
+    def make_key(
+        rubric_id: str,
+        candidate_ids: List[str],
+        comparison_mode: str,
+        ranking_strategy: str,
+        *extra: Hashable
+    ) -> Tuple[Hashable, ...]:
+        """Key identifying requests that produce the same evaluation."""
+        return (rubric_id, tuple(sorted(candidate_ids)), comparison_mode, ranking_strategy, *extra)
+
+    @staticmethod
+    def _check_same_request(idempotency_key: str, original: Hashable, key: Hashable) -> None:
+        if original != key:
+            raise IdempotencyKeyReused(f"Idempotency key {idempotency_key} was already used for a different request")
+
+    def _cached(self, idempotency_key: Optional[str], key: Hashable) -> Optional[Dict[str, Any]]:
+        if not idempotency_key:
+            return None
+        entry = self._idempotent.get(idempotency_key)
+        if entry is None:
+            return None
+        expires_at, original, result = entry
+        if expires_at < time.monotonic():
+            del self._idempotent[idempotency_key]
+            return None
+        self._check_same_request(idempotency_key, original, key)
+        return result
+
+    def _remember(self, idempotency_key: str, key: Hashable, result: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        if len(self._idempotent) >= self.max_idempotency_keys:
+            for k in [k for k, (expires_at, _, _) in self._idempotent.items() if expires_at < now]:
+                del self._idempotent[k]
+            while len(self._idempotent) >= self.max_idempotency_keys:
+                del self._idempotent[next(iter(self._idempotent))]
+        self._idempotent[idempotency_key] = (now + self.idempotency_ttl, key, result)
+
+    def _joinable(self, key: Hashable, deadline: Optional[float]) -> Optional["asyncio.Task[Dict[str, Any]]"]:
+        """In-flight evaluation for ``key`` that will not give up before ``deadline`` does."""
+        task = self._inflight.get(key)
+        if task is None:
+            return None
+        _, owner_deadline = self._flights[task]
+        if owner_deadline is not None and (deadline is None or deadline > owner_deadline):
+            self.stats["deadline_not_coalesced"] += 1
+            logger.info(f"Not coalescing onto evaluation {key}: it runs under an earlier deadline")
+            return None
+        return task
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Dict[str, Any]]],
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Run ``factory`` once per key, sharing the result with concurrent callers.
+
+        Args:
+            key: Request identity (see ``make_key``)
+            factory: Coroutine function performing the evaluation
+            idempotency_key: Optional client key; a successful result is replayed for retries
+            deadline: Absolute ``time.monotonic()`` deadline of this caller (None for none)
+
+        Returns:
+            The evaluation result dictionary
+
+        Raises:
+            IdempotencyKeyReused: If ``idempotency_key`` belongs to a different request
+        """
+        cached = self._cached(idempotency_key, key)
+        if cached is not None:
+            self.stats["idempotent_hits"] += 1
+            logger.info(f"Replaying result for idempotency key {idempotency_key}")
+            return cached
+
+        # A retry with an idempotency key joins the original request if it is still running,
+        # whatever its deadline: running it again would produce a second result
+        flight_key = ("idempotency", idempotency_key) if idempotency_key else key
+        task = self._inflight.get(flight_key) if idempotency_key else None
+        if task is not None:
+            self._check_same_request(idempotency_key, self._flights[task][0], key)
+        else:
+            task = self._joinable(key, deadline)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            logger.info(f"Coalescing evaluation request onto in-flight evaluation {key}")
+        else:
+            self.stats["executed"] += 1
+            task = asyncio.ensure_future(factory())
+            self._flights[task] = (key, deadline)
+            # Later callers join the newest evaluation for a key (its deadline is the latest)
+            keys = [key] if flight_key == key else [key, flight_key]
+            for k in keys:
+                self._inflight[k] = task
+
+            def _done(t: "asyncio.Task[Dict[str, Any]]", keys=keys) -> None:
+                self._flights.pop(t, None)
+                for k in keys:
+                    if self._inflight.get(k) is t:
+                        del self._inflight[k]
+
+            task.add_done_callback(_done)
+
+        # Shield so one caller going away does not cancel the shared evaluation; the
+        # evaluation is cancelled only once every caller waiting on it has gone away
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters.get(task, 0) <= 1:
+                logger.info(f"All callers for evaluation {key} went away; cancelling it")
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if self._waiters[task] <= 0:
+                del self._waiters[task]
+        if idempotency_key and "error" not in result:
+            self._remember(idempotency_key, key, result)
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_request_coalescer() -> RequestCoalescer:
+    """Get singleton request coalescer instance."""
+    return RequestCoalescer(idempotency_ttl=get_settings().idempotency_ttl_seconds)
@@ -0,0 +1,289 @@
+"""
+Durable outbox for evaluation results.
+
+Results are committed to a local SQLite file with a pre-assigned evaluation ID
+before the user gets a response; a background drainer delivers them to
+criteria_api (``POST /candidates/evaluations/batch``) with batching and retries.
+The evaluation ID doubles as the idempotency key, so a redelivered batch never
+creates duplicates and nothing is lost while criteria_api is slow or down.
+Results criteria_api rejects outright (a 4xx other than 408/429) will never be
+accepted on retry; they are moved to a dead-letter table for inspection.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from config import get_settings
+from services.cassette import upstream_client
+
+logger = logging.getLogger(__name__)
+
+# Client errors that may succeed on retry (request timeout, rate limited)
+RETRYABLE_CLIENT_ERRORS = (408, 429)
+
+
+def is_terminal_status(status_code: int) -> bool:
+    """Whether criteria_api rejected a delivery for good (retrying cannot succeed)."""
+    return 400 <= status_code < 500 and status_code not in RETRYABLE_CLIENT_ERRORS
+
+
+class ResultOutbox:
+    """SQLite-backed outbox with a background drainer."""
+
+    def __init__(
+        self,
+        path: str,
+        criteria_api_url: str,
+        batch_size: int = 20,
+        poll_interval: float = 2.0,
+        max_backoff: float = 300.0
+    ):
+        """Initialize outbox.
+
+        Args:
+            path: SQLite file holding undelivered results
+            criteria_api_url: Base URL of criteria_api
+            batch_size: Maximum results delivered per request
+            poll_interval: Seconds between drain attempts when idle
+            max_backoff: Upper bound for retry backoff in seconds
+        """
+        self.path = path
+        self.criteria_api_url = criteria_api_url.rstrip("/")
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=FULL")
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Connection that commits on success, rolls back on error and is always closed."""
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_error TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_outbox_next_attempt ON outbox (next_attempt_at)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox_dead_letter (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    failed_at REAL NOT NULL,
+                    last_error TEXT
+                )
+                """
+            )
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    def _insert(self, evaluation_id: str, payload: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO outbox (id, payload, attempts, next_attempt_at, created_at) VALUES (?, ?, 0, ?, ?)",
+                (evaluation_id, json.dumps(payload, default=str), now, now)
+            )
+
+    async def enqueue(self, payload: Dict[str, Any]) -> str:
+        """Durably store an evaluation payload and return its pre-assigned ID.
+
+        Args:
+            payload: Body for ``POST /candidates/evaluations`` (``id`` is assigned if missing)
+
+        Returns:
+            Evaluation ID criteria_api will store the result under
+        """
+        evaluation_id = payload.get("id") or str(uuid.uuid4())
+        payload = {**payload, "id": evaluation_id}
+        await asyncio.to_thread(self._insert, evaluation_id, payload)
+        self._wakeup.set()
+        logger.info(f"Queued evaluation {evaluation_id} in result outbox")
+        return evaluation_id
+
+    # ------------------------------------------------------------------
+    # Drainer side
+    # ------------------------------------------------------------------
+    def _due(self) -> List[Tuple[str, Dict[str, Any], int]]:
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, payload, attempts FROM outbox WHERE next_attempt_at <= ? "
+                "ORDER BY created_at LIMIT ?",
+                (time.time(), self.batch_size)
+            ).fetchall()
+        return [(row[0], json.loads(row[1]), row[2]) for row in rows]
+
+    def _delete(self, ids: List[str]) -> None:
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM outbox WHERE id = ?", [(i,) for i in ids])
+
+    def _reschedule(self, failures: List[Tuple[str, int, str]]) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                [
+                    (attempts + 1, now + min(self.max_backoff, 2 ** attempts), error[:500], evaluation_id)
+                    for evaluation_id, attempts, error in failures
+                ]
+            )
+
+    def _dead_letter(self, rejected: List[Tuple[str, int, str]]) -> None:
+        now = time.time()
+        with self._transaction() as conn:
+            for evaluation_id, attempts, error in rejected:
+                conn.execute(
+                    "INSERT OR REPLACE INTO outbox_dead_letter (id, payload, attempts, created_at, failed_at, last_error) "
+                    "SELECT id, payload, ?, created_at, ?, ? FROM outbox WHERE id = ?",
+                    (attempts + 1, now, error[:500], evaluation_id)
+                )
+                conn.execute("DELETE FROM outbox WHERE id = ?", (evaluation_id,))
+
+    def pending_count(self) -> int:
+        """Number of results not yet delivered to criteria_api."""
+        with self._transaction() as conn:
+            return conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def dead_letter_count(self) -> int:
+        """Number of results criteria_api rejected for good, kept in the dead-letter table."""
+        with self._transaction() as conn:
+            return conn.execute("SELECT COUNT(*) FROM outbox_dead_letter").fetchone()[0]
+
+    async def drain_once(self) -> int:
+        """Deliver one batch of due results.
+
+        Returns:
+            Number of results delivered
+        """
+        due = await asyncio.to_thread(self._due)
+        if not due:
+            return 0
+
+        delivered: List[str] = []
+        failures: List[Tuple[str, int, str]] = []
+        rejected: List[Tuple[str, int, str]] = []
+        async with upstream_client(30) as client:
+            try:
+                response = await client.post(
+                    f"{self.criteria_api_url}/candidates/evaluations/batch",
+                    json=[payload for _, payload, _ in due]
+                )
+                response.raise_for_status()
+                delivered = [evaluation_id for evaluation_id, _, _ in due]
+            except httpx.HTTPStatusError as e:
+                if not is_terminal_status(e.response.status_code):
+                    failures = [(evaluation_id, attempts, str(e)) for evaluation_id, _, attempts in due]
+                elif len(due) == 1:
+                    rejected = [(evaluation_id, attempts, str(e)) for evaluation_id, _, attempts in due]
+                else:
+                    # One bad item rejects the whole batch; isolate it by delivering one at a time
+                    for evaluation_id, payload, attempts in due:
+                        try:
+                            item_response = await client.post(
+                                f"{self.criteria_api_url}/candidates/evaluations",
+                                json=payload,
+                                headers={"Idempotency-Key": evaluation_id}
+                            )
+                            item_response.raise_for_status()
+                            delivered.append(evaluation_id)
+                        except httpx.HTTPStatusError as item_error:
+                            if is_terminal_status(item_error.response.status_code):
+                                rejected.append((evaluation_id, attempts, str(item_error)))
+                            else:
+                                failures.append((evaluation_id, attempts, str(item_error)))
+                        except Exception as item_error:
+                            failures.append((evaluation_id, attempts, str(item_error)))
+            except Exception as e:
+                failures = [(evaluation_id, attempts, str(e)) for evaluation_id, _, attempts in due]
+
+        if delivered:
+            await asyncio.to_thread(self._delete, delivered)
+            logger.info(f"Result outbox delivered {len(delivered)} evaluation(s)")
+        if failures:
+            await asyncio.to_thread(self._reschedule, failures)
+            logger.warning(f"Result outbox failed to deliver {len(failures)} evaluation(s): {failures[0][2]}")
+        if rejected:
+            await asyncio.to_thread(self._dead_letter, rejected)
+            logger.error(
+                f"Result outbox dead-lettered {len(rejected)} evaluation(s) rejected by criteria_api: {rejected[0][2]}"
+            )
+        return len(delivered)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                delivered = await self.drain_once()
+            except Exception as e:
+                logger.error(f"Result outbox drain failed: {e}", exc_info=True)
+                delivered = 0
+            if delivered:
+                continue  # More may be due right away
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Start the background drainer on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"Result outbox drainer started ({self.path})")
+
+    async def stop(self) -> None:
+        """Stop the background drainer; undelivered results stay on disk."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+@lru_cache(maxsize=1)
+def get_result_outbox() -> ResultOutbox:
+    """Get singleton result outbox instance."""
+    settings = get_settings()
+    return ResultOutbox(
+        path=settings.result_outbox_path,
+        criteria_api_url=settings.criteria_api_url,
+        batch_size=settings.result_outbox_batch_size,
+        poll_interval=settings.result_outbox_poll_interval,
+        max_backoff=settings.result_outbox_max_backoff
+    )
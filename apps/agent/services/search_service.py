@@ -3,9 +3,11 @@ from __future__ import annotations
 import logging
 from typing import Any
 from functools import lru_cache
-import httpx
 
 from config import get_settings
+from services.cassette import upstream_client
+from services.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from services.deadline import DeadlineExceeded, timeout_for
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,7 @@ class AzureSearchService:
         )
         if not self.enabled:
             logger.warning("Azure Cognitive Search not fully configured; returning stub results.")
+        self.breaker = get_circuit_breaker("azure_search")
 
     async def search(self, query: str, top: int = 3, decision_kit_id: str | None = None) -> list[dict[str, Any]]:
         """Search for documents in Azure Search index.
@@ -33,6 +36,10 @@ class AzureSearchService:
 
         Returns:
             List of documents with id, score, content, and metadata
+
+        Raises:
+            CircuitOpenError: If Azure Search is failing; callers fall back to full-document context
+            DeadlineExceeded: If the request deadline has passed
         """
         if not self.enabled:
             return [
@@ -66,23 +73,26 @@ class AzureSearchService:
             payload["filter"] = f"decision_kit_id eq '{decision_kit_id}'"
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                results = [
-                    {
-                        "id": doc.get("id"),
-                        "score": doc.get("@search.score"),
-                        "content": doc.get("content", ""),
-                        "title": doc.get("title", ""),
-                        "name": doc.get("name", ""),
-                        "candidate_id": doc.get("candidate_id", ""),
-                        "decision_kit_id": doc.get("decision_kit_id", ""),
-                    }
-                    for doc in data.get("value", [])
-                ]
-                return results
+            with self.breaker.guard():
+                async with upstream_client(timeout_for("search", 10.0)) as client:
+                    resp = await client.post(url, headers=headers, json=payload)
+                    resp.raise_for_status()
+                    data = resp.json()
+            results = [
+                {
+                    "id": doc.get("id"),
+                    "score": doc.get("@search.score"),
+                    "content": doc.get("content", ""),
+                    "title": doc.get("title", ""),
+                    "name": doc.get("name", ""),
+                    "candidate_id": doc.get("candidate_id", ""),
+                    "decision_kit_id": doc.get("decision_kit_id", ""),
+                }
+                for doc in data.get("value", [])
+            ]
+            return results
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
         except Exception as exc:  # noqa: BLE001
             logger.exception("Azure Search query failed", exc_info=exc)
             return []
@@ -117,28 +127,36 @@ class AzureSearchService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                # First try direct document lookup using the ID as primary key
-                resp = await client.get(url, headers=headers)
-                if resp.status_code == 200:
-                    doc = resp.json()
-                    return {
-                        "id": doc.get("id", candidate_id),
-                        "content": doc.get("content", ""),
-                        "title": doc.get("title", ""),
-                        "name": doc.get("name", ""),
-                        "candidate_id": doc.get("candidate_id", ""),
-                        "decision_kit_id": doc.get("decision_kit_id", ""),
-                    }
-
-                elif resp.status_code == 404:
-                    # Direct lookup failed, try searching by candidate_id field
-                    logger.info(f"Direct lookup failed for '{candidate_id}', trying search by candidate_id field")
-                    return await self._search_by_candidate_id(candidate_id)
-
-                else:
-                    resp.raise_for_status()
+            with self.breaker.guard():
+                async with upstream_client(timeout_for("search", 10.0)) as client:
+                    # First try direct document lookup using the ID as primary key
+                    resp = await client.get(url, headers=headers)
+                    if resp.status_code not in (200, 404):
+                        resp.raise_for_status()
+
+            if resp.status_code == 200:
+                doc = resp.json()
+                return {
+                    "id": doc.get("id", candidate_id),
+                    "content": doc.get("content", ""),
+                    "title": doc.get("title", ""),
+                    "name": doc.get("name", ""),
+                    "candidate_id": doc.get("candidate_id", ""),
+                    "decision_kit_id": doc.get("decision_kit_id", ""),
+                }
+
+            elif resp.status_code == 404:
+                # Direct lookup failed, try searching by candidate_id field
+                logger.info(f"Direct lookup failed for '{candidate_id}', trying search by candidate_id field")
+                return await self._search_by_candidate_id(candidate_id)
+
+            return None
 
+        except DeadlineExceeded:
+            raise
+        except CircuitOpenError as exc:
+            logger.warning(f"Skipping Azure Search lookup for '{candidate_id}': {exc}")
+            return None
         except Exception as exc:  # noqa: BLE001
             logger.exception(f"Failed to retrieve document '{candidate_id}' from Azure Search", exc_info=exc)
             return None
@@ -171,27 +189,33 @@ class AzureSearchService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-
-                documents = data.get("value", [])
-                if documents:
-                    doc = documents[0]  # Take first match
-                    logger.info(f"Found document by candidate_id '{candidate_id}': {doc.get('id', 'N/A')}")
-                    return {
-                        "id": doc.get("id", candidate_id),
-                        "content": doc.get("content", ""),
-                        "title": doc.get("title", ""),
-                        "name": doc.get("name", ""),
-                        "candidate_id": doc.get("candidate_id", ""),
-                        "decision_kit_id": doc.get("decision_kit_id", ""),
-                    }
-                else:
-                    logger.warning(f"No document found with candidate_id '{candidate_id}'")
-                    return None
+            with self.breaker.guard():
+                async with upstream_client(timeout_for("search", 10.0)) as client:
+                    resp = await client.post(url, headers=headers, json=payload)
+                    resp.raise_for_status()
+                    data = resp.json()
+
+            documents = data.get("value", [])
+            if documents:
+                doc = documents[0]  # Take first match
+                logger.info(f"Found document by candidate_id '{candidate_id}': {doc.get('id', 'N/A')}")
+                return {
+                    "id": doc.get("id", candidate_id),
+                    "content": doc.get("content", ""),
+                    "title": doc.get("title", ""),
+                    "name": doc.get("name", ""),
+                    "candidate_id": doc.get("candidate_id", ""),
+                    "decision_kit_id": doc.get("decision_kit_id", ""),
+                }
+            else:
+                logger.warning(f"No document found with candidate_id '{candidate_id}'")
+                return None
 
+        except DeadlineExceeded:
+            raise
+        except CircuitOpenError as exc:
+            logger.warning(f"Skipping Azure Search lookup for '{candidate_id}': {exc}")
+            return None
         except Exception as exc:
             logger.exception(f"Failed to search by candidate_id '{candidate_id}'", exc_info=exc)
             return None
@@ -270,22 +294,28 @@ class AzureSearchService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                resp = await client.post(url, headers=headers, json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-                results = [
-                    {
-                        "id": doc.get("id"),
-                        "content": doc.get("content", ""),
-                        "title": doc.get("title", ""),
-                        "name": doc.get("name", ""),
-                        "candidate_id": doc.get("candidate_id", ""),
-                        "decision_kit_id": doc.get("decision_kit_id", ""),
-                    }
-                    for doc in data.get("value", [])
-                ]
-                return results
+            with self.breaker.guard():
+                async with upstream_client(timeout_for("search", 10.0)) as client:
+                    resp = await client.post(url, headers=headers, json=payload)
+                    resp.raise_for_status()
+                    data = resp.json()
+            results = [
+                {
+                    "id": doc.get("id"),
+                    "content": doc.get("content", ""),
+                    "title": doc.get("title", ""),
+                    "name": doc.get("name", ""),
+                    "candidate_id": doc.get("candidate_id", ""),
+                    "decision_kit_id": doc.get("decision_kit_id", ""),
+                }
+                for doc in data.get("value", [])
+            ]
+            return results
+        except DeadlineExceeded:
+            raise
+        except CircuitOpenError as exc:
+            logger.warning(f"Skipping candidate listing for decision kit '{decision_kit_id}': {exc}")
+            return []
         except Exception as exc:  # noqa: BLE001
             logger.exception(f"Failed to retrieve candidates for decision kit '{decision_kit_id}'", exc_info=exc)
             return []
@@ -0,0 +1,54 @@
+"""
+Per-request stage timings.
+
+``evaluate`` starts a collector for the request; pipeline stages (rubric fetch,
+candidate fetch, retrieval, each LLM stage) record their durations into it.
+The collector lives in a context variable and is shared by tasks the request
+spawns, so concurrent stages of one request land in the same collector. The
+summary is attached to the evaluation metadata for benchmarks and tracing.
+"""
+
+import contextvars
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+_timings: contextvars.ContextVar[Optional[Dict[str, List[float]]]] = contextvars.ContextVar(
+    "stage_timings", default=None
+)
+
+
+def start_stage_timings() -> None:
+    """Start collecting stage timings for the current request."""
+    _timings.set({})
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Record one stage duration (no-op outside a collecting request)."""
+    timings = _timings.get()
+    if timings is not None:
+        timings.setdefault(stage, []).append(seconds)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Record the duration of the enclosed block as ``stage``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started)
+
+
+def stage_timings_metadata() -> str:
+    """JSON summary ``{stage: {"count", "total_ms", "max_ms"}}`` for string-valued metadata."""
+    timings = _timings.get() or {}
+    return json.dumps({
+        stage: {
+            "count": len(durations),
+            "total_ms": round(sum(durations) * 1000, 1),
+            "max_ms": round(max(durations) * 1000, 1),
+        }
+        for stage, durations in timings.items()
+    })
@@ -0,0 +1,37 @@
+import sys
+import os
+
+# Ensure the agent root is on sys.path so 'import services.*' works
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))  # apps/agent
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from typing import Any, Dict, List  # noqa: E402
+
+import pytest  # noqa: E402
+from langchain_core.language_models import BaseChatModel  # noqa: E402
+from langchain_core.messages import AIMessage  # noqa: E402
+from langchain_core.outputs import ChatGeneration, ChatResult  # noqa: E402
+
+
+class FakeSampledChatModel(BaseChatModel):
+    """Chat model returning ``n`` canned generations per call, picked by a marker in the prompt."""
+
+    samples: Dict[str, List[str]]
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-sampled"
+
+    def _generate(self, messages, stop=None, run_manager=None, n: int = 1, **kwargs: Any) -> ChatResult:
+        prompt = "\n".join(str(m.content) for m in messages)
+        responses = next(texts for marker, texts in self.samples.items() if marker in prompt)
+        return ChatResult(generations=[
+            ChatGeneration(message=AIMessage(content=responses[i % len(responses)])) for i in range(n)
+        ])
+
+
+@pytest.fixture
+def sampled_llm():
+    """Build a FakeSampledChatModel from ``{prompt marker: [responses]}``."""
+    return lambda samples: FakeSampledChatModel(samples=samples)
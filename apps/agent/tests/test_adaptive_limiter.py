@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from services import adaptive_limiter
+from services.adaptive_limiter import BASELINE_WARMUP_CALLS, AIMDLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(adaptive_limiter, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def _rate_limited():
+    request = httpx.Request("POST", "https://llm")
+    return httpx.HTTPStatusError("429", request=request, response=httpx.Response(429, request=request))
+
+
+def test_window_grows_by_one_per_window_of_successes(clock):
+    limiter = AIMDLimiter(min_limit=1, max_limit=10, initial_limit=4)
+
+    # 1/window per success: a little more than one window's worth of calls adds a slot
+    for _ in range(4):
+        limiter.on_success("summary", clock.value, 1.0)
+    assert limiter.limit == 4
+    limiter.on_success("summary", clock.value, 1.0)
+    assert limiter.limit == 5
+
+    for _ in range(100):
+        limiter.on_success("summary", clock.value, 1.0)
+    assert limiter.limit == 10
+
+
+def test_overload_cuts_window_once_per_round_trip(clock):
+    limiter = AIMDLimiter(min_limit=1, max_limit=16, decrease_factor=0.5)
+    in_flight = clock.value
+
+    clock.value += 1
+    limiter.on_failure("summary", in_flight, _rate_limited())
+    assert limiter.limit == 8
+
+    # Calls already in flight when the window was cut do not cut it again
+    limiter.on_failure("summary", in_flight, TimeoutError())
+    assert limiter.limit == 8
+    assert limiter.overload_events == {"rate_limited": 1, "timeout": 1, "latency_spike": 0}
+
+    clock.value += 1
+    limiter.on_failure("summary", clock.value, _rate_limited())
+    assert limiter.limit == 4
+    assert limiter.decreases == 2
+
+
+def test_window_never_drops_below_minimum(clock):
+    limiter = AIMDLimiter(min_limit=2, max_limit=4)
+    for _ in range(5):
+        clock.value += 1
+        limiter.on_failure("summary", clock.value, _rate_limited())
+    assert limiter.limit == 2
+
+
+def test_non_overload_errors_leave_window_alone(clock):
+    limiter = AIMDLimiter(min_limit=1, max_limit=8)
+    limiter.on_failure("summary", clock.value, ValueError("bad prompt"))
+    assert limiter.limit == 8
+
+
+def test_latency_spike_cuts_window_and_nudges_baseline(clock):
+    limiter = AIMDLimiter(min_limit=1, max_limit=8, latency_spike_factor=2.0)
+    for _ in range(BASELINE_WARMUP_CALLS):
+        limiter.on_success("summary", clock.value, 1.0)
+    assert limiter._baselines["summary"] == 1.0
+
+    clock.value += 1
+    limiter.on_success("summary", clock.value, 5.0)
+    assert limiter.limit == 4
+    assert limiter.overload_events["latency_spike"] == 1
+    assert 1.0 < limiter._baselines["summary"] < 1.1
+
+
+def test_baseline_is_the_warmup_mean_not_the_first_call(clock):
+    limiter = AIMDLimiter(min_limit=1, max_limit=8)
+    limiter.on_success("summary", clock.value, 0.1)
+    for _ in range(BASELINE_WARMUP_CALLS - 1):
+        limiter.on_success("summary", clock.value, 2.0)
+
+    # A lucky first call does not make every normal call look like a spike
+    assert limiter._baselines["summary"] == pytest.approx((0.1 + 2.0 * (BASELINE_WARMUP_CALLS - 1)) / BASELINE_WARMUP_CALLS)
+    limiter.on_success("summary", clock.value, 2.0)
+    assert limiter.overload_events["latency_spike"] == 0
+
+
+def test_lasting_latency_shift_is_eventually_accepted(clock):
+    limiter = AIMDLimiter(min_limit=1, max_limit=8, latency_spike_factor=2.0)
+    for _ in range(BASELINE_WARMUP_CALLS):
+        limiter.on_success("summary", clock.value, 1.0)
+
+    calls = 0
+    while limiter._baselines["summary"] * limiter.latency_spike_factor < 3.0:
+        clock.value += 1
+        limiter.on_success("summary", clock.value, 3.0)
+        calls += 1
+        assert calls < 100, "baseline never caught up with the new latency"
+
+    limiter.on_success("summary", clock.value, 3.0)
+    assert limiter.overload_events["latency_spike"] == calls
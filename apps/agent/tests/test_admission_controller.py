@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from routes.evaluation import get_evaluation_service
+from services.admission_controller import AdmissionController, AdmissionRejected, get_admission_controller
+
+
+def test_cost_uses_known_rubric_size_else_default():
+    admission = AdmissionController(budget=100, max_queue_wait=1, default_criteria=6)
+    assert admission.estimate_cost("unknown", 2, 2.0) == 24.0
+    admission.record_rubric_size("r1", 3)
+    assert admission.estimate_cost("r1", 2, 2.0) == 12.0
+
+
+def test_queued_request_is_admitted_when_capacity_frees():
+    admission = AdmissionController(budget=10, max_queue_wait=1)
+    order = []
+
+    async def request(name, cost, hold):
+        async with admission.admit(cost):
+            order.append(name)
+            await asyncio.sleep(hold)
+
+    async def scenario():
+        first = asyncio.ensure_future(request("first", 8, 0.05))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(request("second", 8, 0))
+        await asyncio.sleep(0.01)
+        assert admission.queued == 1
+        await asyncio.gather(first, second)
+
+    asyncio.run(scenario())
+    assert order == ["first", "second"]
+    assert admission.get_load()["admitted_total"] == 2
+    assert admission.in_flight_cost == 0
+
+
+def test_request_is_rejected_after_the_queue_wait():
+    admission = AdmissionController(budget=10, max_queue_wait=0.01)
+
+    async def scenario():
+        async with admission.admit(8):
+            with pytest.raises(AdmissionRejected) as rejected:
+                async with admission.admit(8):
+                    pass
+            return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert rejected.retry_after >= 1
+    assert admission.rejected_total == 1 and admission.queued == 0
+
+
+def test_oversize_request_runs_when_nothing_else_is_in_flight():
+    admission = AdmissionController(budget=10, max_queue_wait=0.01)
+
+    async def scenario():
+        async with admission.admit(50):
+            return admission.in_flight_cost
+
+    assert asyncio.run(scenario()) == 50
+
+
+class _Service:
+    def estimated_llm_calls_per_candidate(self):
+        return 2.0
+
+
+def test_rejection_answers_429_with_retry_after():
+    admission = AdmissionController(budget=10, max_queue_wait=0.01)
+    admission.in_flight_requests, admission.in_flight_cost = 1, 10
+    app.dependency_overrides[get_admission_controller] = lambda: admission
+    app.dependency_overrides[get_evaluation_service] = lambda: _Service()
+    try:
+        response = TestClient(app).post("/evaluation/evaluate", json={"rubric_id": "r1", "candidate_ids": ["c1"]})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
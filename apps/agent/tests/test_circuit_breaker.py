@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from services import circuit_breaker
+from services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from services.deadline import DeadlineExceeded
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def _breaker():
+    return CircuitBreaker("azure_search", failure_rate_threshold=0.5, window_seconds=30, min_calls=4, open_seconds=15)
+
+
+def _fail(breaker, error=None):
+    with pytest.raises(type(error or ConnectionError())):
+        with breaker.guard():
+            raise error or ConnectionError("down")
+
+
+def _open(breaker):
+    for _ in range(breaker.min_calls):
+        _fail(breaker)
+    assert breaker.state == OPEN
+
+
+def test_opens_at_failure_rate_once_enough_calls_are_seen(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        _fail(breaker)
+    assert breaker.state == CLOSED  # below min_calls
+
+    _fail(breaker)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as rejected:
+        breaker.before_call()
+    assert rejected.value.retry_in == 15
+    assert breaker.rejected == 1
+
+
+def test_old_failures_leave_the_window(clock):
+    breaker = _breaker()
+    for _ in range(3):
+        _fail(breaker)
+    clock.value += 31
+    _fail(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_request_errors_do_not_count_against_the_upstream(clock):
+    breaker = _breaker()
+    request = httpx.Request("GET", "https://search")
+    not_found = httpx.HTTPStatusError("404", request=request, response=httpx.Response(404, request=request))
+    for error in (not_found, not_found, DeadlineExceeded("late"), not_found):
+        _fail(breaker, error)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_one_probe_through_and_closes_on_success(clock):
+    breaker = _breaker()
+    _open(breaker)
+
+    clock.value += 15
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # a second caller while the probe is in flight
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_for_a_full_cool_down(clock):
+    breaker = _breaker()
+    _open(breaker)
+
+    clock.value += 15
+    _fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+
+    clock.value += 14
+    assert breaker.state == OPEN
+    clock.value += 1
+    assert breaker.state == HALF_OPEN
+
+
+def test_probe_ending_in_a_request_error_frees_the_probe_slot(clock):
+    breaker = _breaker()
+    _open(breaker)
+    clock.value += 15
+
+    _fail(breaker, DeadlineExceeded("late"))
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()  # another probe may go
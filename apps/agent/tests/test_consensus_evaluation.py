@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from services.consensus_evaluation import AgentEvaluation, AgentRole, ConsensusEvaluationService
+
+RUBRIC = {
+    "rubric_name": "Hiring",
+    "description": "desc",
+    "criteria": [
+        {"name": "Communication", "weight": 0.5, "definition": "Clear writing"},
+        {"name": "Leadership", "weight": 0.5, "definition": "Leads teams"},
+    ],
+}
+
+
+def _evaluation(role, scores):
+    return AgentEvaluation(
+        agent_role=role,
+        overall_score=sum(scores.values()) / len(scores),
+        criteria_scores=dict(scores),
+        reasoning="initial",
+        detailed_criteria_reasoning={name: "initial" for name in scores},
+        evidence=[],
+        confidence=0.85,
+        round_number=1,
+    )
+
+
+def test_refinement_applies_llm_scores_to_disputed_criteria_only():
+    response = json.dumps({"evaluation": [
+        {"criterion_name": "communication", "score": 4.5, "reasoning": "Convinced by the examples", "evidence": []},
+        {"criterion_name": "Leadership", "score": 1.0, "reasoning": "Settled, must be ignored", "evidence": []},
+    ]})
+    service = ConsensusEvaluationService(llm=FakeListChatModel(responses=[f"```json\n{response}\n```"]))
+    strict = _evaluation(AgentRole.STRICT_EVALUATOR, {"Communication": 2.0, "Leadership": 3.0})
+    generous = _evaluation(AgentRole.GENEROUS_EVALUATOR, {"Communication": 4.0, "Leadership": 3.0})
+
+    refined = asyncio.run(service._refine_strict_evaluation(
+        strict, "critique", "Candidate text", RUBRIC, 2, disputed_criteria=["Communication"], other_eval=generous
+    ))
+
+    assert refined.criteria_scores == {"Communication": 4.5, "Leadership": 3.0}
+    assert refined.detailed_criteria_reasoning["Communication"] == "Convinced by the examples"
+    assert refined.overall_score == 3.75
+
+
+def test_refinement_falls_back_to_deterministic_adjustment_on_unparseable_output():
+    service = ConsensusEvaluationService(llm=FakeListChatModel(responses=["I would rather not say."]))
+    strict = _evaluation(AgentRole.STRICT_EVALUATOR, {"Communication": 2.0, "Leadership": 3.0})
+    generous = _evaluation(AgentRole.GENEROUS_EVALUATOR, {"Communication": 4.0, "Leadership": 3.0})
+
+    refined = asyncio.run(service._refine_strict_evaluation(
+        strict, "critique", "Candidate text", RUBRIC, 2, disputed_criteria=["Communication"], other_eval=generous
+    ))
+
+    assert refined.criteria_scores["Communication"] == 2.3
+    assert refined.criteria_scores["Leadership"] == 3.0
+
+
+def _sample(communication, leadership):
+    return json.dumps({"evaluation": [
+        {"criterion_name": "Communication", "score": communication, "reasoning": "r", "evidence": []},
+        {"criterion_name": "Leadership", "score": leadership, "reasoning": "r", "evidence": []},
+    ]})
+
+
+def _self_consistency(sampled_llm, aggregation):
+    llm = sampled_llm({
+        "STRICT EVALUATOR": [_sample(2.0, 3.0), _sample(2.0, 3.0), _sample(1.0, 3.0)],
+        "GENEROUS EVALUATOR": [_sample(3.0, 3.0), _sample(5.0, 3.0), _sample(3.0, 3.0)],
+    })
+    service = ConsensusEvaluationService(llm=llm)
+    return asyncio.run(service.evaluate_with_self_consistency(
+        "Candidate text", RUBRIC, "cand-1", samples=6, aggregation=aggregation, temperature=0.7
+    ))
+
+
+def test_self_consistency_takes_the_median_of_all_samples(sampled_llm):
+    result = _self_consistency(sampled_llm, "median")
+    metadata = result["consensus_metadata"]
+
+    scores = {c["criterion_name"]: c["score"] for c in result["criteria_evaluations"]}
+    assert scores == {"Communication": 2.5, "Leadership": 3.0}
+    assert metadata["samples"] == 6 and metadata["strict_samples"] == 3
+    assert result["overall_score"] == 2.75
+
+
+def test_self_consistency_trimmed_mean_drops_the_outliers(sampled_llm):
+    result = _self_consistency(sampled_llm, "trimmed_mean")
+
+    # Communication samples 1, 2, 2, 3, 3, 5: one dropped from each end
+    scores = {c["criterion_name"]: c["score"] for c in result["criteria_evaluations"]}
+    assert scores["Communication"] == 2.5
+    assert result["consensus_metadata"]["consensus_method"] == "self_consistency_trimmed_mean"
+
+
+def test_self_consistency_confidence_falls_with_dispersion(sampled_llm):
+    metadata = _self_consistency(sampled_llm, "median")["consensus_metadata"]
+
+    # Unanimous samples are fully confident; stdev d maps to 1 - d/2
+    assert metadata["criteria_dispersion"]["Leadership"] == 0.0
+    assert metadata["criteria_confidence"]["Leadership"] == 1.0
+    dispersion = metadata["criteria_dispersion"]["Communication"]
+    assert dispersion == 1.247
+    assert metadata["criteria_confidence"]["Communication"] == round(1.0 - dispersion / 2.0, 3)
+    assert metadata["confidence"] == round((1.0 + metadata["criteria_confidence"]["Communication"]) / 2, 3)
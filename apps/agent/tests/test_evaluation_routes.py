@@ -0,0 +1,18 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/evaluation/evaluate", "/evaluation/simple"])
+@pytest.mark.parametrize("timeout", ["0", "-5"])
+def test_non_positive_request_timeout_is_rejected(path, timeout):
+    response = client.post(
+        path,
+        json={"rubric_id": "r1", "candidate_ids": ["c1"]},
+        headers={"X-Request-Timeout": timeout}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["header", "X-Request-Timeout"]
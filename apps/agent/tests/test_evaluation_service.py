@@ -0,0 +1,171 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from models.invoke import CandidateInput
+from services.evaluation_service import EvaluationService
+from services.local_search_service import LocalSearchService
+
+RUBRIC = {
+    "rubric_id": "r1",
+    "rubric_name": "Hiring",
+    "description": "desc",
+    "criteria": [
+        {"criterion_id": "c1", "name": "Communication", "description": "d", "definition": "d", "weight": 0.5},
+        {"criterion_id": "c2", "name": "Leadership", "description": "d", "definition": "d", "weight": 0.5},
+    ],
+}
+
+
+class RecordingChatModel(FakeListChatModel):
+    prompts: list = []
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs):
+        self.prompts.append("\n".join(str(m.content) for m in messages))
+        return super()._call(messages, stop, run_manager, **kwargs)
+
+
+def _fast_result(*confidences):
+    return {"evaluation": [
+        {"criterion_name": name, "score": 4.0, "reasoning": "r", "evidence": [], **confidence}
+        for name, confidence in zip(("Communication", "Leadership"), confidences)
+    ]}
+
+
+def _escalation_reason(fast_result):
+    service = EvaluationService(LocalSearchService())
+    evaluations = service._parse_batch_evaluation(RUBRIC, fast_result)
+    return service._cascade_escalation_reason(RUBRIC, fast_result, evaluations)
+
+
+def test_confident_fast_result_stands():
+    assert _escalation_reason(_fast_result({"confidence": 0.9}, {"confidence": 0.95})) is None
+
+
+def test_missing_confidence_escalates():
+    assert _escalation_reason(_fast_result({"confidence": 0.9}, {})) == "missing_confidence"
+
+
+def test_low_confidence_escalates():
+    assert _escalation_reason(_fast_result({"confidence": 0.9}, {"confidence": 0.2})) == "low_confidence"
+
+
+def _cascade(fast_response, strong_response):
+    service = EvaluationService(LocalSearchService())
+    service.fast_llm = FakeListChatModel(responses=[fast_response])
+    service.llm = FakeListChatModel(responses=[strong_response])
+    chunks = [{"chunk_id": "full_document", "content": "Candidate text", "related_criterion": "all"}]
+    evaluations, metadata = asyncio.run(service._evaluate_criteria_cascade(RUBRIC, chunks))
+    return service, evaluations, metadata
+
+
+def test_failed_escalation_is_not_reported_as_a_strong_result():
+    service, evaluations, metadata = _cascade("not json", "not json either")
+
+    assert metadata["cascade_tier"] == "prescreen_fallback"
+    assert metadata["cascade_escalated"] == "false"
+    assert metadata["cascade_escalation_reason"] == "fast_tier_error"
+    assert service.cascade_stats["escalated"] == 0
+    assert len(evaluations) == 2
+
+
+def test_failed_escalation_keeps_the_fast_result():
+    service, evaluations, metadata = _cascade(json.dumps(_fast_result({"confidence": 0.9}, {})), "not json")
+
+    assert metadata["cascade_tier"] == "fast_fallback"
+    assert metadata["cascade_escalation_reason"] == "missing_confidence"
+    assert service.cascade_stats["escalated"] == 0
+    assert [e.score for e in evaluations] == [4.0, 4.0]
+
+
+def test_successful_escalation_counts():
+    strong = {"evaluation": [
+        {"criterion_name": name, "score": 2.0, "reasoning": "r", "evidence": []}
+        for name in ("Communication", "Leadership")
+    ]}
+    service, evaluations, metadata = _cascade("not json", json.dumps(strong))
+
+    assert metadata["cascade_tier"] == "strong"
+    assert metadata["cascade_escalated"] == "true"
+    assert service.cascade_stats["escalated"] == 1
+    assert [e.score for e in evaluations] == [2.0, 2.0]
+
+
+def test_top_k_returns_pruned_candidates_with_their_bounds(monkeypatch):
+    service = EvaluationService(LocalSearchService())
+    service.fast_llm = None
+    prescreen = {"strong": 4.8, "good": 4.5, "weak": 1.2}
+    documents = [CandidateInput(candidate_id=cid, candidate_text=cid) for cid in prescreen]
+
+    async def rubric(name):
+        return RUBRIC
+
+    async def evaluate(docs, rubric_name, max_chunks):
+        return [{"candidate_id": doc.candidate_id} for doc in docs]
+
+    monkeypatch.setattr(service, "_get_rubric_direct", rubric)
+    monkeypatch.setattr(service, "_evaluate_documents_parallel", evaluate)
+    monkeypatch.setattr(service.prescreen_scorer, "score", lambda text, data: SimpleNamespace(overall_score=prescreen[text]))
+
+    results, pruned, metadata = asyncio.run(service._evaluate_documents_top_k(documents, "Hiring", 5, top_k=1))
+
+    assert [r["candidate_id"] for r in results] == ["strong", "good"]
+    assert [p.candidate_id for p in pruned] == ["weak"]
+    assert pruned[0].pruned and pruned[0].pruned_at_stage == "prescreen"
+    assert (pruned[0].score_lower, pruned[0].score_upper) == (1.0, 2.7)
+    assert metadata["top_k_pruned"] == "weak"
+
+
+def test_true_top_k_survives_when_prescreen_ranks_it_last(monkeypatch):
+    service = EvaluationService(LocalSearchService())
+    service.fast_llm = None
+    prescreen = {"hidden": 1.1, "keywordy": 4.9, "average": 4.6}
+    strong = {"hidden": 4.8, "keywordy": 2.0, "average": 3.0}
+    documents = [CandidateInput(candidate_id=cid, candidate_text=cid) for cid in prescreen]
+
+    async def rubric(name):
+        return RUBRIC
+
+    async def evaluate(docs, rubric_name, max_chunks):
+        return [{
+            "overall_score": strong[doc.candidate_id], "candidate_id": doc.candidate_id, "rubric_name": rubric_name,
+            "criteria_evaluations": [], "summary": "s", "strengths": [], "improvements": [],
+        } for doc in docs]
+
+    monkeypatch.setattr(service, "_get_rubric_direct", rubric)
+    monkeypatch.setattr(service, "_evaluate_documents_parallel", evaluate)
+    monkeypatch.setattr(service.prescreen_scorer, "score", lambda text, data: SimpleNamespace(overall_score=prescreen[text]))
+
+    batch = asyncio.run(service.evaluate_document_batch(documents, "Hiring", top_k=1))
+
+    assert batch["comparison_summary"]["best_candidate"]["candidate_id"] == "hidden"
+    assert batch["pruned_candidates"] == []
+    assert "TOPK_HEURISTIC_PRUNING" in batch["batch_metadata"]["top_k_skipped_reason"]
+
+    # Opting in prunes approximately, and says so
+    monkeypatch.setattr(service.settings, "topk_heuristic_pruning", True)
+    batch = asyncio.run(service.evaluate_document_batch(documents, "Hiring", top_k=1))
+    assert batch["batch_metadata"]["top_k_pruning"] == "approximate"
+    assert [p["candidate_id"] for p in batch["pruned_candidates"]] == ["hidden"]
+
+
+def test_batch_prompt_labels_criteria_by_the_name_the_parser_matches():
+    # The prompt used to label criteria by criterion_id while the parser matched
+    # on name, so the model was never shown the key it had to echo back.
+    response = json.dumps({"evaluation": [
+        {"criterion_name": "Communication", "score": 4.0, "reasoning": "r", "evidence": []},
+        {"criterion_name": "Leadership", "score": 2.0, "reasoning": "r", "evidence": []},
+    ]})
+    llm = RecordingChatModel(responses=[response], prompts=[])
+    service = EvaluationService(LocalSearchService())
+    chunks = [{"chunk_id": "full_document", "content": "Candidate text", "related_criterion": "all"}]
+
+    batch_result = asyncio.run(service._invoke_batch_evaluation(llm, RUBRIC, chunks, stage="test"))
+    evaluations = service._parse_batch_evaluation(RUBRIC, batch_result)
+
+    assert "Criterion: Communication" in llm.prompts[0]
+    assert "Criterion: Leadership" in llm.prompts[0]
+    assert "Criterion: c1" not in llm.prompts[0]
+    assert [(e.criterion_name, e.score) for e in evaluations] == [("Communication", 4.0), ("Leadership", 2.0)]
@@ -0,0 +1,52 @@
+import asyncio
+
+from models.invoke import PriorityClass
+from services import llm_scheduler
+from services.llm_hedging import LLMHedger
+from services.llm_scheduler import LLMScheduler
+
+
+def _hedger(stage):
+    hedger = LLMHedger(percentile=0.5, max_ratio=1.0, min_samples=1)
+    hedger._record(stage, 0.01)
+    return hedger
+
+
+def test_hedge_waits_for_its_own_slot(monkeypatch):
+    scheduler = LLMScheduler(max_concurrency=1, weights={}, caps={})
+    monkeypatch.setattr(llm_scheduler, "get_llm_scheduler", lambda: scheduler)
+    monkeypatch.setattr(llm_scheduler, "get_llm_hedger", lambda: _hedger("summary"))
+    running, peak = [], []
+
+    async def slow_call():
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.1)
+        running.pop()
+        return "primary"
+
+    result = asyncio.run(llm_scheduler.run_llm_call("summary", slow_call, hedge_factory=slow_call))
+
+    assert result == "primary"
+    assert max(peak) == 1
+    assert scheduler.total_running == 0
+
+
+def test_hedge_runs_alongside_primary_when_capacity_allows(monkeypatch):
+    scheduler = LLMScheduler(max_concurrency=2, weights={}, caps={})
+    monkeypatch.setattr(llm_scheduler, "get_llm_scheduler", lambda: scheduler)
+    monkeypatch.setattr(llm_scheduler, "get_llm_hedger", lambda: _hedger("summary"))
+
+    async def slow_primary():
+        await asyncio.sleep(1)
+        return "primary"
+
+    async def fast_hedge():
+        assert scheduler.total_running == 2
+        return "hedge"
+
+    result = asyncio.run(llm_scheduler.run_llm_call("summary", slow_primary, hedge_factory=fast_hedge))
+
+    assert result == "hedge"
+    assert scheduler.total_running == 0
+    assert scheduler.get_stats()["classes"][PriorityClass.INTERACTIVE.value]["completed"] == 2
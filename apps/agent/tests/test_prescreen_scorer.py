@@ -0,0 +1,88 @@
+from services.prescreen_scorer import PrescreenScorer
+
+# Descriptors from the seeded "TV Evaluation" rubric, in the definition format criteria_api stores
+LEVELS = {
+    "Picture Quality": [
+        (5, "Excellent", "OLED/QLED, deep blacks, wide color gamut"),
+        (4, "Good", "High contrast 4K LED"),
+        (3, "Fair", "Acceptable 4K/HD with some uniformity issues"),
+        (2, "Poor", "Visible banding or light bleed"),
+        (1, "Very Poor", "Low resolution / severe artifacts"),
+    ],
+    "Gaming Performance": [
+        (5, "Excellent", "<=5ms, 120Hz, VRR, ALLM"),
+        (4, "Good", "Low lag, 120Hz without full VRR"),
+        (3, "Fair", "~15ms, stable 60Hz"),
+        (2, "Poor", ">25ms noticeable lag"),
+        (1, "Very Poor", "Unsuitable for modern gaming"),
+    ],
+}
+
+
+def _definition(levels):
+    return "Summary: s\nLevels:\n" + "\n".join(f"{score} - {label}: {desc}" for score, label, desc in levels)
+
+
+def _rubric(**definitions):
+    return {
+        "rubric_id": "tv",
+        "version": "1.0.0",
+        "criteria": [
+            {"name": name, "weight": 0.5, "description": "d", "definition": definitions.get(name, _definition(levels))}
+            for name, levels in LEVELS.items()
+        ],
+    }
+
+
+def _criterion(text, name):
+    result = PrescreenScorer().score(text, _rubric())
+    return next(c for c in result.criteria if c.criterion_name == name)
+
+
+def test_level_five_text_outscores_level_one_text():
+    excellent = _criterion("OLED panel with deep blacks and a wide color gamut", "Picture Quality")
+    very_poor = _criterion("Low resolution panel with severe artifacts", "Picture Quality")
+
+    assert excellent.score > 4.5
+    assert very_poor.score < 1.5
+    assert excellent.confidence > 0
+
+
+def test_numeric_descriptors_compare_values_and_units():
+    fast = _criterion("Input lag of 4ms at 120Hz with VRR and ALLM", "Gaming Performance")
+    slow = _criterion("Input lag of 40ms", "Gaming Performance")
+
+    assert "<=5" in fast.matched and "120" in fast.matched
+    assert ">25" not in fast.matched
+    assert ">25" in slow.matched and "<=5" not in slow.matched
+    assert fast.score > 4.0 and slow.score < 2.5  # "lag" also hits level 4
+
+
+def test_tokens_shared_by_levels_are_down_weighted():
+    compiled = PrescreenScorer().compile(_rubric())
+    gaming = next(c for c in compiled if c.name == "Gaming Performance")
+    by_score = {level.score: level for level in gaming.levels}
+
+    assert by_score[4].tokens["lag"] == 0.5  # also in level 2
+    assert by_score[5].tokens["vrr"] == 0.5  # also in level 4 ("without full VRR")
+    assert by_score[5].tokens["allm"] == 1.0
+
+
+def test_text_matching_no_descriptor_gets_neutral_score():
+    unmatched = _criterion("A television.", "Gaming Performance")
+
+    assert unmatched.score == 3.0
+    assert unmatched.confidence == 0.0
+    assert unmatched.matched == []
+
+
+def test_edited_definition_misses_the_compiled_cache():
+    scorer = PrescreenScorer()
+    compiled = scorer.compile(_rubric())
+    assert scorer.compile(_rubric()) is compiled
+
+    edited = _definition([(5, "Excellent", "<=3ms, 144Hz")] + LEVELS["Gaming Performance"][1:])
+    recompiled = scorer.compile(_rubric(**{"Gaming Performance": edited}))
+    assert recompiled is not compiled
+    gaming = next(c for c in recompiled if c.name == "Gaming Performance")
+    assert [rule.value for rule in gaming.levels[0].numeric] == [3.0, 144.0]
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+
+from services.request_coalescer import IdempotencyKeyReused, RequestCoalescer
+
+KEY_A = RequestCoalescer.make_key("rubric", ["c1", "c2"], "deterministic", "overall_score")
+KEY_B = RequestCoalescer.make_key("rubric", ["c3"], "deterministic", "overall_score")
+
+
+def _counting_factory(calls, result=None, delay=0.05):
+    async def evaluate():
+        calls.append(1)
+        evaluation_id = f"eval-{len(calls)}"
+        await asyncio.sleep(delay)
+        return result or {"evaluation_id": evaluation_id, "status": "success"}
+    return lambda: evaluate()
+
+
+def test_identical_concurrent_requests_share_one_evaluation():
+    coalescer, calls = RequestCoalescer(), []
+
+    async def scenario():
+        return await asyncio.gather(*(coalescer.run(KEY_A, _counting_factory(calls)) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_idempotency_key_replays_only_the_same_request():
+    coalescer, calls = RequestCoalescer(), []
+
+    async def scenario():
+        first = await coalescer.run(KEY_A, _counting_factory(calls), idempotency_key="k1")
+        replay = await coalescer.run(KEY_A, _counting_factory(calls), idempotency_key="k1")
+        with pytest.raises(IdempotencyKeyReused):
+            await coalescer.run(KEY_B, _counting_factory(calls), idempotency_key="k1")
+        return first, replay
+
+    first, replay = asyncio.run(scenario())
+    assert first == replay
+    assert len(calls) == 1
+
+
+def test_idempotency_key_reused_while_in_flight_is_rejected():
+    coalescer, calls = RequestCoalescer(), []
+
+    async def scenario():
+        original = asyncio.ensure_future(coalescer.run(KEY_A, _counting_factory(calls), idempotency_key="k1"))
+        await asyncio.sleep(0)
+        with pytest.raises(IdempotencyKeyReused):
+            await coalescer.run(KEY_B, _counting_factory(calls), idempotency_key="k1")
+        return await original
+
+    asyncio.run(scenario())
+    assert len(calls) == 1
+
+
+def test_caller_with_later_deadline_does_not_join_shorter_evaluation():
+    coalescer, calls = RequestCoalescer(), []
+
+    async def scenario():
+        now = time.monotonic()
+        short = asyncio.ensure_future(coalescer.run(KEY_A, _counting_factory(calls), deadline=now + 1))
+        await asyncio.sleep(0)
+        longer = asyncio.ensure_future(coalescer.run(KEY_A, _counting_factory(calls), deadline=now + 60))
+        await asyncio.sleep(0)
+        shorter = asyncio.ensure_future(coalescer.run(KEY_A, _counting_factory(calls), deadline=now + 30))
+        return await asyncio.gather(short, longer, shorter)
+
+    short, longer, shorter = asyncio.run(scenario())
+    assert len(calls) == 2
+    assert short != longer
+    assert shorter == longer
+    assert coalescer.stats["deadline_not_coalesced"] == 1
@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from services import result_outbox
+from services.result_outbox import ResultOutbox
+
+
+@pytest.fixture
+def criteria_api(monkeypatch):
+    """Route outbox deliveries to a handler; returns the list of (path, ids) requests seen."""
+    requests = []
+    responses = {}
+
+    def handler(request):
+        body = json.loads(request.content)
+        items = body if isinstance(body, list) else [body]
+        requests.append((request.url.path, [item["id"] for item in items]))
+        status = max(responses.get(item["id"], 201) for item in items)
+        return httpx.Response(status, json=body)
+
+    monkeypatch.setattr(
+        result_outbox, "upstream_client",
+        lambda timeout: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return requests, responses
+
+
+def _outbox(tmp_path):
+    return ResultOutbox(str(tmp_path / "outbox.db"), "http://criteria-api", batch_size=10)
+
+
+def test_delivered_results_leave_the_outbox(tmp_path, criteria_api):
+    requests, _ = criteria_api
+    outbox = _outbox(tmp_path)
+    ids = [asyncio.run(outbox.enqueue({"rubric_id": "r1"})) for _ in range(3)]
+
+    assert outbox.pending_count() == 3
+    assert asyncio.run(outbox.drain_once()) == 3
+    assert requests == [("/candidates/evaluations/batch", ids)]
+    assert outbox.pending_count() == 0
+    assert outbox.dead_letter_count() == 0
+
+
+def test_server_errors_and_rate_limits_are_retried(tmp_path, criteria_api):
+    _, responses = criteria_api
+    outbox = _outbox(tmp_path)
+    first = asyncio.run(outbox.enqueue({"rubric_id": "r1"}))
+    second = asyncio.run(outbox.enqueue({"rubric_id": "r1"}))
+    responses[first] = 503
+    responses[second] = 429
+
+    assert asyncio.run(outbox.drain_once()) == 0
+    assert outbox.pending_count() == 2
+    assert outbox.dead_letter_count() == 0
+
+
+def test_rejected_result_is_dead_lettered_without_blocking_the_batch(tmp_path, criteria_api):
+    requests, responses = criteria_api
+    outbox = _outbox(tmp_path)
+    good = asyncio.run(outbox.enqueue({"rubric_id": "r1"}))
+    bad = asyncio.run(outbox.enqueue({"rubric_id": "missing"}))
+    responses[bad] = 422
+
+    assert asyncio.run(outbox.drain_once()) == 1
+    assert requests[1:] == [("/candidates/evaluations", [good]), ("/candidates/evaluations", [bad])]
+    assert outbox.pending_count() == 0
+    assert outbox.dead_letter_count() == 1
+
+    # Nothing left to retry
+    assert asyncio.run(outbox.drain_once()) == 0
+    assert len(requests) == 3
+
+
+def test_outbox_survives_a_restart(tmp_path, criteria_api):
+    evaluation_id = asyncio.run(_outbox(tmp_path).enqueue({"rubric_id": "r1"}))
+
+    reopened = _outbox(tmp_path)
+    assert reopened.pending_count() == 1
+    assert asyncio.run(reopened.drain_once()) == 1
+    assert criteria_api[0] == [("/candidates/evaluations/batch", [evaluation_id])]
@@ -0,0 +1,166 @@
+"""
+criteria_api read throughput under concurrent evaluation-result writes.
+
+Runs the same workload against a fresh SQLite database for each profile of
+``app.utils.db.create_db_engine`` ("default": rollback journal, SQLite's own
+settings; "wal": the WAL performance profile). Reader threads fetch single
+evaluation results and list pages, as ``GET /candidates/evaluations`` does,
+while writer threads insert batch-sized results. Reports reads and writes per
+second, read latency percentiles and "database is locked" errors.
+
+Usage:
+    python -m db.read_under_write --readers 8 --writers 2 --seconds 10
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from e2e.run import APPS_DIR, summarize
+
+sys.path.insert(0, str(APPS_DIR / "criteria_api"))
+# The module-level engine is created on import; keep it off the real database
+os.environ["SQLITE_DB_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='db-bench-')}/unused.db"
+
+from app.models import (  # noqa: E402,F401  (register every table)
+    candidate_orm, criteria_orm, decision_kit_orm, evaluation_result_orm, rubric_criterion_orm, rubric_orm,
+    rubric_snapshot_orm,
+)
+from app.models.evaluation_result_orm import EvaluationResultORM  # noqa: E402
+from app.utils.db import Base, create_db_engine  # noqa: E402
+
+
+def _result(rng: random.Random, candidates: int) -> EvaluationResultORM:
+    now = datetime.now(timezone.utc)
+    individual = [
+        {
+            "candidate_id": f"candidate-{rng.randrange(10**6):06d}",
+            "overall_score": round(rng.uniform(1, 5), 2),
+            "criteria_evaluations": [
+                {"criterion_name": f"Criterion {i}", "score": rng.randint(2, 10) / 2,
+                 "reasoning": "Evidence found in recent roles. " * 4, "evidence": ["Led a migration"]}
+                for i in range(6)
+            ],
+        }
+        for _ in range(candidates)
+    ]
+    return EvaluationResultORM(
+        id=str(uuid.uuid4()), rubric_id="benchmark-rubric", overall_score=individual[0]["overall_score"],
+        rubric_name="Benchmark rubric", total_candidates=candidates, is_batch="true" if candidates > 1 else "false",
+        individual_results=individual, comparison_summary=None, evaluation_metadata={"workflow": "id_based"},
+        created_at=now, updated_at=now,
+    )
+
+
+def run_profile(profile: str, args: argparse.Namespace, work_dir: Path) -> Dict[str, Any]:
+    engine = create_db_engine(f"sqlite:///{work_dir / f'{profile}.db'}", profile=profile,
+                              pool_size=args.readers + args.writers)
+    Session = sessionmaker(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(0)
+    with Session() as db:
+        seeded = [_result(rng, args.batch_size) for _ in range(args.seed_rows)]
+        db.add_all(seeded)
+        db.commit()
+        ids = [r.id for r in seeded]
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    read_latencies: List[float] = []
+    counts = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0}
+
+    def reader(seed: int) -> None:
+        local_rng = random.Random(seed)
+        latencies = []
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with Session() as db:
+                    if local_rng.random() < 0.8:
+                        db.query(EvaluationResultORM).filter(EvaluationResultORM.id == local_rng.choice(ids)).first()
+                    else:
+                        db.query(EvaluationResultORM).order_by(EvaluationResultORM.created_at.desc()).limit(20).all()
+            except OperationalError:
+                with lock:
+                    counts["read_errors"] += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+        with lock:
+            read_latencies.extend(latencies)
+            counts["reads"] += len(latencies)
+
+    def writer(seed: int) -> None:
+        local_rng = random.Random(seed)
+        while not stop.is_set():
+            try:
+                with Session() as db:
+                    db.add(_result(local_rng, args.batch_size))
+                    db.commit()
+            except OperationalError:
+                with lock:
+                    counts["write_errors"] += 1
+                continue
+            with lock:
+                counts["writes"] += 1
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    threads += [threading.Thread(target=writer, args=(1000 + i,)) for i in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    return {
+        "profile": profile,
+        "reads_per_second": round(counts["reads"] / args.seconds, 1),
+        "writes_per_second": round(counts["writes"] / args.seconds, 1),
+        "read_latency_ms": summarize(read_latencies),
+        "read_errors": counts["read_errors"],
+        "write_errors": counts["write_errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--profiles", default="default,wal")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--seed-rows", type=int, default=500, help="Evaluation results stored before the run")
+    parser.add_argument("--batch-size", type=int, default=5, help="Candidates per written evaluation result")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="db-bench-") as tmp:
+        for profile in [p.strip() for p in args.profiles.split(",") if p.strip()]:
+            result = run_profile(profile, args, Path(tmp))
+            results.append(result)
+            latency = result["read_latency_ms"]
+            print(f"{profile:<8} reads/s={result['reads_per_second']:<8} writes/s={result['writes_per_second']:<7} "
+                  f"read p50={latency['p50']} p95={latency['p95']} p99={latency['p99']} ms "
+                  f"errors r/w={result['read_errors']}/{result['write_errors']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
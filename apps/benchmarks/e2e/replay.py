@@ -0,0 +1,118 @@
+"""
+Replay recorded evaluations offline.
+
+Runs the agent's ``EvaluationService.evaluate`` in-process against cassettes
+recorded with ``CASSETTE_MODE=record``: every LLM, search and criteria_api
+exchange is served from the cassettes, so no upstream is needed and repeated
+runs do identical work. With ``--latency zero`` the wall time is the agent's
+own CPU and scheduling overhead, which makes this the input for profiling
+(``--profile out.prof``, then ``python -m pstats out.prof`` or snakeviz).
+
+Usage:
+    python -m e2e.replay path/to/cassettes --latency zero --repeat 5 --profile replay.prof
+"""
+
+import argparse
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from e2e.run import APPS_DIR, summarize
+
+
+def _configure_agent(args: argparse.Namespace, consensus: bool, recorded: Dict[str, str]) -> None:
+    """Point the agent's settings at the cassettes before the evaluation service is built."""
+    os.environ.update({k: v for k, v in recorded.items() if v})
+    os.environ.update({
+        "CASSETTE_MODE": "replay",
+        "CASSETTE_PATH": str(Path(args.cassettes).resolve()),
+        "CASSETTE_REPLAY_LATENCY": args.latency,
+        # Replay ignores hosts; the LLM and search clients only need to be configured
+        "AZURE_OPENAI_ENDPOINT": "http://replay.invalid",
+        "AZURE_OPENAI_API_KEY": "replay",
+        "AZURE_SEARCH_ENDPOINT": "http://replay.invalid",
+        "AZURE_SEARCH_API_KEY": "replay",
+        "CRITERIA_API_URL": "http://replay.invalid",
+        "USE_CONSENSUS_EVALUATION": "true" if consensus else "false",
+        "USE_RESULT_OUTBOX": "false",
+    })
+    from config import get_settings
+
+    # Loading the cassettes already read the settings once
+    get_settings.cache_clear()
+    logging.getLogger().setLevel(os.environ.get("LOG_LEVEL", "WARNING"))
+
+
+async def replay(evaluations: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    from services.evaluation_service import get_evaluation_service
+
+    service = get_evaluation_service()
+    latencies: List[float] = []
+    failures = 0
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    for _ in range(repeat):
+        for evaluation in evaluations:
+            started = time.perf_counter()
+            result = await service.evaluate(evaluation["rubric_id"], evaluation["candidate_ids"])
+            latencies.append((time.perf_counter() - started) * 1000)
+            if result.get("error"):
+                failures += 1
+                print(f"  {evaluation['rubric_id']} {evaluation['candidate_ids']}: {result['error']}", file=sys.stderr)
+    return {
+        "evaluations": len(latencies),
+        "failures": failures,
+        "wall_seconds": round(time.perf_counter() - wall_started, 3),
+        "cpu_seconds": round(time.process_time() - cpu_started, 3),
+        "latency_ms": summarize(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("cassettes", help="Cassette file or directory of cassettes")
+    parser.add_argument("--latency", choices=("original", "zero"), default="zero",
+                        help="Wait the recorded upstream latency, or answer immediately")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay every cassette this many times")
+    parser.add_argument("--profile", default=None, help="Write cProfile stats to this file")
+    parser.add_argument("--output", default=None, help="Write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(APPS_DIR / "agent"))
+    from services.cassette import load_cassettes
+
+    cassettes = load_cassettes(args.cassettes)
+    evaluations = [cassette["evaluation"] for cassette in cassettes]
+    if not evaluations:
+        parser.error(f"No cassettes found at {args.cassettes}")
+    modes = {bool(e.get("consensus")) for e in evaluations}
+    if len(modes) > 1:
+        parser.error("Cassettes mix standard and consensus evaluations; replay them separately")
+    recorded = [cassette.get("settings", {}) for cassette in cassettes]
+    if any(r != recorded[0] for r in recorded):
+        parser.error("Cassettes were recorded with different deployments or indexes; replay them separately")
+    _configure_agent(args, consensus=modes.pop(), recorded=recorded[0])
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    summary = asyncio.run(replay(evaluations, args.repeat))
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+
+    summary["latency"] = args.latency
+    print(json.dumps(summary, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
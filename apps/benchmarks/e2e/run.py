@@ -0,0 +1,352 @@
+"""
+End-to-end benchmark for the evaluation pipeline.
+
+Boots the fake Azure OpenAI server, the Azure Search emulator, criteria_api
+(on a throwaway SQLite database) and the agent as local processes, creates a
+rubric, then drives ``POST /evaluation/evaluate`` for every combination of
+mode (standard, consensus), batch size and concurrency. For each scenario it
+reports throughput and p50/p95/p99 of the end-to-end latency and of every
+pipeline stage (from the ``stage_timings_ms`` the agent stores in the
+evaluation metadata), and writes everything to a JSON results file.
+
+Usage:
+    python -m e2e.run --modes standard,consensus --batch-sizes 1,5 --concurrency 1,8 --requests 40 \\
+        --output results.json --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+BENCHMARKS_DIR = Path(__file__).resolve().parents[1]
+APPS_DIR = BENCHMARKS_DIR.parent
+INDEX_NAME = "candidates"
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return round(ordered[int(rank) - 1], 1)
+
+
+def summarize(values: List[float]) -> Dict[str, Any]:
+    return {"count": len(values), **{f"p{p}": percentile(values, p) for p in PERCENTILES}}
+
+
+def _csv(text: str) -> List[str]:
+    return [part.strip() for part in text.split(",") if part.strip()]
+
+
+def _ints(text: str) -> List[int]:
+    return [int(part) for part in _csv(text)]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APPS_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Service:
+    """A local server process whose output goes to a log file."""
+
+    def __init__(self, name: str, args: List[str], cwd: Path, health_url: str,
+                 log_dir: Path, env: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.health_url = health_url
+        self.log_path = log_dir / f"{name}.log"
+        self._log = open(self.log_path, "w", encoding="utf-8")
+        self.process = subprocess.Popen(
+            [sys.executable, *args], cwd=cwd, env={**os.environ, **(env or {})},
+            stdout=self._log, stderr=subprocess.STDOUT,
+        )
+
+    def wait_ready(self, timeout: float = 60.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"{self.name} exited with {self.process.returncode}; see {self.log_path}")
+            try:
+                if httpx.get(self.health_url, timeout=1.0).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        raise RuntimeError(f"{self.name} did not become ready within {timeout:.0f}s; see {self.log_path}")
+
+    def stop(self) -> None:
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self._log.close()
+
+
+def _start(stack: ExitStack, service: Service) -> Service:
+    stack.callback(service.stop)
+    service.wait_ready()
+    return service
+
+
+def start_backends(stack: ExitStack, args: argparse.Namespace, work_dir: Path) -> Dict[str, str]:
+    """Start the fakes and criteria_api; return their base URLs."""
+    openai_url = f"http://127.0.0.1:{args.base_port}"
+    search_url = f"http://127.0.0.1:{args.base_port + 1}"
+    criteria_url = f"http://127.0.0.1:{args.base_port + 2}"
+
+    openai_args = ["-m", "fakes.openai_server", "--port", str(args.base_port), "--latency", args.llm_latency]
+    if args.llm_max_concurrency:
+        openai_args += ["--max-concurrency", str(args.llm_max_concurrency)]
+    _start(stack, Service("openai", openai_args, BENCHMARKS_DIR, f"{openai_url}/stats", work_dir))
+    _start(stack, Service(
+        "search",
+        ["-m", "fakes.search_server", "--port", str(args.base_port + 1), "--documents", str(args.documents),
+         "--index", INDEX_NAME, "--latency-ms", str(args.search_latency_ms)],
+        BENCHMARKS_DIR, f"{search_url}/stats", work_dir,
+    ))
+    _start(stack, Service(
+        "criteria_api",
+        ["-m", "uvicorn", "app.main:app", "--port", str(args.base_port + 2), "--log-level", "warning"],
+        APPS_DIR / "criteria_api", f"{criteria_url}/healthz", work_dir,
+        env={"SQLITE_DB_URL": f"sqlite:///{work_dir / 'criteria.db'}"},
+    ))
+    return {"openai": openai_url, "search": search_url, "criteria_api": criteria_url}
+
+
+def start_agent(stack: ExitStack, args: argparse.Namespace, work_dir: Path,
+                urls: Dict[str, str], mode: str) -> str:
+    """Start the agent configured for ``mode``; return its base URL."""
+    agent_url = f"http://127.0.0.1:{args.base_port + 3}"
+    env = {
+        "AZURE_OPENAI_ENDPOINT": urls["openai"],
+        "AZURE_OPENAI_API_KEY": "fake",
+        "AZURE_OPENAI_DEPLOYMENT": "fake",
+        "AZURE_SEARCH_ENDPOINT": urls["search"],
+        "AZURE_SEARCH_API_KEY": "fake",
+        "AZURE_SEARCH_INDEX": INDEX_NAME,
+        "CRITERIA_API_URL": urls["criteria_api"],
+        "USE_CONSENSUS_EVALUATION": "true" if mode == "consensus" else "false",
+    }
+    for item in args.agent_env:
+        key, _, value = item.partition("=")
+        env[key] = value
+    _start(stack, Service(
+        f"agent-{mode}",
+        ["-m", "uvicorn", "main:app", "--port", str(args.base_port + 3), "--log-level", "warning"],
+        APPS_DIR / "agent", f"{agent_url}/healthz", work_dir, env=env,
+    ))
+    return agent_url
+
+
+def create_rubric(criteria_url: str, criteria_count: int) -> str:
+    """Create the benchmark rubric in criteria_api and return its id."""
+    topics = ["Technical Skills", "System Design", "Leadership", "Communication", "Delivery", "Operations",
+              "Security Awareness", "Mentoring", "Product Sense", "Data Literacy"]
+    # criteria_api wants weights in 0.05 steps summing to 1.0: share 20 steps out evenly
+    steps = [20 // criteria_count + (1 if i < 20 % criteria_count else 0) for i in range(criteria_count)]
+    criteria = []
+    for i in range(criteria_count):
+        name = topics[i % len(topics)] + (f" {i // len(topics) + 1}" if i >= len(topics) else "")
+        criteria.append({
+            "name": name,
+            "description": f"Evidence of {name.lower()}",
+            "definition": f"Score 1-5 on demonstrated {name.lower()} in the resume",
+            "weight": round(steps[i] * 0.05, 2),
+        })
+    response = httpx.post(
+        f"{criteria_url}/rubrics/",
+        json={"name": "Benchmark rubric", "description": "Synthetic rubric for end-to-end benchmarks",
+              "criteria": criteria},
+        timeout=30.0,
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def run_scenario(agent_url: str, criteria_url: str, rubric_id: str, mode: str, batch_size: int,
+                       concurrency: int, requests: int, documents: int, offset: int) -> Dict[str, Any]:
+    """Drive ``requests`` evaluations at ``concurrency`` and summarize them.
+
+    Each request asks for a distinct set of candidates (starting at ``offset``)
+    so identical in-flight requests are not coalesced by the agent.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    stages: Dict[str, List[float]] = {}
+    statuses: Dict[str, int] = {}
+
+    async with httpx.AsyncClient(timeout=600.0, limits=httpx.Limits(max_connections=concurrency + 4)) as client:
+
+        async def one(index: int) -> None:
+            candidate_ids = [
+                f"candidate-{(offset + index * batch_size + j) % documents:06d}" for j in range(batch_size)
+            ]
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        f"{agent_url}/evaluation/evaluate",
+                        json={"rubric_id": rubric_id, "candidate_ids": candidate_ids},
+                    )
+                except httpx.HTTPError as e:
+                    statuses[type(e).__name__] = statuses.get(type(e).__name__, 0) + 1
+                    return
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            body = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+            status = str(response.status_code) if response.status_code != 200 else body.get("status", "200")
+            statuses[status] = statuses.get(status, 0) + 1
+            if status != "success":
+                return
+            latencies.append(elapsed_ms)
+
+            evaluation_id = body.get("evaluation_id")
+            if not evaluation_id:
+                return
+            saved = await client.get(f"{criteria_url}/candidates/evaluations/{evaluation_id}")
+            if saved.status_code != 200:
+                return
+            metadata = saved.json().get("evaluation_metadata") or {}
+            try:
+                timings = json.loads(metadata.get("stage_timings_ms") or "{}")
+            except (TypeError, ValueError):
+                timings = {}
+            for stage, summary in timings.items():
+                stages.setdefault(stage, []).append(summary["total_ms"])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        wall_seconds = time.perf_counter() - started
+
+    succeeded = len(latencies)
+    return {
+        "mode": mode,
+        "batch_size": batch_size,
+        "concurrency": concurrency,
+        "requests": requests,
+        "succeeded": succeeded,
+        "statuses": statuses,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_rps": round(succeeded / wall_seconds, 3) if wall_seconds else 0.0,
+        "candidates_per_second": round(succeeded * batch_size / wall_seconds, 3) if wall_seconds else 0.0,
+        "latency_ms": summarize(latencies),
+        "stages_ms": {stage: summarize(values) for stage, values in sorted(stages.items())},
+    }
+
+
+def scenario_key(scenario: Dict[str, Any]) -> str:
+    return f"{scenario['mode']}/batch={scenario['batch_size']}/c={scenario['concurrency']}"
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """Print one line per scenario (with deltas against ``baseline`` when given) and its stage breakdown."""
+    previous = {scenario_key(s): s for s in (baseline or {}).get("scenarios", [])}
+
+    def delta(current: Optional[float], before: Optional[float]) -> str:
+        if current is None or not before:
+            return ""
+        return f" ({(current - before) / before * 100:+.1f}%)"
+
+    for scenario in results["scenarios"]:
+        key = scenario_key(scenario)
+        old = previous.get(key, {})
+        latency = scenario["latency_ms"]
+        old_latency = old.get("latency_ms", {})
+        print(
+            f"{key:<32} ok={scenario['succeeded']}/{scenario['requests']} "
+            f"rps={scenario['throughput_rps']}{delta(scenario['throughput_rps'], old.get('throughput_rps'))} "
+            + " ".join(f"p{p}={latency[f'p{p}']}{delta(latency[f'p{p}'], old_latency.get(f'p{p}'))}"
+                       for p in PERCENTILES)
+        )
+        for stage, summary in scenario["stages_ms"].items():
+            old_stage = old.get("stages_ms", {}).get(stage, {})
+            print(f"    {stage:<36} " + " ".join(
+                f"p{p}={summary[f'p{p}']}{delta(summary[f'p{p}'], old_stage.get(f'p{p}'))}" for p in PERCENTILES
+            ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modes", default="standard,consensus", help="Comma-separated: standard, consensus")
+    parser.add_argument("--batch-sizes", default="1,5", help="Comma-separated candidates per request")
+    parser.add_argument("--concurrency", default="1,8", help="Comma-separated concurrent requests")
+    parser.add_argument("--requests", type=int, default=40, help="Requests per scenario")
+    parser.add_argument("--criteria", type=int, default=6, help="Criteria in the benchmark rubric (1-20)")
+    parser.add_argument("--documents", type=int, default=5000, help="Size of the search corpus")
+    parser.add_argument("--llm-latency", default="lognormal:800:0.4", help="Latency spec for the fake LLM")
+    parser.add_argument("--llm-max-concurrency", type=int, default=None,
+                        help="Fake LLM answers 429 above this many in-flight requests")
+    parser.add_argument("--search-latency-ms", type=float, default=0.0)
+    parser.add_argument("--agent-env", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra agent environment variable (repeatable)")
+    parser.add_argument("--base-port", type=int, default=18081,
+                        help="Fake LLM port; search, criteria_api and the agent use the next three")
+    parser.add_argument("--output", default="results.json", help="Machine-readable results file")
+    parser.add_argument("--compare", default=None, help="Previous results file to print deltas against")
+    args = parser.parse_args()
+
+    if not 1 <= args.criteria <= 20:
+        parser.error("--criteria must be between 1 and 20")
+    modes = _csv(args.modes)
+    unknown = set(modes) - {"standard", "consensus"}
+    if unknown:
+        parser.error(f"Unknown mode(s): {', '.join(sorted(unknown))}")
+
+    results: Dict[str, Any] = {
+        "git_commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "scenarios": [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="e2e-bench-") as tmp, ExitStack() as stack:
+        work_dir = Path(tmp)
+        urls = start_backends(stack, args, work_dir)
+        rubric_id = create_rubric(urls["criteria_api"], args.criteria)
+        offset = 0
+        for mode in modes:
+            with ExitStack() as agent_stack:
+                agent_url = start_agent(agent_stack, args, work_dir, urls, mode)
+                for batch_size in _ints(args.batch_sizes):
+                    for concurrency in _ints(args.concurrency):
+                        scenario = asyncio.run(run_scenario(
+                            agent_url, urls["criteria_api"], rubric_id, mode, batch_size,
+                            concurrency, args.requests, args.documents, offset,
+                        ))
+                        offset += args.requests * batch_size
+                        results["scenarios"].append(scenario)
+                        print(f"done {scenario_key(scenario)}", file=sys.stderr)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Comparing {results['git_commit']} against {baseline.get('git_commit')}")
+    print_report(results, baseline)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
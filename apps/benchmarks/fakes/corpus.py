@@ -0,0 +1,80 @@
+"""
+Seeded synthetic candidate corpus.
+
+Generates deterministic resume-like candidate documents in the shape the agent
+reads from the Azure Search index (id, candidate_id, decision_kit_id, title,
+name, content). The same seed always yields the same corpus, so benchmark runs
+are comparable across commits.
+"""
+
+import json
+import random
+from typing import Any, Dict, List
+
+ROLES = [
+    "Backend Engineer", "Frontend Engineer", "Data Scientist", "DevOps Engineer",
+    "Security Engineer", "Product Manager", "Site Reliability Engineer", "ML Engineer",
+]
+SENIORITY = ["Junior", "Mid-level", "Senior", "Staff", "Principal"]
+SKILLS = [
+    "Python", "Java", "Go", "TypeScript", "React", "Kubernetes", "Docker", "Terraform",
+    "PostgreSQL", "Redis", "Kafka", "Spark", "PyTorch", "AWS", "Azure", "GCP",
+    "FastAPI", "Django", "Spring Boot", "GraphQL", "Prometheus", "Grafana", "CI/CD",
+]
+ACHIEVEMENTS = [
+    "Led migration from a monolith to microservices, cutting deployment time by {n}%",
+    "Reduced p99 API latency by {n}% through caching and query optimization",
+    "Mentored {n} junior engineers and ran technical interviews",
+    "Designed an event-driven pipeline processing {n}M events per day",
+    "Owned on-call rotation and reduced incident count by {n}%",
+    "Introduced automated testing, raising coverage to {n}%",
+    "Shipped a customer-facing feature used by {n}K users",
+    "Drove a cost optimization initiative saving {n}% of cloud spend",
+]
+COMPANIES = ["TechCorp", "DataWorks", "CloudNine", "Finlytics", "HealthStack", "RetailOne", "Streamly"]
+TRAITS = [
+    "communicates clearly with stakeholders", "collaborates across teams", "takes ownership of outcomes",
+    "documents decisions thoroughly", "prioritizes ruthlessly", "adapts quickly to new domains",
+]
+
+
+def _candidate(rng: random.Random, index: int, decision_kits: int) -> Dict[str, Any]:
+    role = rng.choice(ROLES)
+    level = rng.choice(SENIORITY)
+    years = rng.randint(1, 20)
+    skills = rng.sample(SKILLS, k=rng.randint(4, 10))
+    jobs = []
+    for _ in range(rng.randint(1, 4)):
+        bullets = [a.format(n=rng.randint(2, 90)) for a in rng.sample(ACHIEVEMENTS, k=rng.randint(2, 4))]
+        jobs.append(f"{rng.choice(SENIORITY)} {role} | {rng.choice(COMPANIES)}\n" + "\n".join(f"- {b}" for b in bullets))
+    content = (
+        f"SUMMARY\n{level} {role} with {years} years of experience. "
+        f"Candidate {', '.join(rng.sample(TRAITS, k=2))}.\n\n"
+        f"TECHNICAL SKILLS\n{', '.join(skills)}\n\n"
+        f"EXPERIENCE\n" + "\n\n".join(jobs)
+    )
+    candidate_id = f"candidate-{index:06d}"
+    return {
+        "id": f"doc-{index:06d}",
+        "candidate_id": candidate_id,
+        "decision_kit_id": f"kit-{index % decision_kits:03d}",
+        "title": f"{level} {role}",
+        "name": f"{candidate_id} - {level} {role} Resume",
+        "content": content,
+    }
+
+
+def generate_corpus(count: int = 5000, decision_kits: int = 50, seed: int = 42) -> List[Dict[str, Any]]:
+    """Deterministic list of ``count`` candidate documents spread over ``decision_kits`` kits."""
+    rng = random.Random(seed)
+    return [_candidate(rng, i, max(1, decision_kits)) for i in range(count)]
+
+
+def load_corpus(path: str) -> List[Dict[str, Any]]:
+    """Load documents from a JSON array or JSON Lines file."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
@@ -0,0 +1,297 @@
+"""
+Fake Azure OpenAI chat-completions server for load and latency testing.
+
+Speaks the subset of the (Azure) OpenAI REST API that ``AzureChatOpenAI`` uses,
+so pointing ``AZURE_OPENAI_ENDPOINT`` at it exercises the agent's real LLM code
+path without spending quota. Answers are deterministic JSON shaped like the
+responses to ``BATCH_EVALUATION_PROMPT``, ``DEBATE_REFINEMENT_PROMPT`` and
+``SUMMARY_PROMPT``; scores are derived from a hash of the criterion and the
+document so repeated runs produce identical evaluations.
+
+Latency follows a configurable distribution plus a per-output-token cost, and
+429s can be injected at random or whenever concurrency exceeds a limit.
+
+Usage:
+    python -m fakes.openai_server --port 8081 --latency lognormal:800:0.4 --max-concurrency 16
+
+Then run the agent with:
+    AZURE_OPENAI_ENDPOINT=http://localhost:8081 AZURE_OPENAI_API_KEY=fake AZURE_OPENAI_DEPLOYMENT=fake
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+CRITERION_LINE = re.compile(r"^Criterion:\s*(.+?)\s*$", re.MULTILINE)
+CRITERION_HEADING = re.compile(r"^\*\*(.+?)\*\*\s*\(Weight:", re.MULTILINE)
+
+
+@dataclass
+class LatencyModel:
+    """Response latency: a base distribution plus a cost per output token."""
+
+    kind: str = "lognormal"
+    params: List[float] = field(default_factory=lambda: [800.0, 0.4])
+    ms_per_output_token: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str, ms_per_output_token: float = 0.0) -> "LatencyModel":
+        """Parse ``fixed:MS``, ``uniform:LO_MS:HI_MS`` or ``lognormal:MEDIAN_MS:SIGMA``."""
+        kind, *params = spec.split(":")
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2}
+        if kind not in expected or len(params) != expected[kind]:
+            raise ValueError(f"Invalid latency spec '{spec}'")
+        return cls(kind, [float(p) for p in params], ms_per_output_token)
+
+    def sample(self, rng: random.Random, output_tokens: int) -> float:
+        """Seconds to wait before answering."""
+        if self.kind == "fixed":
+            base = self.params[0]
+        elif self.kind == "uniform":
+            base = rng.uniform(self.params[0], self.params[1])
+        else:
+            median, sigma = self.params
+            base = median * rng.lognormvariate(0.0, sigma)
+        return (base + self.ms_per_output_token * output_tokens) / 1000.0
+
+
+@dataclass
+class FakeOpenAIConfig:
+    """Behaviour of the fake server."""
+
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    rate_limit_probability: float = 0.0
+    max_concurrency: Optional[int] = None
+    retry_after_seconds: int = 1
+    seed: int = 0
+
+
+def _stable_fraction(*parts: str) -> float:
+    """Deterministic value in [0, 1) from the given strings."""
+    digest = hashlib.sha256("\x1f".join(parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+def _section(prompt: str, start: str, end: str) -> str:
+    """Text between two markers of a prompt (empty if the start marker is missing)."""
+    begin = prompt.find(start)
+    if begin < 0:
+        return ""
+    begin += len(start)
+    finish = prompt.find(end, begin)
+    return prompt[begin:finish if finish >= 0 else None]
+
+
+def _criterion_names(text: str) -> List[str]:
+    names = CRITERION_LINE.findall(text) or CRITERION_HEADING.findall(text)
+    return list(dict.fromkeys(name.strip() for name in names))
+
+
+def _score(criterion: str, document: str, bias: float, sample: int) -> float:
+    """Deterministic 1-5 score in half steps, shifted by evaluator persona and sample index."""
+    raw = 1.0 + 4.0 * _stable_fraction(criterion, document[:4000], str(sample)) + bias
+    return min(5.0, max(1.0, round(raw * 2) / 2))
+
+
+def _persona_bias(prompt: str) -> float:
+    head = prompt[:400]
+    if "STRICT EVALUATOR" in head:
+        return -0.5
+    if "GENEROUS EVALUATOR" in head:
+        return 0.5
+    return 0.0
+
+
+def _evaluation_answer(names: List[str], document: str, bias: float, sample: int) -> Dict[str, Any]:
+    evaluation = []
+    for name in names:
+        score = _score(name, document, bias, sample)
+        evaluation.append({
+            "criterion_name": name,
+            "score": score,
+            "reasoning": f"The document shows {'strong' if score >= 4 else 'partial' if score >= 2.5 else 'little'} "
+                         f"evidence for {name}.",
+            "evidence": [document.strip()[:80]] if document.strip() else [],
+            "confidence": round(0.5 + 0.5 * _stable_fraction(name, "confidence", str(sample)), 2),
+        })
+    return {"evaluation": evaluation}
+
+
+def _summary_answer(prompt: str) -> Dict[str, Any]:
+    rubric = _section(prompt, "Rubric:", "\n").strip() or "the rubric"
+    overall = _section(prompt, "Overall Score:", "/").strip() or "n/a"
+    lines = [line[2:] for line in _section(prompt, "Individual Criterion Evaluations:", "Create a").splitlines()
+             if line.startswith("- ")]
+    scored = []
+    for line in lines:
+        name, _, rest = line.partition(":")
+        try:
+            scored.append((float(rest.strip().split("/")[0]), name.strip()))
+        except ValueError:
+            continue
+    scored.sort(reverse=True)
+    return {
+        "summary": f"Overall score {overall} against {rubric}.",
+        "strengths": [name for _, name in scored[:3]] or ["No clear strengths identified"],
+        "improvements": [name for _, name in scored[::-1][:3]] or ["No clear improvements identified"],
+    }
+
+
+def build_answer(prompt: str, sample: int = 0) -> str:
+    """Deterministic JSON answer for an agent prompt."""
+    if "Individual Criterion Evaluations:" in prompt:
+        answer = _summary_answer(prompt)
+    elif "Disputed Criteria:" in prompt:
+        names = _criterion_names(_section(prompt, "Disputed Criteria:", "Document Content:"))
+        document = _section(prompt, "Document Content:", "INSTRUCTIONS:")
+        answer = _evaluation_answer(names, document, _persona_bias(prompt) / 2, sample)
+    else:
+        names = _criterion_names(_section(prompt, "Criteria to Evaluate:", "Document Content:"))
+        document = _section(prompt, "Document Content:", "INSTRUCTIONS:")
+        answer = _evaluation_answer(names, document, _persona_bias(prompt), sample)
+    return json.dumps(answer)
+
+
+def _count_tokens(text: str) -> int:
+    # Roughly four characters per token, as for English text with cl100k-style tokenizers
+    return max(1, len(text) // 4)
+
+
+def create_app(config: Optional[FakeOpenAIConfig] = None) -> FastAPI:
+    """Build the fake server app."""
+    config = config or FakeOpenAIConfig()
+    rng = random.Random(config.seed)
+    app = FastAPI(title="Fake Azure OpenAI")
+    state = {"in_flight": 0}
+    stats = {
+        "requests": 0,
+        "completed": 0,
+        "rate_limited": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "latency_seconds_total": 0.0,
+        "max_in_flight": 0,
+    }
+
+    def _rate_limited() -> JSONResponse:
+        stats["rate_limited"] += 1
+        return JSONResponse(
+            status_code=429,
+            content={"error": {"code": "429", "message": "Rate limit is exceeded. Try again later."}},
+            headers={"Retry-After": str(config.retry_after_seconds)},
+        )
+
+    async def _complete(body: Dict[str, Any], model: str) -> JSONResponse:
+        stats["requests"] += 1
+        if rng.random() < config.rate_limit_probability:
+            return _rate_limited()
+        if config.max_concurrency is not None and state["in_flight"] >= config.max_concurrency:
+            return _rate_limited()
+
+        state["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], state["in_flight"])
+        try:
+            prompt = "\n".join(
+                message.get("content") if isinstance(message.get("content"), str) else json.dumps(message.get("content"))
+                for message in body.get("messages", [])
+            )
+            n = int(body.get("n") or 1)
+            contents = [build_answer(prompt, sample=i if n > 1 else 0) for i in range(n)]
+            prompt_tokens = _count_tokens(prompt)
+            completion_tokens = sum(_count_tokens(c) for c in contents)
+
+            delay = config.latency.sample(rng, completion_tokens)
+            await asyncio.sleep(delay)
+
+            stats["completed"] += 1
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+            stats["latency_seconds_total"] += delay
+            return JSONResponse({
+                "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": i,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                    for i, content in enumerate(contents)
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            })
+        finally:
+            state["in_flight"] -= 1
+
+    @app.post("/openai/deployments/{deployment}/chat/completions")
+    async def azure_chat_completions(deployment: str, request: Request) -> JSONResponse:
+        return await _complete(await request.json(), deployment)
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> JSONResponse:
+        body = await request.json()
+        return await _complete(body, body.get("model", "fake"))
+
+    @app.get("/stats")
+    async def get_stats() -> Dict[str, Any]:
+        completed = stats["completed"]
+        return {
+            **stats,
+            "in_flight": state["in_flight"],
+            "mean_latency_ms": round(stats["latency_seconds_total"] / completed * 1000, 1) if completed else 0.0,
+        }
+
+    @app.post("/stats/reset")
+    async def reset_stats() -> Dict[str, str]:
+        for key in stats:
+            stats[key] = 0.0 if isinstance(stats[key], float) else 0
+        return {"status": "reset"}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency", default="lognormal:800:0.4",
+                        help="fixed:MS | uniform:LO_MS:HI_MS | lognormal:MEDIAN_MS:SIGMA")
+    parser.add_argument("--ms-per-output-token", type=float, default=0.0)
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0,
+                        help="Fraction of requests answered with 429")
+    parser.add_argument("--max-concurrency", type=int, default=None,
+                        help="Answer 429 while this many requests are already in flight")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = FakeOpenAIConfig(
+        latency=LatencyModel.parse(args.latency, args.ms_per_output_token),
+        rate_limit_probability=args.rate_limit_probability,
+        max_concurrency=args.max_concurrency,
+        retry_after_seconds=args.retry_after,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+Local Azure AI Search emulator for retrieval benchmarks.
+
+Implements the subset of the Azure Search REST API that ``AzureSearchService``
+uses, backed by an in-memory BM25 index over a seeded candidate corpus:
+
+- ``POST /indexes/{index}/docs/search`` with ``search`` (simple query, any-term
+  match, ``*`` for all), ``filter`` (OData ``eq``/``ne``, ``and``/``or``/``not``,
+  parentheses and ``search.in``), ``top``, ``skip``, ``count`` and ``select``
+- ``GET /indexes/{index}/docs('{key}')`` with ``$select``
+
+Usage:
+    python -m fakes.search_server --port 8082 --documents 5000
+
+Then run the agent with:
+    AZURE_SEARCH_ENDPOINT=http://localhost:8082 AZURE_SEARCH_API_KEY=fake AZURE_SEARCH_INDEX=candidates
+"""
+
+import argparse
+import asyncio
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+
+from fakes.corpus import generate_corpus, load_corpus
+
+TOKEN = re.compile(r"[a-z0-9]+")
+SEARCHABLE_FIELDS = ("title", "name", "content")
+DOC_KEY = re.compile(r"^docs\('(?P<key>(?:[^']|'')*)'\)$")
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN.findall(text.lower())
+
+
+# ----------------------------------------------------------------------
+# OData $filter subset
+# ----------------------------------------------------------------------
+FILTER_TOKEN = re.compile(r"\s*(?:(?P<string>'(?:[^']|'')*')|(?P<punct>[(),])|(?P<word>[A-Za-z_][\w.]*))")
+
+
+class FilterSyntaxError(ValueError):
+    """Raised for filter expressions outside the supported subset."""
+
+
+def _lex(expression: str) -> List[Tuple[str, str]]:
+    tokens, position = [], 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = FILTER_TOKEN.match(expression, position)
+        if not match:
+            raise FilterSyntaxError(f"Unexpected input at position {position}: {expression[position:]!r}")
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "string":
+            value = value[1:-1].replace("''", "'")
+        tokens.append((kind, value))
+    return tokens
+
+
+class _FilterParser:
+    """Recursive-descent parser: or_expr := and_expr ('or' and_expr)*, and so on."""
+
+    def __init__(self, expression: str):
+        self.tokens = _lex(expression)
+        self.position = 0
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _take(self, kind: Optional[str] = None, value: Optional[str] = None) -> str:
+        token = self._peek()
+        if token is None or (kind and token[0] != kind) or (value and token[1].lower() != value):
+            raise FilterSyntaxError(f"Expected {value or kind}, got {token[1] if token else 'end of filter'}")
+        self.position += 1
+        return token[1]
+
+    def _keyword(self, word: str) -> bool:
+        token = self._peek()
+        return token is not None and token[0] == "word" and token[1].lower() == word
+
+    def parse(self) -> Predicate:
+        predicate = self._or()
+        if self._peek() is not None:
+            raise FilterSyntaxError(f"Unexpected token {self._peek()[1]!r}")
+        return predicate
+
+    def _or(self) -> Predicate:
+        terms = [self._and()]
+        while self._keyword("or"):
+            self._take()
+            terms.append(self._and())
+        return terms[0] if len(terms) == 1 else (lambda doc: any(t(doc) for t in terms))
+
+    def _and(self) -> Predicate:
+        terms = [self._unary()]
+        while self._keyword("and"):
+            self._take()
+            terms.append(self._unary())
+        return terms[0] if len(terms) == 1 else (lambda doc: all(t(doc) for t in terms))
+
+    def _unary(self) -> Predicate:
+        if self._keyword("not"):
+            self._take()
+            inner = self._unary()
+            return lambda doc: not inner(doc)
+        if self._peek() == ("punct", "("):
+            self._take("punct")
+            inner = self._or()
+            self._take("punct", ")")
+            return inner
+        return self._comparison()
+
+    def _comparison(self) -> Predicate:
+        field = self._take("word")
+        if field.lower() == "search.in":
+            self._take("punct", "(")
+            target = self._take("word")
+            self._take("punct", ",")
+            values_text = self._take("string")
+            delimiters = " ,"
+            if self._peek() == ("punct", ","):
+                self._take("punct")
+                delimiters = self._take("string")
+            self._take("punct", ")")
+            values = {v for v in re.split(f"[{re.escape(delimiters)}]+", values_text) if v}
+            return lambda doc: str(doc.get(target)) in values
+        operator = self._take("word").lower()
+        value = self._take("string")
+        if operator == "eq":
+            return lambda doc: doc.get(field) == value
+        if operator == "ne":
+            return lambda doc: doc.get(field) != value
+        raise FilterSyntaxError(f"Unsupported operator '{operator}'")
+
+
+def parse_filter(expression: Optional[str]) -> Optional[Predicate]:
+    """Compile an OData filter expression to a predicate (None for no filter)."""
+    if not expression or not expression.strip():
+        return None
+    return _FilterParser(expression).parse()
+
+
+# ----------------------------------------------------------------------
+# BM25 index
+# ----------------------------------------------------------------------
+class SearchIndex:
+    """In-memory BM25 index over the searchable fields of each document."""
+
+    def __init__(self, documents: List[Dict[str, Any]], k1: float = 1.2, b: float = 0.75):
+        self.documents = documents
+        self.by_key = {doc["id"]: doc for doc in documents}
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._lengths: List[int] = []
+        for position, doc in enumerate(documents):
+            terms = tokenize(" ".join(str(doc.get(f, "")) for f in SEARCHABLE_FIELDS))
+            self._lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                self._postings[term].append((position, frequency))
+        self._average_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (len(self.documents) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, predicate: Optional[Predicate]) -> List[Tuple[Dict[str, Any], float]]:
+        """Matching documents with scores, best first (``*`` or empty matches everything with score 1)."""
+        terms = tokenize(query or "")
+        if not terms or query.strip() == "*":
+            return [(doc, 1.0) for doc in self.documents if predicate is None or predicate(doc)]
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(terms):
+            idf = self._idf(term)
+            for position, frequency in self._postings.get(term, ()):
+                norm = 1 - self.b + self.b * self._lengths[position] / self._average_length
+                scores[position] += idf * frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            (self.documents[position], score)
+            for position, score in ranked
+            if predicate is None or predicate(self.documents[position])
+        ]
+
+
+def _project(doc: Dict[str, Any], select: Optional[str]) -> Dict[str, Any]:
+    if not select or select.strip() == "*":
+        return dict(doc)
+    fields = [f.strip() for f in select.split(",") if f.strip()]
+    return {f: doc.get(f) for f in fields}
+
+
+def create_app(
+    documents: List[Dict[str, Any]],
+    index_name: Optional[str] = None,
+    api_key: Optional[str] = None,
+    latency_ms: float = 0.0
+) -> FastAPI:
+    """Build the emulator app over ``documents``.
+
+    Args:
+        documents: Documents to index (each needs an ``id`` key)
+        index_name: Only this index name is served (any name when None)
+        api_key: Required ``api-key`` header value (not checked when None)
+        latency_ms: Fixed delay added to every request
+    """
+    index = SearchIndex(documents)
+    app = FastAPI(title="Azure AI Search emulator")
+    stats = {"search_requests": 0, "lookup_requests": 0}
+
+    def _check(index_requested: str, key_header: Optional[str]) -> None:
+        if api_key is not None and key_header != api_key:
+            raise HTTPException(status_code=403, detail="Invalid api-key")
+        if index_name is not None and index_requested != index_name:
+            raise HTTPException(status_code=404, detail=f"Index '{index_requested}' not found")
+
+    @app.post("/indexes/{index_requested}/docs/search")
+    async def search(
+        index_requested: str,
+        request: Request,
+        api_key_header: Optional[str] = Header(default=None, alias="api-key"),
+    ) -> JSONResponse:
+        _check(index_requested, api_key_header)
+        stats["search_requests"] += 1
+        body = await request.json()
+        try:
+            predicate = parse_filter(body.get("filter"))
+        except FilterSyntaxError as e:
+            return JSONResponse(status_code=400, content={"error": {"code": "InvalidRequestParameter", "message": str(e)}})
+
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        matches = index.search(body.get("search", "*"), predicate)
+        skip = int(body.get("skip") or 0)
+        top = int(body.get("top") or 50)
+        page = matches[skip:skip + top]
+        payload: Dict[str, Any] = {
+            "value": [{"@search.score": score, **_project(doc, body.get("select"))} for doc, score in page]
+        }
+        if body.get("count"):
+            payload["@odata.count"] = len(matches)
+        return JSONResponse(payload)
+
+    @app.get("/indexes/{index_requested}/{doc_path:path}")
+    async def lookup(
+        index_requested: str,
+        doc_path: str,
+        select: Optional[str] = Query(default=None, alias="$select"),
+        api_key_header: Optional[str] = Header(default=None, alias="api-key"),
+    ) -> JSONResponse:
+        _check(index_requested, api_key_header)
+        match = DOC_KEY.match(doc_path)
+        if not match:
+            raise HTTPException(status_code=404, detail=f"Unknown resource '{doc_path}'")
+        stats["lookup_requests"] += 1
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        doc = index.by_key.get(match.group("key").replace("''", "'"))
+        if doc is None:
+            raise HTTPException(status_code=404, detail="Document not found")
+        return JSONResponse(_project(doc, select))
+
+    @app.get("/stats")
+    async def get_stats() -> Dict[str, Any]:
+        return {**stats, "documents": len(documents)}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument("--documents", type=int, default=5000, help="Size of the generated corpus")
+    parser.add_argument("--decision-kits", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--corpus", default=None, help="JSON or JSON Lines file to index instead of a generated corpus")
+    parser.add_argument("--index", default=None, help="Only serve this index name")
+    parser.add_argument("--api-key", default=None, help="Require this api-key header")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    documents = load_corpus(args.corpus) if args.corpus else generate_corpus(args.documents, args.decision_kits, args.seed)
+    app = create_app(documents, index_name=args.index, api_key=args.api_key, latency_ms=args.latency_ms)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+APPS_DIR = Path(__file__).resolve().parents[2]
+
+# Agent modules import as top-level packages (models, services, prompts) and
+# criteria_api as ``app.*``; the two trees do not share names.
+for path in (APPS_DIR / "agent", APPS_DIR / "criteria_api", Path(__file__).resolve().parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# criteria_api binds its engine at import: point it at a scratch database first.
+_db_dir = tempfile.mkdtemp(prefix="micro-bench-")
+os.environ["SQLITE_DB_URL"] = f"sqlite:///{_db_dir}/criteria.db"
+
+# Fifty criteria cannot sum to 1.0 in the default 0.05 weight steps; use 0.01
+# steps so rubrics up to 100 criteria validate.
+os.environ.setdefault("RUBRIC_WEIGHT_MIN", "0.01")
+os.environ.setdefault("RUBRIC_WEIGHT_STEP", "0.01")
+
+
+@pytest.fixture(scope="session")
+def criteria_db():
+    """criteria_api session factory bound to the scratch database, with tables created."""
+    from app.models import (  # noqa: F401  (register every table)
+        candidate_orm, criteria_orm, decision_kit_orm, evaluation_result_orm, rubric_criterion_orm, rubric_orm,
+        rubric_snapshot_orm,
+    )
+    from app.utils.db import Base, SessionLocal, engine
+
+    Base.metadata.create_all(bind=engine)
+    return SessionLocal
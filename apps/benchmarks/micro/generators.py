@@ -0,0 +1,127 @@
+"""
+Seeded synthetic inputs for the micro-benchmarks.
+
+Sizes scale up to ``MAX_CANDIDATES`` candidates and ``MAX_CRITERIA`` criteria;
+set ``BENCH_MAX_CANDIDATES`` to cap the candidate counts for a quick run.
+Generators are cached, so parametrized benchmarks share their inputs and the
+generation cost stays out of the measurements.
+"""
+
+import os
+import random
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from models.invoke import BatchEvaluationResult, CriterionEvaluation, EvaluationResult
+from services.deterministic_analyzer import DeterministicComparison
+
+MAX_CANDIDATES = int(os.getenv("BENCH_MAX_CANDIDATES", "10000"))
+MAX_CRITERIA = 50
+
+CANDIDATE_COUNTS = tuple(n for n in (10, 100, 1000, 10000) if n <= MAX_CANDIDATES)
+CRITERIA_COUNTS = (5, 20, MAX_CRITERIA)
+
+TOPICS = [
+    "Technical Skills", "System Design", "Leadership", "Communication", "Delivery", "Operations",
+    "Security Awareness", "Mentoring", "Product Sense", "Data Literacy",
+]
+
+
+def criterion_name(index: int) -> str:
+    name = TOPICS[index % len(TOPICS)]
+    return name if index < len(TOPICS) else f"{name} {index // len(TOPICS) + 1}"
+
+
+def weights(count: int) -> List[float]:
+    """``count`` weights in 0.01 steps summing to 1.0."""
+    return [(100 // count + (1 if i < 100 % count else 0)) / 100 for i in range(count)]
+
+
+@lru_cache(maxsize=None)
+def criteria(count: int) -> Tuple[Dict[str, Any], ...]:
+    """Rubric criteria as the agent sees them after fetching a rubric."""
+    return tuple(
+        {
+            "criterion_id": f"criterion-{i:03d}",
+            "name": criterion_name(i),
+            "description": f"Evidence of {criterion_name(i).lower()}",
+            "definition": f"Score 1-5 on demonstrated {criterion_name(i).lower()}",
+            "weight": weight,
+        }
+        for i, weight in enumerate(weights(count))
+    )
+
+
+def _evaluation(rng: random.Random, candidate_id: str, criteria_count: int) -> EvaluationResult:
+    evaluations = [
+        CriterionEvaluation(
+            criterion_name=criterion["name"],
+            criterion_description=criterion["description"],
+            weight=criterion["weight"],
+            score=rng.randint(2, 10) / 2,
+            reasoning=f"The resume shows evidence for {criterion['name'].lower()} across recent roles.",
+            evidence=[f"Led work related to {criterion['name'].lower()}"],
+        )
+        for criterion in criteria(criteria_count)
+    ]
+    overall = sum(e.score * e.weight for e in evaluations) / sum(e.weight for e in evaluations)
+    return EvaluationResult(
+        overall_score=round(overall, 2),
+        candidate_id=candidate_id,
+        rubric_name="Benchmark rubric",
+        criteria_evaluations=evaluations,
+        summary=f"Overall score {overall:.2f}.",
+        strengths=[evaluations[0].criterion_name],
+        improvements=[evaluations[-1].criterion_name],
+        agent_metadata={"evaluation_method": "batch_evaluation", "chunks_used": "10"},
+    )
+
+
+@lru_cache(maxsize=None)
+def evaluation_results(candidates: int, criteria_count: int, seed: int = 42) -> Tuple[EvaluationResult, ...]:
+    """Per-candidate agent evaluation results."""
+    rng = random.Random(seed)
+    return tuple(_evaluation(rng, f"candidate-{i:06d}", criteria_count) for i in range(candidates))
+
+
+@lru_cache(maxsize=None)
+def batch_result(candidates: int, criteria_count: int) -> BatchEvaluationResult:
+    """A complete batch result with its deterministic comparison summary."""
+    results = list(evaluation_results(candidates, criteria_count))
+    return BatchEvaluationResult(
+        rubric_name="Benchmark rubric",
+        total_candidates=candidates,
+        individual_results=results,
+        comparison_summary=DeterministicComparison().analyze(results),
+        batch_metadata={"evaluation_method": "batch_evaluation"},
+    )
+
+
+@lru_cache(maxsize=None)
+def saved_batch_payload(candidates: int, criteria_count: int) -> Dict[str, Any]:
+    """Body the agent sends to ``POST /candidates/evaluations`` for a batch (without ``id``)."""
+    batch = batch_result(candidates, criteria_count).model_dump(mode="json")
+    return {
+        "rubric_id": "benchmark-rubric",
+        "overall_score": batch["comparison_summary"]["best_candidate"]["overall_score"],
+        "rubric_name": batch["rubric_name"],
+        "total_candidates": candidates,
+        "is_batch": True,
+        "individual_results": batch["individual_results"],
+        "comparison_summary": batch["comparison_summary"],
+        "evaluation_metadata": batch["batch_metadata"],
+        "candidate_ids": [r["candidate_id"] for r in batch["individual_results"]],
+    }
+
+
+def document_chunks(count: int = 10, seed: int = 7) -> List[Dict[str, Any]]:
+    """Retrieved resume chunks for prompt rendering."""
+    rng = random.Random(seed)
+    return [
+        {
+            "content": " ".join(rng.choice(["Python", "Kubernetes", "led", "migration", "mentored", "reduced",
+                                            "latency", "designed", "pipeline", "team"]) for _ in range(120)),
+            "related_criterion": criterion_name(i),
+        }
+        for i in range(count)
+    ]
@@ -0,0 +1,20 @@
+import pytest
+
+from generators import CANDIDATE_COUNTS, CRITERIA_COUNTS, MAX_CRITERIA, evaluation_results
+from models.invoke import RankingStrategy
+from services.deterministic_analyzer import DeterministicComparison
+
+
+@pytest.mark.parametrize("strategy", list(RankingStrategy), ids=lambda s: s.value)
+@pytest.mark.parametrize("candidates", CANDIDATE_COUNTS)
+def test_analyze_by_candidates(benchmark, candidates, strategy):
+    results = list(evaluation_results(candidates, MAX_CRITERIA))
+    summary = benchmark(DeterministicComparison().analyze, results, strategy)
+    assert len(summary.rankings) == candidates
+
+
+@pytest.mark.parametrize("criteria_count", CRITERIA_COUNTS)
+def test_analyze_by_criteria(benchmark, criteria_count):
+    results = list(evaluation_results(100, criteria_count))
+    summary = benchmark(DeterministicComparison().analyze, results)
+    assert len(summary.criteria_analysis) == criteria_count
@@ -0,0 +1,14 @@
+import pytest
+
+from generators import CANDIDATE_COUNTS, MAX_CRITERIA, saved_batch_payload
+
+
+@pytest.mark.parametrize("candidates", CANDIDATE_COUNTS)
+def test_create_evaluation_result(benchmark, criteria_db, candidates):
+    """Stores a batch result and matches every candidate to its score and rank."""
+    from app.models.evaluation_result import EvaluationResultCreate
+    from app.services.evaluation_service import create_evaluation_result
+
+    data = EvaluationResultCreate(**saved_batch_payload(candidates, MAX_CRITERIA))
+    result = benchmark.pedantic(create_evaluation_result, args=(data,), rounds=2 if candidates >= 10000 else 10)
+    assert result.total_candidates == candidates
@@ -0,0 +1,25 @@
+import pytest
+
+from generators import CANDIDATE_COUNTS, CRITERIA_COUNTS, MAX_CRITERIA, batch_result, evaluation_results
+from models.invoke import BatchEvaluationResult, EvaluationResult
+
+
+@pytest.mark.parametrize("criteria_count", CRITERIA_COUNTS)
+def test_evaluation_result_json_round_trip(benchmark, criteria_count):
+    result = evaluation_results(1, criteria_count)[0]
+    restored = benchmark(lambda: EvaluationResult.model_validate_json(result.model_dump_json()))
+    assert restored == result
+
+
+@pytest.mark.parametrize("candidates", CANDIDATE_COUNTS)
+def test_batch_result_json_round_trip(benchmark, candidates):
+    batch = batch_result(candidates, MAX_CRITERIA)
+    restored = benchmark(lambda: BatchEvaluationResult.model_validate_json(batch.model_dump_json()))
+    assert restored.total_candidates == candidates
+
+
+@pytest.mark.parametrize("candidates", CANDIDATE_COUNTS)
+def test_batch_result_dict_round_trip(benchmark, candidates):
+    batch = batch_result(candidates, MAX_CRITERIA)
+    restored = benchmark(lambda: BatchEvaluationResult.model_validate(batch.model_dump(mode="json")))
+    assert restored.total_candidates == candidates
@@ -0,0 +1,50 @@
+import pytest
+
+from generators import CRITERIA_COUNTS, criteria, document_chunks, evaluation_results
+from prompts.evaluation_prompts import get_batch_evaluation_template, get_summary_template
+from services.consensus_evaluation import ConsensusEvaluationService
+from services.evaluation_service import build_batch_evaluation_inputs
+
+
+def _rubric(criteria_count):
+    return {
+        "rubric_name": "Benchmark rubric",
+        "description": "Synthetic rubric",
+        "criteria": [dict(c) for c in criteria(criteria_count)],
+    }
+
+
+@pytest.mark.parametrize("criteria_count", CRITERIA_COUNTS)
+def test_batch_evaluation_prompt(benchmark, criteria_count):
+    template = get_batch_evaluation_template()
+    rubric = _rubric(criteria_count)
+    chunks = document_chunks()
+    messages = benchmark(lambda: template.format_messages(**build_batch_evaluation_inputs(rubric, chunks)))
+    assert "Criterion:" in messages[0].content
+
+
+@pytest.mark.parametrize("criteria_count", CRITERIA_COUNTS)
+def test_summary_prompt(benchmark, criteria_count):
+    template = get_summary_template()
+    result = evaluation_results(1, criteria_count)[0]
+
+    def render():
+        return template.format_messages(
+            rubric_name=result.rubric_name,
+            overall_score=result.overall_score,
+            evaluations_summary="\n".join(
+                f"- {e.criterion_name}: {e.score}/5.0 - {e.reasoning[:100]}..." for e in result.criteria_evaluations
+            ),
+        )
+
+    messages = benchmark(render)
+    assert "Individual Criterion Evaluations:" in messages[0].content
+
+
+@pytest.mark.parametrize("criteria_count", CRITERIA_COUNTS)
+def test_consensus_agent_prompt(benchmark, criteria_count):
+    service = ConsensusEvaluationService()
+    rubric = _rubric(criteria_count)
+    content = "\n\n".join(chunk["content"] for chunk in document_chunks())
+    prompt = benchmark(service._build_agent_prompt, "You are a STRICT EVALUATOR.\n\n", content, rubric)
+    assert "(Weight:" in prompt
@@ -0,0 +1,64 @@
+import uuid
+
+import pytest
+
+from generators import CRITERIA_COUNTS, MAX_CRITERIA, criteria, weights
+
+
+@pytest.fixture(scope="module")
+def criteria_ids(criteria_db):
+    """IDs of ``MAX_CRITERIA`` stored criteria."""
+    from app.models.criteria_orm import CriteriaORM
+
+    db = criteria_db()
+    ids = []
+    for criterion in criteria(MAX_CRITERIA):
+        cid = str(uuid.uuid4())
+        db.add(CriteriaORM(id=cid, name=f"{criterion['name']} {cid[:8]}",
+                           description=criterion["description"], definition=criterion["definition"]))
+        ids.append(cid)
+    db.commit()
+    db.close()
+    return ids
+
+
+def _entries(criteria_ids, count):
+    from app.models.rubric import RubricCriteriaEntryCreate
+
+    return [RubricCriteriaEntryCreate(criteriaId=cid, weight=weight)
+            for cid, weight in zip(criteria_ids[:count], weights(count))]
+
+
+@pytest.mark.parametrize("criteria_count", CRITERIA_COUNTS)
+def test_normalize_and_validate_entries(benchmark, criteria_db, criteria_ids, criteria_count):
+    from app.services.rubric_service import _normalize_and_validate_entries
+
+    entries = _entries(criteria_ids, criteria_count)
+    db = criteria_db()
+    try:
+        normalized = benchmark(_normalize_and_validate_entries, db, entries)
+    finally:
+        db.close()
+    assert len(normalized) == criteria_count
+
+
+@pytest.mark.parametrize("criteria_count", CRITERIA_COUNTS)
+def test_serialize_rubric(benchmark, criteria_db, criteria_ids, criteria_count):
+    from app.models.rubric import RubricCreate
+    from app.models.rubric_orm import RubricORM
+    from app.services.rubric_service import _serialize_rubric, create_rubric
+
+    created = create_rubric(RubricCreate(
+        name=f"Benchmark rubric {uuid.uuid4().hex[:8]}",
+        description="Synthetic rubric",
+        criteria=_entries(criteria_ids, criteria_count),
+    ))
+    db = criteria_db()
+    try:
+        orm = db.query(RubricORM).filter(RubricORM.id == created.id).one()
+        # Expire between rounds so each one reloads the association rows, as a fresh request would
+        rubric = benchmark.pedantic(_serialize_rubric, args=(orm, db), setup=db.expire_all, rounds=200)
+    finally:
+        db.close()
+    assert len(rubric.criteria) == criteria_count
+    assert all(entry.name for entry in rubric.criteria)
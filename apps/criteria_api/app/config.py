@@ -12,6 +12,10 @@ class Settings(BaseSettings):
         RUBRIC_WEIGHT_MIN: Lower bound for a single criterion weight (default: 0.05)
         RUBRIC_WEIGHT_MAX: Upper bound for a single criterion weight (default: 1.0)
         RUBRIC_WEIGHT_STEP: Step increment for a single criterion weight (default: 0.05)
+        RUBRIC_CACHE_SIZE: Published rubric responses kept in memory (default: 512)
+        RUBRIC_DRAFT_CACHE_SIZE: Draft rubric responses kept in memory, each checked against a version query before it is served; 0 disables (default: 128)
+        LIST_DEFAULT_LIMIT: Page size when a ``cursor`` is given without ``limit`` (default: 200)
+        LIST_MAX_LIMIT: Largest page size a list endpoint returns (default: 1000)
     """
 
     ALLOW_ZERO_WEIGHT: bool = False
@@ -20,6 +24,10 @@ class Settings(BaseSettings):
     RUBRIC_WEIGHT_MIN: float = 0.05
     RUBRIC_WEIGHT_MAX: float = 1.0
     RUBRIC_WEIGHT_STEP: float = 0.05
+    RUBRIC_CACHE_SIZE: int = 512
+    RUBRIC_DRAFT_CACHE_SIZE: int = 128
+    LIST_DEFAULT_LIMIT: int = 200
+    LIST_MAX_LIMIT: int = 1000
 
     @model_validator(mode="after")
     def validate_default(self):  # type: ignore[override]
@@ -1,12 +1,14 @@
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import criteria, rubrics, decision_kits, candidates
-from app.utils.db import Base, engine
+from app.utils.db import Base, DB_POOL_SIZE, async_engine, engine
 import os
 from app.models import criteria_orm  # ensure import side effects
 from app.models import rubric_orm  # ensure rubric table
 from app.models import rubric_criterion_orm  # ensure assoc table
+from app.models import rubric_snapshot_orm  # ensure published rubric snapshot table
 from app.models import decision_kit_orm  # ensure decision kit tables
 from app.models import candidate_orm  # ensure candidate table
 from app.models import evaluation_result_orm  # ensure evaluation result tables
@@ -23,6 +25,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Total-Count"],
 )
 
 def _migrate_legacy_rubric_schema():
@@ -48,6 +51,32 @@ def _migrate_legacy_rubric_schema():
         conn.execute(text("COMMIT"))
 
 
+def _migrate_criteria_timestamps():
+    """Add criteria.created_at/updated_at (list pagination and ETags) to databases created before they existed."""
+    with engine.begin() as conn:
+        rows = conn.execute(text("PRAGMA table_info(criteria)")).fetchall()
+        if not rows:
+            return
+        columns = {r[1] for r in rows}
+        if 'updated_at' not in columns:
+            conn.execute(text("ALTER TABLE criteria ADD COLUMN updated_at DATETIME NULL"))
+        if 'created_at' not in columns:
+            conn.execute(text("ALTER TABLE criteria ADD COLUMN created_at DATETIME NULL"))
+            # One second apart in rowid (insertion) order, ending now, so existing criteria keep their
+            # listing order; same text format SQLAlchemy writes, so cursor comparisons order correctly
+            conn.execute(text(
+                "UPDATE criteria SET created_at = strftime('%Y-%m-%d %H:%M:%S.000000', 'now', "
+                "'-' || ((SELECT max(rowid) FROM criteria) - rowid) || ' seconds')"
+            ))
+
+
+def _ensure_indexes():
+    """Create indexes added to existing tables (create_all only creates indexes with new tables)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def _reset_database_unless_preserved():
     """Always rebuild schema & seed unless PRESERVE_DB_ON_START=true.
 
@@ -57,6 +86,7 @@ def _reset_database_unless_preserved():
     """
     if os.getenv("PRESERVE_DB_ON_START", "false").lower() in ("1", "true", "yes"):
         Base.metadata.create_all(bind=engine)
+        _ensure_indexes()
         # Idempotent seed ensures missing required base data is present
         seed()
         return False
@@ -67,8 +97,19 @@ def _reset_database_unless_preserved():
     return True
 
 _migrate_legacy_rubric_schema()
+_migrate_criteria_timestamps()
 _reset_database_unless_preserved()
 
+@app.on_event("startup")
+async def _match_threadpool_to_db_pool():
+    """Run sync routes on as many worker threads as there are pooled DB connections."""
+    to_thread.current_default_thread_limiter().total_tokens = DB_POOL_SIZE
+
+
+@app.on_event("shutdown")
+async def _dispose_async_engine():
+    await async_engine.dispose()
+
 app.include_router(criteria.router, prefix="/criteria", tags=["criteria"])
 app.include_router(rubrics.router, prefix="/rubrics", tags=["rubrics"])
 app.include_router(decision_kits.router, prefix="/decision-kits", tags=["decision_kits"])
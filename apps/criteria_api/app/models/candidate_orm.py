@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Integer, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.utils.db import Base
@@ -21,6 +21,9 @@ class CandidateORM(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
+    # Keyset pagination of list endpoints
+    __table_args__ = (Index("ix_candidates_created_at_id", "created_at", "id"),)
+
     materials = relationship("CandidateMaterialORM", back_populates="candidate", cascade="all, delete-orphan")
 
     # Global uniqueness removed; uniqueness now enforced per decision kit in association table.
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, String, Text, DateTime, Index
+from datetime import datetime, timezone
 from app.utils.db import Base
 
 class CriteriaORM(Base):
@@ -7,3 +8,10 @@ class CriteriaORM(Base):
     name = Column(String, nullable=False)
     description = Column(String, nullable=False)
     definition = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=True)
+    # Rubric responses embed criterion text; list ETags include the latest criterion change
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc),
+                        onupdate=lambda: datetime.now(timezone.utc), nullable=True)
+
+    # Keyset pagination of list endpoints
+    __table_args__ = (Index("ix_criteria_created_at_id", "created_at", "id"),)
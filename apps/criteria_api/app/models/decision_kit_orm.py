@@ -19,6 +19,9 @@ class DecisionKitORM(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
+    # Keyset pagination of list endpoints
+    __table_args__ = (Index("ix_decision_kits_created_at_id", "created_at", "id"),)
+
     candidates_assoc = relationship(
         "DecisionKitCandidateORM",
         back_populates="decision_kit",
@@ -5,6 +5,7 @@ from datetime import datetime
 
 class EvaluationResultCreate(BaseModel):
     """Model for creating a new evaluation result."""
+    id: Optional[str] = Field(None, description="Client-assigned ID; creating the same ID again returns the stored result")
     rubric_id: str = Field(..., description="ID of rubric used for evaluation")
     overall_score: float = Field(ge=1.0, le=5.0, description="Overall weighted score")
     rubric_name: str = Field(..., description="Name of rubric used")
@@ -74,5 +75,6 @@ class EvaluationResultSummary(BaseModel):
 
 class EvaluationResultList(BaseModel):
     """Response model for listing evaluation results."""
-    total: int
+    total: Optional[int] = None  # approximate, only with include_total=true
     results: List[EvaluationResultSummary]
+    next_cursor: Optional[str] = None
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Float, Integer, JSON
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Float, Integer, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.utils.db import Base
@@ -26,6 +26,9 @@ class EvaluationResultORM(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
+    # Keyset pagination of list endpoints
+    __table_args__ = (Index("ix_evaluation_results_created_at_id", "created_at", "id"),)
+
     # Relationships
     rubric = relationship("RubricORM", lazy="joined")
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime
+from sqlalchemy import Column, String, Text, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.utils.db import Base
@@ -17,6 +17,9 @@ class RubricORM(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
 
+    # Keyset pagination of list endpoints
+    __table_args__ = (Index("ix_rubrics_created_at_id", "created_at", "id"),)
+
     # New normalized relationship via join table
     criteria_assoc = relationship(
         "RubricCriterionORM",
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, LargeBinary, DateTime, ForeignKey
+from datetime import datetime, timezone
+from app.utils.db import Base
+
+
+class RubricSnapshotORM(Base):
+    """Serialized response body of a published rubric, frozen when it is published."""
+    __tablename__ = "rubric_snapshots"
+
+    rubric_id = Column(String, ForeignKey("rubrics.id", ondelete="CASCADE"), primary_key=True)
+    content_hash = Column(String, nullable=False)  # sha256 of body
+    body = Column(LargeBinary, nullable=False)  # UTF-8 JSON, exactly as served by GET /rubrics/{id}
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.candidate import (
     Candidate,
@@ -15,13 +18,34 @@ from app.models.evaluation_result import (
     EvaluationResultList,
 )
 from app.services import candidate_service, candidate_material_service, evaluation_service
+from app.utils.db import get_async_db
+from app.utils.etag import make_etag, not_modified
+from app.utils.pagination import InvalidCursor, clamp_limit, page_headers
 
 router = APIRouter()
 
 
+def _split(values: Optional[str]) -> List[str]:
+    return [v.strip() for v in values.split(",") if v.strip()] if values else []
+
+
 @router.get("/", response_model=List[Candidate])
-def list_candidates():
-    return candidate_service.list_candidates()
+def list_candidates(request: Request, response: Response,
+                    limit: Optional[int] = Query(None, ge=1, description="Page size (capped at LIST_MAX_LIMIT); omit with no cursor for the whole list"),
+                    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+                    include_total: bool = Query(False, description="Add an approximate X-Total-Count header")):
+    limit = clamp_limit(limit, cursor)
+    etag = make_etag("candidates", limit, cursor, include_total, *candidate_service.candidates_version())
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    try:
+        page = candidate_service.list_candidates(limit, cursor, include_total)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = etag
+    response.headers.update(page_headers(page))
+    return page.items
 
 
 @router.post("/", response_model=Candidate, status_code=201)
@@ -33,6 +57,39 @@ def create_candidate(data: CandidateCreate):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+# Registered before "/{candidate_id}", which would otherwise match "/evaluations"
+@router.get("/evaluations", response_model=EvaluationResultList)
+async def list_evaluation_results(request: Request, response: Response,
+                                  limit: Optional[int] = Query(None, ge=1, description="Page size (default 50)"),
+                                  cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+                                  include_total: bool = Query(False, description="Include an approximate total"),
+                                  offset: Optional[int] = Query(None, ge=0, deprecated=True,
+                                                                description="Rows to skip; use cursor instead"),
+                                  db: AsyncSession = Depends(get_async_db)):
+    """List evaluation results newest first; pass ``next_cursor`` back as ``cursor`` for the next page.
+
+    ``offset`` is still honoured for clients written before cursors and implies ``include_total``.
+    """
+    limit = clamp_limit(limit, cursor, default=50)
+    include_total = include_total or offset is not None
+    try:
+        etag = make_etag("evaluations", limit, cursor, include_total, offset,
+                         *await evaluation_service.evaluation_results_version_async(db))
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+        page = await evaluation_service.list_evaluation_results_async(db, limit=limit, cursor=cursor,
+                                                                     include_total=include_total, offset=offset)
+        response.headers["ETag"] = etag
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to list evaluation results: {str(e)}")
+
+
 @router.get("/{candidate_id}", response_model=Candidate)
 def get_candidate(candidate_id: str):
     c = candidate_service.get_candidate(candidate_id)
@@ -125,21 +182,56 @@ def create_evaluation_result(data: EvaluationResultCreate):
         raise HTTPException(status_code=500, detail=f"Failed to create evaluation result: {str(e)}")
 
 
-@router.get("/evaluations", response_model=EvaluationResultList)
-def list_evaluation_results(limit: int = 50, offset: int = 0):
-    """List evaluation results with pagination."""
+@router.post("/evaluations/batch", response_model=List[EvaluationResult], status_code=201)
+def create_evaluation_results_batch(items: List[EvaluationResultCreate]):
+    """Create several evaluation results in one request.
+
+    Used by the agent's result outbox; items carrying an ``id`` are idempotent so
+    a retried batch does not create duplicates.
+    """
     try:
-        return evaluation_service.list_evaluation_results(limit=limit, offset=offset)
+        return evaluation_service.create_evaluation_results_batch(items)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to list evaluation results: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to create evaluation results: {str(e)}")
 
 
 @router.get("/evaluations/{evaluation_id}", response_model=EvaluationResult)
-def get_evaluation_result(evaluation_id: str):
-    """Get a specific evaluation result by ID."""
-    result = evaluation_service.get_evaluation_result(evaluation_id)
+async def get_evaluation_result(
+    evaluation_id: str,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. overall_score,rankings"),
+    candidate_ids: Optional[str] = Query(None, description="Comma-separated candidate IDs to keep"),
+    criteria: Optional[str] = Query(None, description="Comma-separated criterion names to keep"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Get a specific evaluation result by ID.
+
+    ``fields``, ``candidate_ids`` and ``criteria`` return a sparse view built in SQL,
+    so large ``individual_results`` blobs are not loaded for a small answer.
+    """
+    updated_at = await evaluation_service.evaluation_result_version_async(db, evaluation_id)
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Evaluation result not found")
+    projection = [_split(fields), _split(candidate_ids), _split(criteria)]
+    etag = make_etag("evaluation", evaluation_id, updated_at, *projection)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    if any(projection):
+        try:
+            projected = await evaluation_service.get_evaluation_result_projection_async(db, evaluation_id, *projection)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if projected is None:
+            raise HTTPException(status_code=404, detail="Evaluation result not found")
+        return JSONResponse(jsonable_encoder(projected), headers={"ETag": etag})
+    result = await evaluation_service.get_evaluation_result_async(db, evaluation_id)
     if not result:
         raise HTTPException(status_code=404, detail="Evaluation result not found")
+    response.headers["ETag"] = etag
     return result
 
 
@@ -1,13 +1,29 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from typing import List, Optional
 from app.models.criteria import Criteria, CriteriaCreate, CriteriaUpdate
 from app.services import criteria_service
+from app.utils.etag import make_etag, not_modified
+from app.utils.pagination import InvalidCursor, clamp_limit, page_headers
 
 router = APIRouter()
 
 @router.get("/", response_model=List[Criteria])
-def get_criteria():
-    return criteria_service.list_criteria()
+def get_criteria(request: Request, response: Response,
+                 limit: Optional[int] = Query(None, ge=1, description="Page size (capped at LIST_MAX_LIMIT); omit with no cursor for the whole list"),
+                 cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+                 include_total: bool = Query(False, description="Add an approximate X-Total-Count header")):
+    limit = clamp_limit(limit, cursor)
+    etag = make_etag("criteria", limit, cursor, include_total, *criteria_service.criteria_version())
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    try:
+        page = criteria_service.list_criteria(limit, cursor, include_total)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = etag
+    response.headers.update(page_headers(page))
+    return page.items
 
 @router.get("/{criteria_id}", response_model=Criteria)
 def get_criteria_by_id(criteria_id: str):
@@ -1,23 +1,53 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.decision_kit import (
     DecisionKit, DecisionKitCreate, DecisionKitUpdateCandidates, DecisionKitPatch
 )
 from app.services import decision_kit_service
+from app.utils.db import get_async_db
+from app.utils.etag import make_etag, not_modified
+from app.utils.pagination import InvalidCursor, clamp_limit, page_headers
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[DecisionKit])
-def list_kits(name: Optional[str] = Query(None, description="Name filter (contains, case-insensitive)")):
-    return decision_kit_service.list_decision_kits(name_filter=name)
+async def list_kits(request: Request, response: Response,
+                    name: Optional[str] = Query(None, description="Name filter (contains, case-insensitive)"),
+                    limit: Optional[int] = Query(None, ge=1, description="Page size (capped at LIST_MAX_LIMIT); omit with no cursor for the whole list"),
+                    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+                    include_total: bool = Query(False, description="Add an approximate X-Total-Count header"),
+                    db: AsyncSession = Depends(get_async_db)):
+    limit = clamp_limit(limit, cursor)
+    etag = make_etag("decision-kits", name, limit, cursor, include_total,
+                     *await decision_kit_service.decision_kits_version_async(db))
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    try:
+        page = await decision_kit_service.list_decision_kits_async(db, limit, cursor, name_filter=name,
+                                                                  include_total=include_total)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = etag
+    response.headers.update(page_headers(page))
+    return page.items
 
 
 @router.get("/{kit_id}", response_model=DecisionKit)
-def get_kit(kit_id: str):
-    kit = decision_kit_service.get_decision_kit(kit_id)
+async def get_kit(kit_id: str, request: Request, response: Response, db: AsyncSession = Depends(get_async_db)):
+    version = await decision_kit_service.decision_kit_version_async(db, kit_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="Decision Kit not found")
+    etag = make_etag("decision-kit", kit_id, *version)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    kit = await decision_kit_service.get_decision_kit_async(db, kit_id)
     if not kit:
         raise HTTPException(status_code=404, detail="Decision Kit not found")
+    response.headers["ETag"] = etag
     return kit
 
 
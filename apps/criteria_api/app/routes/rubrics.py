@@ -1,23 +1,45 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.rubric import Rubric, RubricCreate, RubricUpdate
 from app.services import rubric_service
 from app.services.rubric_service import RubricValidationError
+from app.utils.db import get_async_db
+from app.utils.etag import make_etag, not_modified
+from app.utils.pagination import InvalidCursor, clamp_limit, page_headers
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[Rubric])
-def list_rubrics():
-    return rubric_service.list_rubrics()
+async def list_rubrics(request: Request, response: Response,
+                       limit: Optional[int] = Query(None, ge=1, description="Page size (capped at LIST_MAX_LIMIT); omit with no cursor for the whole list"),
+                       cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page"),
+                       include_total: bool = Query(False, description="Add an approximate X-Total-Count header"),
+                       db: AsyncSession = Depends(get_async_db)):
+    limit = clamp_limit(limit, cursor)
+    etag = make_etag("rubrics", limit, cursor, include_total, *await rubric_service.rubrics_version_async(db))
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    try:
+        page = await rubric_service.list_rubrics_async(db, limit, cursor, include_total)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    response.headers["ETag"] = etag
+    response.headers.update(page_headers(page))
+    return page.items
 
 
 @router.get("/{rubric_id}", response_model=Rubric)
-def get_rubric(rubric_id: str):
-    r = rubric_service.get_rubric_by_id(rubric_id)
-    if not r:
+async def get_rubric(rubric_id: str, request: Request, db: AsyncSession = Depends(get_async_db)):
+    # Pre-encoded body: published rubrics are a cache or snapshot lookup, never re-serialized
+    cached = await rubric_service.get_rubric_json_async(db, rubric_id)
+    if not cached:
         raise HTTPException(status_code=404, detail="Rubric not found")
-    return r
+    body, content_hash = cached
+    etag = f'"{content_hash}"'
+    return not_modified(request, etag) or Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.post("/", response_model=Rubric, status_code=201)
@@ -1,10 +1,12 @@
 import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.utils.db import SessionLocal
+from app.utils.pagination import Page, approximate_total, paginate, split_page
 from app.models.candidate_orm import CandidateORM
 from app.models.decision_kit_orm import DecisionKitORM, DecisionKitCandidateORM
 from app.models.candidate import Candidate, CandidateCreate, CandidateUpdate
@@ -25,12 +27,23 @@ def _serialize(orm: CandidateORM) -> Candidate:
     )
 
 
-def list_candidates() -> List[Candidate]:
+def list_candidates(limit: Optional[int], cursor: Optional[str] = None, include_total: bool = False) -> Page:
     db: Session = SessionLocal()
-    rows = db.query(CandidateORM).order_by(CandidateORM.created_at.desc()).all()
-    out = [_serialize(r) for r in rows]
-    db.close()
-    return out
+    try:
+        rows, next_cursor = split_page(paginate(db.query(CandidateORM), CandidateORM, cursor, limit).all(), limit)
+        total = db.execute(approximate_total(CandidateORM)).scalar() if include_total else None
+        return Page([_serialize(r) for r in rows], next_cursor, total)
+    finally:
+        db.close()
+
+
+def candidates_version() -> tuple:
+    """Values that change whenever ``list_candidates`` would (candidate count and latest write)."""
+    db: Session = SessionLocal()
+    try:
+        return tuple(db.execute(select(func.count(CandidateORM.id), func.max(CandidateORM.updated_at))).one())
+    finally:
+        db.close()
 
 
 def get_candidate(candidate_id: str) -> Optional[Candidate]:
@@ -1,20 +1,37 @@
 
 import uuid
 from typing import List, Optional
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from app.models.criteria import Criteria, CriteriaCreate, CriteriaUpdate
 from app.models.criteria_orm import CriteriaORM
 from app.utils.db import SessionLocal
+from app.utils.pagination import Page, approximate_total, paginate, split_page
+from app.services import rubric_cache
 
 # Backwards-compatible stub for legacy CosmosDB-based implementation; tests monkeypatch this.
 def get_container():  # pragma: no cover - placeholder
     return None
 
-def list_criteria() -> List[Criteria]:
+def list_criteria(limit: Optional[int], cursor: Optional[str] = None, include_total: bool = False) -> Page:
     db: Session = SessionLocal()
-    items = db.query(CriteriaORM).all()
-    db.close()
-    return [Criteria(**item.__dict__) for item in items]
+    try:
+        # Oldest first, as criteria were listed before pagination
+        items, next_cursor = split_page(
+            paginate(db.query(CriteriaORM), CriteriaORM, cursor, limit, descending=False).all(), limit
+        )
+        total = db.execute(approximate_total(CriteriaORM)).scalar() if include_total else None
+        return Page([Criteria(**item.__dict__) for item in items], next_cursor, total)
+    finally:
+        db.close()
+
+def criteria_version() -> tuple:
+    """Values that change whenever ``list_criteria`` would (criterion count and latest write)."""
+    db: Session = SessionLocal()
+    try:
+        return tuple(db.execute(select(func.count(CriteriaORM.id), func.max(CriteriaORM.updated_at))).one())
+    finally:
+        db.close()
 
 def get_criteria_by_id(criteria_id: str) -> Optional[Criteria]:
     db: Session = SessionLocal()
@@ -58,6 +75,8 @@ def update_criteria(criteria_id: str, data: CriteriaUpdate) -> Optional[Criteria
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(item, field, value)
     db.commit()
+    # Draft rubrics embed criterion names and definitions; published snapshots keep theirs
+    rubric_cache.invalidate_drafts()
     db.refresh(item)
     db.close()
     return Criteria(**item.__dict__)
@@ -70,5 +89,6 @@ def delete_criteria(criteria_id: str) -> bool:
         return False
     db.delete(item)
     db.commit()
+    rubric_cache.invalidate_drafts()
     db.close()
     return True
@@ -1,9 +1,12 @@
 import uuid
 from typing import List, Optional, Dict
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
 from app.utils.db import SessionLocal
+from app.utils.pagination import Page, approximate_total, paginate, split_page
 from app.models.decision_kit import (
     DecisionKitCreate, DecisionKit, DecisionKitCandidateRef, DecisionKitUpdateCandidates, DecisionKitPatch
 )
@@ -144,6 +147,64 @@ def list_decision_kits(name_filter: Optional[str] = None) -> List[DecisionKit]:
             db.close()
 
 
+def _kit_select():
+    # Candidates come in through selectinload: lazy loads are not possible on an AsyncSession
+    return select(DecisionKitORM).options(
+        selectinload(DecisionKitORM.candidates_assoc).joinedload(DecisionKitCandidateORM.candidate)
+    )
+
+
+async def get_decision_kit_async(db: AsyncSession, kit_id: str) -> Optional[DecisionKit]:
+    """Async variant of ``get_decision_kit`` for the request-scoped session."""
+    result = await db.execute(_kit_select().where(DecisionKitORM.id == kit_id))
+    kit = result.scalars().first()
+    if not kit:
+        return None
+    return _serialize(kit)
+
+
+async def list_decision_kits_async(db: AsyncSession, limit: Optional[int], cursor: Optional[str] = None,
+                                   name_filter: Optional[str] = None, include_total: bool = False) -> Page:
+    """One page of decision kits, newest first, for the request-scoped session."""
+    stmt = _kit_select()
+    if name_filter:
+        stmt = stmt.where(DecisionKitORM.name_normalized.contains(name_filter.lower()))
+    rows, next_cursor = split_page(list((await db.execute(paginate(stmt, DecisionKitORM, cursor, limit))).scalars()), limit)
+    total = None
+    if include_total:
+        if name_filter:
+            total = await db.scalar(select(func.count()).select_from(DecisionKitORM).where(
+                DecisionKitORM.name_normalized.contains(name_filter.lower())))
+        else:
+            total = await db.scalar(approximate_total(DecisionKitORM))
+    return Page([_serialize(r) for r in rows], next_cursor, total)
+
+
+async def decision_kit_version_async(db: AsyncSession, kit_id: str) -> Optional[tuple]:
+    """Values that change whenever the kit's response would, or None if the kit does not exist."""
+    result = await db.execute(
+        select(DecisionKitORM.updated_at, func.count(DecisionKitCandidateORM.id), func.max(CandidateORM.updated_at))
+        .select_from(DecisionKitORM)
+        .outerjoin(DecisionKitCandidateORM, DecisionKitCandidateORM.decision_kit_id == DecisionKitORM.id)
+        .outerjoin(CandidateORM, CandidateORM.id == DecisionKitCandidateORM.candidate_id)
+        .where(DecisionKitORM.id == kit_id)
+        .group_by(DecisionKitORM.id)
+    )
+    row = result.first()
+    return tuple(row) if row else None
+
+
+async def decision_kits_version_async(db: AsyncSession) -> tuple:
+    """Values that change whenever any kit listing would (kit and membership counts, latest writes)."""
+    result = await db.execute(select(
+        select(func.count()).select_from(DecisionKitORM).scalar_subquery(),
+        select(func.max(DecisionKitORM.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(DecisionKitCandidateORM).scalar_subquery(),
+        select(func.max(CandidateORM.updated_at)).scalar_subquery(),
+    ))
+    return tuple(result.one())
+
+
 def update_evaluation_id(kit_id: str, evaluation_id: str) -> Optional[DecisionKit]:
     """Update a decision kit with an evaluation result ID.
 
@@ -1,10 +1,13 @@
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import JSON, DateTime, bindparam, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.utils.db import SessionLocal
+from app.utils.pagination import approximate_total, paginate, split_page
 from app.models.evaluation_result_orm import EvaluationResultORM, EvaluationCandidateORM
 from app.models.evaluation_result import (
     EvaluationResult,
@@ -59,10 +62,21 @@ def _serialize_evaluation_summary(orm: EvaluationResultORM) -> EvaluationResultS
 
 
 def create_evaluation_result(data: EvaluationResultCreate) -> EvaluationResult:
-    """Create a new evaluation result."""
+    """Create a new evaluation result.
+
+    When the client supplies an ``id`` the create is idempotent: a retry with an
+    already stored ID returns the existing result instead of a duplicate.
+    """
     db = SessionLocal()
     try:
-        new_id = str(uuid.uuid4())
+        if data.id:
+            existing = db.query(EvaluationResultORM).filter(EvaluationResultORM.id == data.id).first()
+            if existing:
+                result = _serialize_evaluation_result(existing)
+                db.close()
+                return result
+
+        new_id = data.id or str(uuid.uuid4())
         now = datetime.now(timezone.utc)
 
         # Create main evaluation result
@@ -120,12 +134,27 @@ def create_evaluation_result(data: EvaluationResultCreate) -> EvaluationResult:
         db.close()
         return result
 
+    except IntegrityError:
+        # Concurrent retry with the same client ID won the insert
+        db.rollback()
+        existing = db.query(EvaluationResultORM).filter(EvaluationResultORM.id == data.id).first() if data.id else None
+        if not existing:
+            db.close()
+            raise
+        result = _serialize_evaluation_result(existing)
+        db.close()
+        return result
     except Exception as e:
         db.rollback()
         db.close()
         raise e
 
 
+def create_evaluation_results_batch(items: List[EvaluationResultCreate]) -> List[EvaluationResult]:
+    """Create several evaluation results, idempotently for items with client IDs."""
+    return [create_evaluation_result(item) for item in items]
+
+
 def get_evaluation_result(evaluation_id: str) -> Optional[EvaluationResult]:
     """Get evaluation result by ID."""
     db = SessionLocal()
@@ -147,19 +176,167 @@ def get_evaluation_result(evaluation_id: str) -> Optional[EvaluationResult]:
     return result
 
 
-def list_evaluation_results(limit: int = 50, offset: int = 0) -> EvaluationResultList:
-    """List evaluation results with pagination."""
+def list_evaluation_results(limit: int = 50, cursor: Optional[str] = None, include_total: bool = False,
+                            offset: Optional[int] = None) -> EvaluationResultList:
+    """List evaluation results newest first, one keyset page at a time (``offset`` skips rows, deprecated)."""
     db = SessionLocal()
 
-    total = db.query(EvaluationResultORM).count()
-    results_orm = db.query(EvaluationResultORM).order_by(
-        EvaluationResultORM.created_at.desc()
-    ).offset(offset).limit(limit).all()
-
+    query = paginate(db.query(EvaluationResultORM), EvaluationResultORM, cursor, limit)
+    if offset:
+        query = query.offset(offset)
+    results_orm, next_cursor = split_page(query.all(), limit)
+    total = db.execute(approximate_total(EvaluationResultORM)).scalar() if include_total else None
     results = [_serialize_evaluation_summary(orm) for orm in results_orm]
 
     db.close()
-    return EvaluationResultList(total=total, results=results)
+    return EvaluationResultList(total=total, results=results, next_cursor=next_cursor)
+
+
+async def get_evaluation_result_async(db: AsyncSession, evaluation_id: str) -> Optional[EvaluationResult]:
+    """Async variant of ``get_evaluation_result`` for the request-scoped session."""
+    orm = (await db.execute(
+        select(EvaluationResultORM).where(EvaluationResultORM.id == evaluation_id)
+    )).scalars().first()
+    if not orm:
+        return None
+
+    result = _serialize_evaluation_result(orm)
+    candidates_orm = (await db.execute(
+        select(EvaluationCandidateORM).where(
+            EvaluationCandidateORM.evaluation_id == evaluation_id
+        ).order_by(EvaluationCandidateORM.rank.asc().nullslast())
+    )).scalars().all()
+    result.candidates = [_serialize_evaluation_candidate(c) for c in candidates_orm]
+    return result
+
+
+async def list_evaluation_results_async(db: AsyncSession, limit: int = 50, cursor: Optional[str] = None,
+                                        include_total: bool = False,
+                                        offset: Optional[int] = None) -> EvaluationResultList:
+    """Async variant of ``list_evaluation_results`` for the request-scoped session."""
+    stmt = paginate(select(EvaluationResultORM), EvaluationResultORM, cursor, limit)
+    if offset:
+        stmt = stmt.offset(offset)
+    results_orm, next_cursor = split_page(list((await db.execute(stmt)).scalars()), limit)
+    total = await db.scalar(approximate_total(EvaluationResultORM)) if include_total else None
+    return EvaluationResultList(total=total, results=[_serialize_evaluation_summary(orm) for orm in results_orm],
+                                next_cursor=next_cursor)
+
+
+async def evaluation_result_version_async(db: AsyncSession, evaluation_id: str) -> Optional[datetime]:
+    """``updated_at`` of the evaluation result (its ETag source), or None if it does not exist."""
+    result = await db.execute(select(EvaluationResultORM.updated_at).where(EvaluationResultORM.id == evaluation_id))
+    return result.scalar_one_or_none()
+
+
+async def evaluation_results_version_async(db: AsyncSession) -> tuple:
+    """Row count and latest write across evaluation results."""
+    result = await db.execute(select(func.count(EvaluationResultORM.id), func.max(EvaluationResultORM.updated_at)))
+    return tuple(result.one())
+
+
+# Fields of ``GET /candidates/evaluations/{id}?fields=...`` read straight from a column
+_PROJECTED_COLUMNS = (
+    "id", "rubric_id", "overall_score", "rubric_name", "total_candidates", "is_batch",
+    "evaluation_metadata", "created_at", "updated_at",
+)
+# Keys of comparison_summary that can be requested on their own
+SUMMARY_FIELDS = (
+    "best_candidate", "rankings", "statistical_summary", "criteria_analysis",
+    "cross_candidate_insights", "recommendation_rationale",
+)
+PROJECTABLE_FIELDS = _PROJECTED_COLUMNS + ("individual_results", "comparison_summary", "candidates") + SUMMARY_FIELDS
+
+
+def _json_array_filter(source: str, key: str, param: str) -> str:
+    """SQL for the elements of JSON array ``source`` whose ``key`` is in the expanding ``param``."""
+    return (f"(SELECT json_group_array(json(e.value)) FROM json_each({source}) AS e "
+            f"WHERE json_extract(e.value, '$.{key}') IN :{param})")
+
+
+def _projection_sql(fields: Sequence[str], candidate_ids: Sequence[str], criteria: Sequence[str]) -> str:
+    """SELECT that builds each requested field with JSON1, so unrequested parts of the blobs are never parsed."""
+    exprs = []
+    for field in fields:
+        if field in _PROJECTED_COLUMNS:
+            exprs.append(f"er.{field} AS {field}")
+        elif field == "individual_results":
+            item = "r.value"
+            if criteria:
+                kept = _json_array_filter("r.value, '$.criteria_evaluations'", "criterion_name", "criteria")
+                item = f"json_set(r.value, '$.criteria_evaluations', json({kept}))"
+            where = "WHERE json_extract(r.value, '$.candidate_id') IN :candidate_ids" if candidate_ids else ""
+            exprs.append(f"(SELECT json_group_array(json({item})) FROM json_each(er.individual_results) AS r {where}) "
+                         f"AS individual_results")
+        elif field == "comparison_summary":
+            exprs.append("er.comparison_summary AS comparison_summary")
+        elif field == "rankings" and candidate_ids:
+            kept = _json_array_filter("er.comparison_summary, '$.rankings'", "candidate_id", "candidate_ids")
+            exprs.append(f"CASE WHEN er.comparison_summary IS NULL THEN NULL ELSE {kept} END AS rankings")
+        elif field == "criteria_analysis" and criteria:
+            kept = _json_array_filter("er.comparison_summary, '$.criteria_analysis'", "criterion_name", "criteria")
+            exprs.append(f"CASE WHEN er.comparison_summary IS NULL THEN NULL ELSE {kept} END AS criteria_analysis")
+        elif field in SUMMARY_FIELDS:
+            # json_quote keeps string values valid JSON like objects and arrays
+            exprs.append(f"json_quote(json_extract(er.comparison_summary, '$.{field}')) AS {field}")
+    return f"SELECT {', '.join(exprs)} FROM evaluation_results AS er WHERE er.id = :evaluation_id"
+
+
+async def get_evaluation_result_projection_async(
+    db: AsyncSession,
+    evaluation_id: str,
+    fields: Optional[Sequence[str]] = None,
+    candidate_ids: Optional[Sequence[str]] = None,
+    criteria: Optional[Sequence[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Part of an evaluation result, projected and filtered in SQL.
+
+    Args:
+        db: Request-scoped session
+        evaluation_id: Evaluation result ID
+        fields: Fields to return (``PROJECTABLE_FIELDS``); all of them when omitted
+        candidate_ids: Keep only these candidates in individual_results, rankings and candidates
+        criteria: Keep only these criterion names in criteria_evaluations and criteria_analysis
+
+    Returns:
+        The projected result, or None if it does not exist
+
+    Raises:
+        ValueError: If a field is not projectable
+    """
+    fields = list(dict.fromkeys(fields or PROJECTABLE_FIELDS))
+    unknown = [f for f in fields if f not in PROJECTABLE_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown fields: {unknown}")
+    candidate_ids = list(candidate_ids or [])
+    criteria = list(criteria or [])
+
+    sql_fields = [f for f in fields if f != "candidates"] or ["id"]
+    stmt = text(_projection_sql(sql_fields, candidate_ids, criteria)).columns(
+        **{f: JSON for f in sql_fields if f not in _PROJECTED_COLUMNS or f == "evaluation_metadata"},
+        **{f: DateTime for f in sql_fields if f in ("created_at", "updated_at")},
+    )
+    params: Dict[str, Any] = {"evaluation_id": evaluation_id}
+    if candidate_ids:
+        stmt = stmt.bindparams(bindparam("candidate_ids", expanding=True))
+        params["candidate_ids"] = candidate_ids
+    if criteria:
+        stmt = stmt.bindparams(bindparam("criteria", expanding=True))
+        params["criteria"] = criteria
+    row = (await db.execute(stmt, params)).mappings().first()
+    if row is None:
+        return None
+
+    projected = {f: row[f] for f in fields if f != "candidates"}
+    if "is_batch" in projected:
+        projected["is_batch"] = projected["is_batch"] == "true"
+    if "candidates" in fields:
+        query = select(EvaluationCandidateORM).where(EvaluationCandidateORM.evaluation_id == evaluation_id)
+        if candidate_ids:
+            query = query.where(EvaluationCandidateORM.candidate_id.in_(candidate_ids))
+        rows = (await db.execute(query.order_by(EvaluationCandidateORM.rank.asc().nullslast()))).scalars().all()
+        projected["candidates"] = [_serialize_evaluation_candidate(c).model_dump() for c in rows]
+    return projected
 
 
 def get_evaluation_results_by_rubric(rubric_id: str) -> List[EvaluationResultSummary]:
@@ -0,0 +1,105 @@
+"""In-process cache of encoded rubric responses.
+
+Published rubrics are immutable, so their entries never go stale and are only
+evicted by size. Drafts are cached separately, tagged with the version they were
+built at (rubric ``updated_at`` plus the count and latest ``updated_at`` of its
+criteria), and served only while a cheap version query still matches. The cache
+is per process, so a write handled by another worker is caught by that check;
+writes in this process also drop the entries directly.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.config import settings
+
+CachedRubric = Tuple[bytes, str]  # (JSON body, content hash)
+DraftVersion = Tuple[Any, ...]  # (rubric updated_at, criteria count, latest criterion updated_at)
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+class LRUCache:
+    """Small thread-safe LRU; sync routes write from worker threads, async routes read on the loop."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+published = LRUCache(settings.RUBRIC_CACHE_SIZE)
+drafts = LRUCache(settings.RUBRIC_DRAFT_CACHE_SIZE)
+# Bumped by every invalidation; a draft read before a write committed must not be cached after it.
+# The lock makes each bump and its drop, and each compare-and-put, a single step.
+_draft_generation = 0
+_draft_lock = threading.Lock()
+
+
+def draft_generation() -> int:
+    return _draft_generation
+
+
+def get_draft(rubric_id: str, version: DraftVersion) -> Optional[CachedRubric]:
+    """Cached draft body, if it was built at the rubric's current ``version``."""
+    cached = drafts.get(rubric_id)
+    if cached is None or cached[0] != version:
+        return None
+    return cached[1]
+
+
+def put_draft(rubric_id: str, value: CachedRubric, generation: int, version: DraftVersion) -> None:
+    """Cache a draft read that started at ``generation`` and ``version``, unless this process has invalidated drafts since.
+
+    ``version`` must be read before the draft is built, so the body is never older than its tag.
+    """
+    with _draft_lock:
+        if generation == _draft_generation:
+            drafts.put(rubric_id, (version, value))
+
+
+def invalidate(rubric_id: str) -> None:
+    """Forget a draft after a write to it committed (published entries never change)."""
+    global _draft_generation
+    with _draft_lock:
+        _draft_generation += 1
+        drafts.pop(rubric_id)
+
+
+def invalidate_drafts() -> None:
+    """Forget every draft, e.g. after a criterion they may embed was edited."""
+    global _draft_generation
+    with _draft_lock:
+        _draft_generation += 1
+        drafts.clear()
@@ -1,12 +1,19 @@
 import uuid
 from typing import List, Optional, Tuple, Dict
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session, selectinload
 from datetime import datetime, timezone
 from app.utils.db import SessionLocal
+from app.utils.pagination import Page, approximate_total, paginate, split_page
 from app.models.rubric_orm import RubricORM
 from app.models.rubric_criterion_orm import RubricCriterionORM
 from app.models.criteria_orm import CriteriaORM
+from app.models.rubric_snapshot_orm import RubricSnapshotORM
 from app.models.rubric import RubricCreate, RubricUpdate, Rubric, RubricCriteriaEntry, RubricCriteriaEntryCreate
+from app.services import rubric_cache
+from app.services.rubric_cache import CachedRubric
 from app.config import settings
 import math
 
@@ -106,40 +113,26 @@ def _normalize_and_validate_entries(db: Session, entries: List[RubricCriteriaEnt
     return normalized
 
 
-def _serialize_rubric(r: RubricORM, db: Optional[Session] = None) -> Rubric:
-    # Original lightweight entries
-    base_entries = r.get_criteria_entries()  # List[RubricCriteriaEntry]
-    # Fetch all referenced criteria to enrich with name/description/definition
-    enrich_map = {}
-    if base_entries:
-        close = False
-        if db is None:
-            db = SessionLocal(); close = True
-        # Support both dict-based (from to_entry()) and Pydantic model entries
-        ids = [ (e.get('criteriaId') if isinstance(e, dict) else getattr(e, 'criteriaId', None)) for e in base_entries ]
-        rows = db.query(CriteriaORM).filter(CriteriaORM.id.in_(ids)).all()
-        enrich_map = {row.id: row for row in rows}
-        if close:
-            db.close()
-    # Build enriched entries (still conforming to RubricCriteriaEntry but we add extra attrs dynamically)
+def _criteria_map(db: Session, rows: List[RubricORM]) -> Dict[str, CriteriaORM]:
+    """Load every criterion referenced by ``rows`` in one query."""
+    ids = {rc.criterion_id for r in rows for rc in r.criteria_assoc}
+    if not ids:
+        return {}
+    return {row.id: row for row in db.query(CriteriaORM).filter(CriteriaORM.id.in_(ids)).all()}
+
+
+def _build_rubric(r: RubricORM, enrich_map: Dict[str, CriteriaORM]) -> Rubric:
+    """Rubric model with criteria entries enriched with name/description/definition."""
     enriched = []
-    for e in base_entries:
-        # e may already be a dict from RubricCriterionORM.to_entry()
-        if isinstance(e, dict):
-            criteria_id = e.get('criteriaId')
-            weight_val = e.get('weight')
-        else:  # Pydantic model
-            criteria_id = getattr(e, 'criteriaId', None)
-            weight_val = getattr(e, 'weight', None)
-        orm = enrich_map.get(criteria_id)
-        data = {
-            'criteriaId': criteria_id,
-            'weight': weight_val,
-            'name': getattr(orm, 'name', None) if orm else None,
-            'description': getattr(orm, 'description', None) if orm else None,
-            'definition': getattr(orm, 'definition', None) if orm else None,
-        }
-        enriched.append(RubricCriteriaEntry(**data))
+    for rc in r.criteria_assoc:
+        orm = enrich_map.get(rc.criterion_id)
+        enriched.append(RubricCriteriaEntry(
+            criteriaId=rc.criterion_id,
+            weight=rc.weight,
+            name=orm.name if orm else None,
+            description=orm.description if orm else None,
+            definition=orm.definition if orm else None,
+        ))
     return Rubric(
         id=r.id,
         name=r.name_original,
@@ -153,12 +146,26 @@ def _serialize_rubric(r: RubricORM, db: Optional[Session] = None) -> Rubric:
     )
 
 
+def _serialize_rubrics(rows: List[RubricORM], db: Session) -> List[Rubric]:
+    """Serialize rubrics with a fixed number of queries; load ``criteria_assoc`` eagerly beforehand."""
+    enrich_map = _criteria_map(db, rows)
+    return [_build_rubric(r, enrich_map) for r in rows]
+
+
+def _serialize_rubric(r: RubricORM, db: Optional[Session] = None) -> Rubric:
+    return _serialize_rubrics([r], db or object_session(r))[0]
+
+
+def _rubric_query(db: Session):
+    return db.query(RubricORM).options(selectinload(RubricORM.criteria_assoc))
+
+
 def list_rubrics(db: Optional[Session] = None) -> List[Rubric]:
     close = False
     if db is None:
         db = SessionLocal(); close = True
-    rows = db.query(RubricORM).order_by(RubricORM.created_at.desc()).all()
-    rubrics = [_serialize_rubric(r, db) for r in rows]
+    rows = _rubric_query(db).order_by(RubricORM.created_at.desc()).all()
+    rubrics = _serialize_rubrics(rows, db)
     if close:
         db.close()
     return rubrics
@@ -166,14 +173,129 @@ def list_rubrics(db: Optional[Session] = None) -> List[Rubric]:
 
 def get_rubric_by_id(rubric_id: str) -> Optional[Rubric]:
     db = SessionLocal()
-    r = db.query(RubricORM).filter(RubricORM.id == rubric_id).first()
+    r = _rubric_query(db).filter(RubricORM.id == rubric_id).first()
     if not r:
         db.close(); return None
-    rubric = _serialize_rubric(r)
+    rubric = _serialize_rubric(r, db)
     db.close()
     return rubric
 
 
+async def _serialize_rubrics_async(db: AsyncSession, rows: List[RubricORM]) -> List[Rubric]:
+    """Serialize rubrics whose ``criteria_assoc`` is loaded, enriching all of them with one criteria query.
+
+    Published rubrics with a snapshot are served from it, so they carry the
+    criterion text they were published with, exactly as ``GET /rubrics/{id}`` does.
+    """
+    published_ids = [r.id for r in rows if r.published]
+    snapshots = {}
+    if published_ids:
+        result = await db.execute(
+            select(RubricSnapshotORM.rubric_id, RubricSnapshotORM.body)
+            .where(RubricSnapshotORM.rubric_id.in_(published_ids))
+        )
+        snapshots = {rubric_id: Rubric.model_validate_json(body) for rubric_id, body in result}
+    ids = {rc.criterion_id for r in rows if r.id not in snapshots for rc in r.criteria_assoc}
+    enrich_map = {}
+    if ids:
+        result = await db.execute(select(CriteriaORM).where(CriteriaORM.id.in_(ids)))
+        enrich_map = {row.id: row for row in result.scalars()}
+    return [snapshots.get(r.id) or _build_rubric(r, enrich_map) for r in rows]
+
+
+async def list_rubrics_async(db: AsyncSession, limit: Optional[int], cursor: Optional[str] = None,
+                             include_total: bool = False) -> Page:
+    """One page of rubrics, newest first, for the request-scoped session."""
+    stmt = paginate(select(RubricORM).options(selectinload(RubricORM.criteria_assoc)), RubricORM, cursor, limit)
+    rows, next_cursor = split_page(list((await db.execute(stmt)).scalars()), limit)
+    total = await db.scalar(approximate_total(RubricORM)) if include_total else None
+    return Page(await _serialize_rubrics_async(db, rows), next_cursor, total)
+
+
+async def rubrics_version_async(db: AsyncSession) -> tuple:
+    """Values that change whenever ``list_rubrics`` would (rubric and criterion counts and latest writes)."""
+    result = await db.execute(select(
+        select(func.count()).select_from(RubricORM).scalar_subquery(),
+        select(func.max(RubricORM.updated_at)).scalar_subquery(),
+        select(func.count()).select_from(CriteriaORM).scalar_subquery(),
+        select(func.max(CriteriaORM.updated_at)).scalar_subquery(),
+    ))
+    return tuple(result.one())
+
+
+async def draft_version_async(db: AsyncSession, rubric_id: str) -> Optional[tuple]:
+    """Values that change whenever a draft's body would (its own and its criteria's writes), or None if it does not exist."""
+    result = await db.execute(
+        select(RubricORM.updated_at, func.count(CriteriaORM.id), func.max(CriteriaORM.updated_at))
+        .select_from(RubricORM)
+        .outerjoin(RubricCriterionORM, RubricCriterionORM.rubric_id == RubricORM.id)
+        .outerjoin(CriteriaORM, CriteriaORM.id == RubricCriterionORM.criterion_id)
+        .where(RubricORM.id == rubric_id)
+        .group_by(RubricORM.id)
+    )
+    row = result.first()
+    return tuple(row) if row else None
+
+
+async def get_rubric_by_id_async(db: AsyncSession, rubric_id: str) -> Optional[Rubric]:
+    """Async variant of ``get_rubric_by_id`` for the request-scoped session."""
+    result = await db.execute(
+        select(RubricORM).options(selectinload(RubricORM.criteria_assoc)).where(RubricORM.id == rubric_id)
+    )
+    r = result.scalars().first()
+    if not r:
+        return None
+    return (await _serialize_rubrics_async(db, [r]))[0]
+
+
+def _encode(rubric: Rubric) -> CachedRubric:
+    body = rubric.model_dump_json().encode("utf-8")
+    return body, rubric_cache.content_hash(body)
+
+
+async def get_rubric_json_async(db: AsyncSession, rubric_id: str) -> Optional[CachedRubric]:
+    """Encoded ``GET /rubrics/{id}`` body and its content hash, or None if the rubric does not exist.
+
+    Published rubrics are served from the in-process cache, else from their
+    snapshot row (one key lookup); cached drafts are served while their version
+    still matches the database, so writes through other workers are seen.
+    """
+    cached = rubric_cache.published.get(rubric_id)
+    if cached:
+        return cached
+    snapshot = await db.get(RubricSnapshotORM, rubric_id)
+    if snapshot:
+        entry = (snapshot.body, snapshot.content_hash)
+        rubric_cache.published.put(rubric_id, entry)
+        return entry
+
+    version = await draft_version_async(db, rubric_id)
+    if version is None:
+        return None
+    cached = rubric_cache.get_draft(rubric_id, version)
+    if cached:
+        return cached
+    generation = rubric_cache.draft_generation()
+    rubric = await get_rubric_by_id_async(db, rubric_id)
+    if not rubric:
+        return None
+    entry = _encode(rubric)
+    if not rubric.published:
+        rubric_cache.put_draft(rubric_id, entry, generation, version)
+        return entry
+    # Published without going through publish_rubric (seed data, or before snapshots existed): freeze it now
+    db.add(RubricSnapshotORM(rubric_id=rubric_id, body=entry[0], content_hash=entry[1]))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent request froze it first; serve the stored snapshot so every reader sees the same bytes
+        await db.rollback()
+        snapshot = await db.get(RubricSnapshotORM, rubric_id)
+        entry = (snapshot.body, snapshot.content_hash)
+    rubric_cache.published.put(rubric_id, entry)
+    return entry
+
+
 def create_rubric(data: RubricCreate) -> Rubric:
     db = SessionLocal()
     norm = _normalize_name(data.name)
@@ -205,6 +327,7 @@ def create_rubric(data: RubricCreate) -> Rubric:
             ))
         existing.updated_at = datetime.now(timezone.utc)
         db.commit(); db.refresh(existing)
+        rubric_cache.invalidate(existing.id)
         rubric = _serialize_rubric(existing, db)
         db.close()
         return rubric
@@ -269,7 +392,8 @@ def update_rubric(rubric_id: str, data: RubricUpdate) -> Optional[Rubric]:
     # association rows already updated
     orm.updated_at = datetime.now(timezone.utc)
     db.commit(); db.refresh(orm)
-    rubric = _serialize_rubric(orm)
+    rubric_cache.invalidate(orm.id)
+    rubric = _serialize_rubric(orm, db)
     db.close()
     return rubric
 
@@ -280,12 +404,19 @@ def publish_rubric(rubric_id: str) -> Optional[Rubric]:
     if not orm:
         db.close(); return None
     if orm.published:
-        db.close(); return _serialize_rubric(orm)
+        rubric = _serialize_rubric(orm, db)
+        db.close(); return rubric
     orm.published = True
     orm.published_at = datetime.now(timezone.utc)
     orm.updated_at = datetime.now(timezone.utc)
     db.commit(); db.refresh(orm)
-    rubric = _serialize_rubric(orm)
+    # Freeze the response body as read back from the database (if this write fails, the first read freezes it)
+    rubric = _serialize_rubric(orm, db)
+    entry = _encode(rubric)
+    db.merge(RubricSnapshotORM(rubric_id=orm.id, body=entry[0], content_hash=entry[1]))
+    db.commit()
+    rubric_cache.invalidate(orm.id)
+    rubric_cache.published.put(orm.id, entry)
     db.close()
     return rubric
 
@@ -299,6 +430,7 @@ def delete_rubric(rubric_id: str) -> bool:
         db.close(); raise ValueError("rubric immutable")
     db.delete(orm)
     db.commit()
+    rubric_cache.invalidate(rubric_id)
     db.close()
     return True
 
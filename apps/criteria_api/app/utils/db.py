@@ -1,9 +1,89 @@
-from sqlalchemy import create_engine
+from typing import AsyncIterator
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 import os
 
 DATABASE_URL = os.getenv("SQLITE_DB_URL", "sqlite:///./criteria.db")
+# Async routes reach the same database through aiosqlite
+ASYNC_DATABASE_URL = os.getenv("SQLITE_ASYNC_DB_URL", DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1))
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Connection pool size. Starlette runs sync routes on anyio's worker threads (40 by default);
+# the app sizes that threadpool to match at startup so no request thread ever waits on the pool.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "40"))
+
+# SQLite performance profile, applied on every new connection. "wal" lets readers proceed while
+# an evaluation result is being written (and vice versa); "default" keeps SQLite's own settings.
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "wal").lower()
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    # NORMAL is durable across application crashes in WAL mode; only an OS crash can lose the last commits
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    # Negative cache_size is in KiB
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536")),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+}
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def _is_memory_url(url: str) -> bool:
+    return url.split("://", 1)[-1] in ("", "/:memory:") or "mode=memory" in url
+
+
+def create_db_engine(url: str = DATABASE_URL, profile: str = SQLITE_PROFILE, pool_size: int = DB_POOL_SIZE) -> Engine:
+    """Create the engine for ``url`` with the given SQLite profile ("wal" or "default") and pool size."""
+    is_sqlite = url.startswith("sqlite")
+    kwargs = {}
+    if is_sqlite:
+        kwargs["connect_args"] = {"check_same_thread": False}
+    if not (is_sqlite and _is_memory_url(url)):
+        # In-memory databases use a single shared connection; pool sizing does not apply
+        kwargs.update(pool_size=pool_size, max_overflow=0, pool_timeout=30)
+    new_engine = create_engine(url, **kwargs)
+    if is_sqlite and profile == "wal":
+        event.listen(new_engine, "connect", _apply_sqlite_pragmas)
+    return new_engine
+
+
+def create_async_db_engine(url: str = ASYNC_DATABASE_URL, profile: str = SQLITE_PROFILE,
+                           pool_size: int = DB_POOL_SIZE) -> AsyncEngine:
+    """Async counterpart of ``create_db_engine``; same profile and pool sizing.
+
+    Async routes wait for a pooled connection instead of a worker thread, so their
+    concurrency is bounded by ``pool_size`` rather than by Starlette's threadpool.
+    """
+    is_sqlite = url.startswith("sqlite")
+    kwargs = {}
+    if not (is_sqlite and _is_memory_url(url)):
+        kwargs.update(pool_size=pool_size, max_overflow=0, pool_timeout=30)
+    new_engine = create_async_engine(url, **kwargs)
+    if is_sqlite and profile == "wal":
+        # Pragmas run through the driver's sync adapter, exactly as for the sync engine
+        event.listen(new_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return new_engine
+
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+
+async_engine = create_async_db_engine()
+# Read paths serialize after the session closes; keep loaded attributes usable
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency: one ``AsyncSession`` per request, closed when the response is done."""
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -0,0 +1,23 @@
+"""Strong ETags and conditional GET handling for read endpoints."""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from values that change whenever the response body does (timestamps, counts, hashes)."""
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """A 304 response if ``If-None-Match`` matches ``etag`` (weak comparison, per RFC 9110), else None."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = [tag.strip() for tag in header.split(",")]
+    if "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
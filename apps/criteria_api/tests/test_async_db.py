@@ -0,0 +1,53 @@
+import asyncio
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.main import app
+from app.services import rubric_service
+from app.utils.db import SessionLocal, create_async_db_engine
+from app.models.criteria_orm import CriteriaORM
+
+client = TestClient(app)
+
+
+def _create_criterion(name):
+    db = SessionLocal()
+    cid = str(uuid.uuid4())
+    db.add(CriteriaORM(id=cid, name=name, description=name + " desc", definition="def"))
+    db.commit()
+    db.close()
+    return cid
+
+
+def test_async_engine_applies_wal_profile(tmp_path):
+    async def pragmas():
+        engine = create_async_db_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}", profile="wal", pool_size=2)
+        try:
+            async with engine.connect() as conn:
+                return [(await conn.execute(text(f"PRAGMA {name}"))).scalar() for name in ("journal_mode", "busy_timeout")]
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(pragmas()) == ["wal", 5000]
+
+
+def test_async_rubric_reads_match_sync_service():
+    c1, c2 = _create_criterion("AsyncA"), _create_criterion("AsyncB")
+    resp = client.post("/rubrics/", json={
+        "name": f"Async {uuid.uuid4().hex[:6]}",
+        "description": "desc",
+        "criteria": [{"criteriaId": c1, "weight": 0.25}, {"criteriaId": c2, "weight": 0.75}],
+    })
+    assert resp.status_code == 201, resp.text
+    rid = resp.json()["id"]
+
+    got = client.get(f"/rubrics/{rid}")
+    assert got.status_code == 200
+    assert got.json() == rubric_service.get_rubric_by_id(rid).model_dump(mode="json")
+    assert [c["name"] for c in got.json()["criteria"]] == ["AsyncA", "AsyncB"]
+
+    listed = client.get("/rubrics/").json()
+    assert next(r for r in listed if r["id"] == rid) == got.json()
+    assert client.get(f"/rubrics/{uuid.uuid4()}").status_code == 404
@@ -0,0 +1,62 @@
+import sqlite3
+
+from sqlalchemy import text
+
+from app.utils.db import create_db_engine
+
+
+def _pragma(conn, name):
+    return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_wal_profile_applies_pragmas_on_every_connection(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'wal.db'}", profile="wal", pool_size=2)
+    try:
+        with engine.connect() as first, engine.connect() as second:
+            for conn in (first, second):
+                assert _pragma(conn, "journal_mode") == "wal"
+                assert _pragma(conn, "synchronous") == 1  # NORMAL
+                assert _pragma(conn, "busy_timeout") == 5000
+                assert _pragma(conn, "temp_store") == 2  # MEMORY
+                assert _pragma(conn, "cache_size") < 0
+                assert _pragma(conn, "mmap_size") > 0
+        assert engine.pool.size() == 2
+    finally:
+        engine.dispose()
+
+
+def test_default_profile_keeps_sqlite_settings(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'plain.db'}", profile="default")
+    try:
+        with engine.connect() as conn:
+            assert _pragma(conn, "journal_mode") == "delete"
+            assert _pragma(conn, "synchronous") == 2  # FULL
+    finally:
+        engine.dispose()
+
+
+def test_wal_writer_commits_while_reader_holds_a_snapshot(tmp_path):
+    path = tmp_path / "concurrent.db"
+    engine = create_db_engine(f"sqlite:///{path}", profile="wal")
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE results (id INTEGER PRIMARY KEY, score REAL)"))
+            conn.execute(text("INSERT INTO results (score) VALUES (4.0)"))
+
+        # A reader in the middle of a read transaction (as during a long list query)
+        reader = sqlite3.connect(path, isolation_level=None)
+        reader.execute("BEGIN")
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 1
+
+        # In rollback-journal mode this commit would wait for the reader and fail with "database is locked"
+        with engine.begin() as conn:
+            conn.execute(text("PRAGMA busy_timeout=100"))
+            conn.execute(text("INSERT INTO results (score) VALUES (3.5)"))
+
+        # The reader keeps its snapshot until it ends the transaction, then sees the new row
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 1
+        reader.execute("COMMIT")
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 2
+        reader.close()
+    finally:
+        engine.dispose()
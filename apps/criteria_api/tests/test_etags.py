@@ -0,0 +1,99 @@
+import uuid
+from fastapi.testclient import TestClient
+from app.main import app
+from app.utils.db import SessionLocal
+from app.models.candidate_orm import CandidateORM
+from app.models.rubric_orm import RubricORM
+
+
+client = TestClient(app)
+
+
+def _rubric_and_candidate():
+    db = SessionLocal()
+    try:
+        return db.query(RubricORM).first().id, db.query(CandidateORM).first().id
+    finally:
+        db.close()
+
+
+def _revalidate(url, etag):
+    return client.get(url, headers={"If-None-Match": etag})
+
+
+def test_rubric_etag_is_content_hash_and_304s():
+    rubric_id, _ = _rubric_and_candidate()
+    first = client.get(f"/rubrics/{rubric_id}")
+    etag = first.headers["ETag"]
+    again = _revalidate(f"/rubrics/{rubric_id}", etag)
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["ETag"] == etag
+    assert _revalidate(f"/rubrics/{rubric_id}", f'W/{etag}, "other"').status_code == 304
+    assert _revalidate(f"/rubrics/{rubric_id}", '"stale"').status_code == 200
+
+
+def test_rubric_list_etag_changes_when_a_criterion_is_edited():
+    listed = client.get("/rubrics/")
+    etag = listed.headers["ETag"]
+    assert _revalidate("/rubrics/", etag).status_code == 304
+
+    crit = client.post("/criteria/", json={"name": "ETag crit", "description": "d", "definition": "def"}).json()
+    assert _revalidate("/rubrics/", etag).status_code == 200
+    etag = client.get("/rubrics/").headers["ETag"]
+    client.put(f"/criteria/{crit['id']}", json={"name": "ETag crit renamed"})
+    assert _revalidate("/rubrics/", etag).status_code == 200
+
+
+def test_decision_kit_etag_changes_when_a_candidate_is_renamed():
+    rubric_id, candidate_id = _rubric_and_candidate()
+    kit = client.post("/decision-kits/", json={
+        "name": f"ETag kit {uuid.uuid4().hex[:6]}", "rubricId": rubric_id, "candidateIds": [candidate_id],
+    })
+    assert kit.status_code == 201, kit.text
+    url = f"/decision-kits/{kit.json()['id']}"
+    etag = client.get(url).headers["ETag"]
+    assert _revalidate(url, etag).status_code == 304
+    list_etag = client.get("/decision-kits/").headers["ETag"]
+    assert _revalidate("/decision-kits/", list_etag).status_code == 304
+    assert client.get("/decision-kits/?name=etag").headers["ETag"] != list_etag
+
+    client.put(f"/candidates/{candidate_id}", json={"name": f"Renamed {uuid.uuid4().hex[:6]}"})
+    assert _revalidate(url, etag).status_code == 200
+    assert _revalidate("/decision-kits/", list_etag).status_code == 200
+    assert client.get(f"/decision-kits/{uuid.uuid4()}").status_code == 404
+
+
+def test_evaluation_etags():
+    rubric_id, candidate_id = _rubric_and_candidate()
+    created = client.post("/candidates/evaluations", json={
+        "rubric_id": rubric_id, "overall_score": 4.0, "rubric_name": "ETag", "total_candidates": 1,
+        "is_batch": False, "individual_results": [{"candidate_id": candidate_id, "overall_score": 4.0}],
+        "candidate_ids": [candidate_id],
+    }).json()
+    url = f"/candidates/evaluations/{created['id']}"
+    etag = client.get(url).headers["ETag"]
+    assert _revalidate(url, etag).status_code == 304
+
+    list_etag = client.get("/candidates/evaluations?limit=5").headers["ETag"]
+    assert _revalidate("/candidates/evaluations?limit=5", list_etag).status_code == 304
+    assert _revalidate("/candidates/evaluations?limit=4", list_etag).status_code == 200
+    client.delete(url)
+    assert _revalidate("/candidates/evaluations?limit=5", list_etag).status_code == 200
+    assert _revalidate(url, etag).status_code == 404
+
+
+def test_criteria_and_candidate_list_etags():
+    etag = client.get("/criteria/").headers["ETag"]
+    assert _revalidate("/criteria/", etag).status_code == 304
+    crit = client.post("/criteria/", json={"name": "List ETag crit", "description": "d", "definition": "def"}).json()
+    assert _revalidate("/criteria/", etag).status_code == 200
+    etag = client.get("/criteria/").headers["ETag"]
+    client.put(f"/criteria/{crit['id']}", json={"name": "List ETag crit renamed"})
+    assert _revalidate("/criteria/", etag).status_code == 200
+
+    _, candidate_id = _rubric_and_candidate()
+    etag = client.get("/candidates/").headers["ETag"]
+    assert _revalidate("/candidates/", etag).status_code == 304
+    assert client.get("/candidates/?limit=1").headers["ETag"] != etag
+    client.put(f"/candidates/{candidate_id}", json={"name": f"Renamed {uuid.uuid4().hex[:6]}"})
+    assert _revalidate("/candidates/", etag).status_code == 200
@@ -0,0 +1,97 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app.main import app
+from app.utils.db import SessionLocal, async_engine
+from app.models.candidate_orm import CandidateORM
+from app.models.rubric_orm import RubricORM
+
+
+client = TestClient(app)
+
+
+def _criterion(name, score):
+    return {"criterion_name": name, "criterion_description": name, "weight": 0.5, "score": score,
+            "reasoning": "long reasoning " * 50, "evidence": ["quote"]}
+
+
+def _create_batch():
+    db = SessionLocal()
+    try:
+        rubric_id = db.query(RubricORM).first().id
+        a, b = [c.id for c in db.query(CandidateORM).limit(2).all()]
+    finally:
+        db.close()
+    rankings = [
+        {"candidate_id": a, "rank": 1, "overall_score": 4.5},
+        {"candidate_id": b, "rank": 2, "overall_score": 3.0},
+    ]
+    resp = client.post("/candidates/evaluations", json={
+        "rubric_id": rubric_id, "overall_score": 4.5, "rubric_name": "Projection", "total_candidates": 2,
+        "is_batch": True,
+        "individual_results": [
+            {"candidate_id": a, "overall_score": 4.5, "criteria_evaluations": [_criterion("Price", 5), _criterion("Fit", 4)]},
+            {"candidate_id": b, "overall_score": 3.0, "criteria_evaluations": [_criterion("Price", 3), _criterion("Fit", 3)]},
+        ],
+        "comparison_summary": {
+            "best_candidate": rankings[0], "rankings": rankings,
+            "criteria_analysis": [{"criterion_name": "Price"}, {"criterion_name": "Fit"}],
+            "recommendation_rationale": "Cheaper",
+        },
+        "candidate_ids": [a, b],
+    })
+    assert resp.status_code == 201, resp.text
+    return resp.json()["id"], a, b
+
+
+def test_fields_projection_is_done_in_sql():
+    evaluation_id, a, b = _create_batch()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        resp = client.get(f"/candidates/evaluations/{evaluation_id}",
+                          params={"fields": "overall_score,rankings,recommendation_rationale,is_batch"})
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "overall_score": 4.5,
+        "rankings": [{"candidate_id": a, "rank": 1, "overall_score": 4.5},
+                     {"candidate_id": b, "rank": 2, "overall_score": 3.0}],
+        "recommendation_rationale": "Cheaper",
+        "is_batch": True,
+    }
+    assert not any("individual_results" in s for s in statements)
+
+
+def test_candidate_and_criteria_filters():
+    evaluation_id, a, b = _create_batch()
+    resp = client.get(f"/candidates/evaluations/{evaluation_id}", params={
+        "fields": "individual_results,rankings,criteria_analysis,candidates,created_at",
+        "candidate_ids": b, "criteria": "Fit",
+    })
+    body = resp.json()
+    assert [r["candidate_id"] for r in body["individual_results"]] == [b]
+    assert [c["criterion_name"] for c in body["individual_results"][0]["criteria_evaluations"]] == ["Fit"]
+    assert [r["candidate_id"] for r in body["rankings"]] == [b]
+    assert body["criteria_analysis"] == [{"criterion_name": "Fit"}]
+    assert [c["candidate_id"] for c in body["candidates"]] == [b]
+    assert body["created_at"] == client.get(f"/candidates/evaluations/{evaluation_id}").json()["created_at"]
+
+    # Filters alone return every field, filtered
+    full = client.get(f"/candidates/evaluations/{evaluation_id}", params={"candidate_ids": a}).json()
+    assert full["rubric_name"] == "Projection" and len(full["individual_results"]) == 1
+
+
+def test_projection_errors_and_etags():
+    evaluation_id, _, _ = _create_batch()
+    url = f"/candidates/evaluations/{evaluation_id}"
+    assert client.get(url, params={"fields": "overall_score,secret"}).status_code == 400
+    assert client.get("/candidates/evaluations/missing", params={"fields": "overall_score"}).status_code == 404
+    sparse = client.get(url, params={"fields": "overall_score"})
+    assert sparse.headers["ETag"] != client.get(url).headers["ETag"]
+    assert client.get(url, params={"fields": "overall_score"},
+                      headers={"If-None-Match": sparse.headers["ETag"]}).status_code == 304
@@ -0,0 +1,82 @@
+import uuid
+from fastapi.testclient import TestClient
+from app.main import app
+from app.utils.db import SessionLocal
+from app.models.candidate_orm import CandidateORM
+from app.models.rubric_orm import RubricORM
+from app.models.evaluation_result_orm import EvaluationResultORM
+
+
+client = TestClient(app)
+
+
+def _rubric_and_candidate():
+    db = SessionLocal()
+    try:
+        rubric = db.query(RubricORM).first()
+        candidate = db.query(CandidateORM).first()
+        return rubric.id, candidate.id
+    finally:
+        db.close()
+
+
+def _payload(evaluation_id=None, score=4.0):
+    rubric_id, candidate_id = _rubric_and_candidate()
+    payload = {
+        "rubric_id": rubric_id,
+        "overall_score": score,
+        "rubric_name": "TV Evaluation",
+        "total_candidates": 1,
+        "is_batch": False,
+        "individual_results": [{"candidate_id": candidate_id, "overall_score": score}],
+        "comparison_summary": None,
+        "evaluation_metadata": {"workflow": "id_based"},
+        "candidate_ids": [candidate_id],
+    }
+    if evaluation_id:
+        payload["id"] = evaluation_id
+    return payload
+
+
+def _count(evaluation_id):
+    db = SessionLocal()
+    try:
+        return db.query(EvaluationResultORM).filter(EvaluationResultORM.id == evaluation_id).count()
+    finally:
+        db.close()
+
+
+def test_create_evaluation_with_client_id_is_idempotent():
+    evaluation_id = str(uuid.uuid4())
+    first = client.post("/candidates/evaluations", json=_payload(evaluation_id, score=4.0))
+    assert first.status_code == 201, first.text
+    assert first.json()["id"] == evaluation_id
+
+    # Retry (e.g. after a lost response) must not duplicate or overwrite
+    retry = client.post("/candidates/evaluations", json=_payload(evaluation_id, score=2.0))
+    assert retry.status_code == 201, retry.text
+    assert retry.json()["id"] == evaluation_id
+    assert retry.json()["overall_score"] == 4.0
+    assert _count(evaluation_id) == 1
+
+
+def test_create_evaluation_without_id_assigns_one():
+    r = client.post("/candidates/evaluations", json=_payload())
+    assert r.status_code == 201, r.text
+    assert r.json()["id"]
+
+
+def test_batch_create_evaluations_is_idempotent():
+    ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    r = client.post("/candidates/evaluations/batch", json=[_payload(i) for i in ids])
+    assert r.status_code == 201, r.text
+    assert [item["id"] for item in r.json()] == ids
+
+    # Redelivered batch with one new item
+    new_id = str(uuid.uuid4())
+    r = client.post("/candidates/evaluations/batch", json=[_payload(ids[0]), _payload(new_id)])
+    assert r.status_code == 201, r.text
+    assert [item["id"] for item in r.json()] == [ids[0], new_id]
+    for evaluation_id in ids + [new_id]:
+        assert _count(evaluation_id) == 1
+        assert client.get(f"/candidates/evaluations/{evaluation_id}").status_code == 200
@@ -0,0 +1,116 @@
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app import main
+from app.config import settings
+from app.main import app
+from app.utils.db import engine
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+client = TestClient(app)
+
+
+def _walk(url, limit):
+    """Follow X-Next-Cursor to the end, returning every item and the number of pages."""
+    items, pages, cursor = [], 0, None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        resp = client.get(url, params=params)
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        page = body["results"] if isinstance(body, dict) else body
+        assert len(page) <= limit
+        items.extend(page)
+        pages += 1
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items, pages
+
+
+def _create_criteria(n):
+    return [client.post("/criteria/", json={"name": f"Page {i}", "description": "d", "definition": "def"}).json()["id"]
+            for i in range(n)]
+
+
+def test_cursor_round_trip():
+    ts = datetime(2025, 1, 2, 3, 4, 5, 678901)
+    assert decode_cursor(encode_cursor(ts, "abc")) == (ts, "abc")
+
+
+def test_every_list_endpoint_pages_through_all_rows_without_gaps():
+    _create_criteria(7)
+    for url, key in (("/criteria/", "id"), ("/rubrics/", "id"), ("/decision-kits/", "id"),
+                     ("/candidates/", "id"), ("/candidates/evaluations", "id")):
+        everything, _ = _walk(url, 1000)
+        paged, pages = _walk(url, 3)
+        assert [i[key] for i in paged] == [i[key] for i in everything], url
+        assert pages == max(1, -(-len(everything) // 3)), url
+
+
+def test_rows_with_equal_created_at_are_ordered_by_id():
+    ids = _create_criteria(5)
+    with engine.begin() as conn:
+        for cid in ids:
+            conn.execute(text("UPDATE criteria SET created_at = '2000-01-01 00:00:00.000000' WHERE id = :id"), {"id": cid})
+    paged, _ = _walk("/criteria/", 2)
+    tied = [c["id"] for c in paged if c["id"] in ids]
+    assert tied == sorted(ids)
+
+
+def test_limit_is_capped_and_total_is_opt_in():
+    resp = client.get("/criteria/", params={"limit": 10**6})
+    assert resp.status_code == 200
+    assert "X-Total-Count" not in resp.headers
+    resp = client.get("/criteria/", params={"limit": 1, "include_total": "true"})
+    assert int(resp.headers["X-Total-Count"]) >= 1
+    evaluations = client.get("/candidates/evaluations", params={"include_total": "true"}).json()
+    assert evaluations["total"] is not None
+
+
+def test_invalid_cursor_is_rejected():
+    for url in ("/criteria/", "/rubrics/", "/decision-kits/", "/candidates/", "/candidates/evaluations"):
+        assert client.get(url, params={"cursor": "not-a-cursor"}).status_code == 400, url
+
+
+def test_unpaged_request_returns_the_whole_list(monkeypatch):
+    _create_criteria(3)
+    monkeypatch.setattr(settings, "LIST_DEFAULT_LIMIT", 2)
+    for url in ("/criteria/", "/rubrics/", "/decision-kits/", "/candidates/"):
+        resp = client.get(url)
+        everything, _ = _walk(url, 1000)
+        assert resp.json() == everything, url
+        assert "X-Next-Cursor" not in resp.headers, url
+    # A cursor without a limit continues in LIST_DEFAULT_LIMIT pages
+    first = client.get("/criteria/", params={"limit": 1})
+    resp = client.get("/criteria/", params={"cursor": first.headers["X-Next-Cursor"]})
+    assert len(resp.json()) == 2
+
+
+def test_evaluations_still_accept_offset():
+    for score in (1.0, 2.0, 3.0):
+        client.post("/candidates/evaluations", json={
+            "rubric_id": "offset-rubric", "overall_score": score, "rubric_name": "Offset", "total_candidates": 1,
+            "is_batch": False, "individual_results": [], "candidate_ids": [],
+        })
+    everything = [r["id"] for r in _walk("/candidates/evaluations", 1000)[0]]
+    body = client.get("/candidates/evaluations", params={"offset": 1, "limit": 2}).json()
+    assert [r["id"] for r in body["results"]] == everything[1:3]
+    assert body["total"] is not None
+
+
+def test_created_at_backfill_keeps_insertion_order(tmp_path, monkeypatch):
+    legacy = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with legacy.begin() as conn:
+        conn.execute(text("CREATE TABLE criteria (id TEXT PRIMARY KEY, name TEXT)"))
+        for cid in ("c", "a", "b"):
+            conn.execute(text("INSERT INTO criteria (id, name) VALUES (:id, :id)"), {"id": cid})
+    monkeypatch.setattr(main, "engine", legacy)
+
+    main._migrate_criteria_timestamps()
+
+    with legacy.connect() as conn:
+        rows = conn.execute(text("SELECT id, created_at FROM criteria ORDER BY created_at, id")).fetchall()
+    assert [r[0] for r in rows] == ["c", "a", "b"]
+    assert len({r[1] for r in rows}) == 3
+    legacy.dispose()
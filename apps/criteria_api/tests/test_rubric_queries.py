@@ -0,0 +1,60 @@
+import uuid
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.services import rubric_service
+from app.utils.db import SessionLocal, engine
+from app.models.criteria_orm import CriteriaORM
+from app.models.rubric import RubricCreate
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _create_rubrics(count):
+    db = SessionLocal()
+    cids = [str(uuid.uuid4()) for _ in range(4)]
+    db.add_all(CriteriaORM(id=cid, name=f"Q{i}", description="d", definition="def") for i, cid in enumerate(cids))
+    db.commit()
+    db.close()
+    return [
+        rubric_service.create_rubric(RubricCreate(
+            name=f"Queries {uuid.uuid4().hex[:8]}",
+            description="desc",
+            criteria=[{"criteriaId": cid, "weight": 0.25} for cid in cids],
+        )).id
+        for _ in range(count)
+    ]
+
+
+def test_list_rubrics_query_count_is_independent_of_rubric_count():
+    _create_rubrics(2)
+    with _count_queries() as few:
+        before = rubric_service.list_rubrics()
+    _create_rubrics(5)
+    with _count_queries() as many:
+        after = rubric_service.list_rubrics()
+
+    assert len(after) == len(before) + 5
+    assert len(few) == len(many) <= 3
+    assert all(c.name for r in after for c in r.criteria if r.name.startswith("Queries"))
+
+
+def test_get_rubric_by_id_uses_one_session_and_fixed_queries():
+    rid = _create_rubrics(1)[0]
+    with _count_queries() as statements:
+        rubric = rubric_service.get_rubric_by_id(rid)
+    assert [c.name for c in rubric.criteria] == ["Q0", "Q1", "Q2", "Q3"]
+    assert len(statements) <= 3
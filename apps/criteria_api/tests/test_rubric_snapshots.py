@@ -0,0 +1,115 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.main import app
+from app.services import rubric_cache
+from app.utils.db import SessionLocal, async_engine
+from app.models.criteria_orm import CriteriaORM
+from app.models.rubric_snapshot_orm import RubricSnapshotORM
+
+client = TestClient(app)
+
+
+def _create_rubric():
+    crit = client.post("/criteria/", json={"name": "Snapshot crit", "description": "d", "definition": "def"}).json()
+    resp = client.post("/rubrics/", json={
+        "name": f"Snapshot {uuid.uuid4().hex[:6]}",
+        "description": "draft",
+        "criteria": [{"criteriaId": crit["id"], "weight": 1.0}],
+    })
+    assert resp.status_code == 201, resp.text
+    return resp.json()["id"], crit["id"]
+
+
+def test_publish_freezes_snapshot_and_reads_serve_it():
+    rid, cid = _create_rubric()
+    published = client.post(f"/rubrics/{rid}/publish").json()
+
+    db = SessionLocal()
+    snapshot = db.get(RubricSnapshotORM, rid)
+    db.close()
+    assert snapshot is not None
+    assert snapshot.content_hash == rubric_cache.content_hash(snapshot.body)
+
+    got = client.get(f"/rubrics/{rid}")
+    assert got.status_code == 200
+    assert got.content == snapshot.body
+    assert got.json() == published
+
+    # Published rubrics keep the criterion text they were published with
+    client.put(f"/criteria/{cid}", json={"name": "Renamed"})
+    assert client.get(f"/rubrics/{rid}").json()["criteria"][0]["name"] == "Snapshot crit"
+
+
+def test_list_and_detail_agree_on_published_rubric_after_criterion_edit():
+    rid, cid = _create_rubric()
+    client.post(f"/rubrics/{rid}/publish")
+    client.put(f"/criteria/{cid}", json={"name": "Renamed"})
+
+    detail = client.get(f"/rubrics/{rid}").json()
+    listed = next(r for r in client.get("/rubrics/").json() if r["id"] == rid)
+    assert listed == detail
+    assert listed["criteria"][0]["name"] == "Snapshot crit"
+
+
+def test_published_read_after_cache_eviction_is_one_key_lookup():
+    rid, _ = _create_rubric()
+    client.post(f"/rubrics/{rid}/publish")
+    rubric_cache.published.clear()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        assert client.get(f"/rubrics/{rid}").status_code == 200
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    assert len(statements) == 1 and "rubric_snapshots" in statements[0]
+
+
+def test_draft_cache_is_invalidated_on_write():
+    rid, cid = _create_rubric()
+    assert client.get(f"/rubrics/{rid}").json()["description"] == "draft"
+    assert rubric_cache.drafts.get(rid) is not None
+
+    client.put(f"/rubrics/{rid}", json={"description": "edited"})
+    assert client.get(f"/rubrics/{rid}").json()["description"] == "edited"
+
+    client.put(f"/criteria/{cid}", json={"name": "Draft renamed"})
+    assert client.get(f"/rubrics/{rid}").json()["criteria"][0]["name"] == "Draft renamed"
+
+    client.delete(f"/rubrics/{rid}")
+    assert client.get(f"/rubrics/{rid}").status_code == 404
+
+
+def test_draft_read_started_before_invalidation_is_not_cached():
+    version = ("v1",)
+    generation = rubric_cache.draft_generation()
+    rubric_cache.invalidate("stale-draft")
+    rubric_cache.put_draft("stale-draft", (b"{}", "hash"), generation, version)
+    assert rubric_cache.get_draft("stale-draft", version) is None
+
+    rubric_cache.put_draft("stale-draft", (b"{}", "hash"), rubric_cache.draft_generation(), version)
+    assert rubric_cache.get_draft("stale-draft", version) is not None
+    assert rubric_cache.get_draft("stale-draft", ("v2",)) is None
+    rubric_cache.invalidate_drafts()
+    assert rubric_cache.get_draft("stale-draft", version) is None
+
+
+def test_cached_draft_is_not_served_after_a_write_from_another_worker():
+    rid, cid = _create_rubric()
+    assert client.get(f"/rubrics/{rid}").json()["criteria"][0]["name"] == "Snapshot crit"
+    assert rubric_cache.drafts.get(rid) is not None
+
+    # Another worker's write commits without touching this process's cache
+    db = SessionLocal()
+    db.get(CriteriaORM, cid).name = "Edited elsewhere"
+    db.commit()
+    db.close()
+
+    assert client.get(f"/rubrics/{rid}").json()["criteria"][0]["name"] == "Edited elsewhere"